@@ -0,0 +1,252 @@
+"""
+Benchmark cases for the talent-analytics data path.
+
+Each case has a ``setup(scale, data_path)`` that prepares untimed state and a
+``run(state)`` that performs one timed iteration and returns the number of
+events it processed. ``max_scale`` caps cases whose API materializes every
+event as a Python object and cannot run at the largest scales.
+"""
+import dataclasses
+import os
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+import pandas as pd
+
+from kaizen_talent_analytics.connectors.ats_adapter import (
+    filter_events, iter_ats_event_batches, iter_ats_frames, load_ats_events,
+)
+from kaizen_talent_analytics.connectors.ats_ingestor import Watermark
+from kaizen_talent_analytics.data.event_index import EventIndex
+from kaizen_talent_analytics.services.feature_batches import FeatureBatches, build_feature_partitions
+from kaizen_talent_analytics.services.feature_store import FeatureStore
+from kaizen_talent_analytics.services.micro_batcher import MicroBatcher
+from kaizen_talent_analytics.services.funnel_cube import FunnelCube
+from kaizen_talent_analytics.services.model_orchestrator import ModelOrchestrator
+
+FRAME_CHUNK = 1_000_000
+
+
+@dataclass
+class BenchmarkCase:
+    name: str
+    setup: Callable[[int, str], Any]
+    run: Callable[[Any], int]
+    repeats: int = 5
+    max_scale: Optional[int] = None
+
+
+def _read_frame(data_path: str) -> pd.DataFrame:
+    return pd.concat(iter_ats_frames(data_path, chunk_size=FRAME_CHUNK), ignore_index=True)
+
+
+def _read_index(data_path: str) -> EventIndex:
+    return EventIndex.from_frame(_read_frame(data_path))
+
+
+def _window(index: EventIndex) -> Dict[str, int]:
+    lo, hi = int(index.timestamps[0]), int(index.timestamps[-1])
+    return {"start_time": lo + (hi - lo) // 3, "end_time": lo + (hi - lo) // 3 + (hi - lo) // 30}
+
+
+def model_input(data_path: str) -> Any:
+    """
+    Build the input handed to ``ModelOrchestrator.fit_all``/``predict_all``.
+
+    Features are materialized once per dataset and cached next to it, keyed
+    by a watermark covering the whole file.
+    """
+    store = FeatureStore(cache_dir=f"{data_path}.features")
+    watermarks = [Watermark(source=os.path.basename(data_path), offset=os.path.getsize(data_path))]
+    if not store.load(watermarks):
+        store.update(_read_index(data_path))
+        store.save(watermarks)
+    return store.snapshot()
+
+
+# load_ats_events: list-of-dicts compatibility wrapper vs. bounded-memory batch streaming.
+
+def _run_load(path: str) -> int:
+    return len(load_ats_events(path))
+
+
+def _run_stream(path: str) -> int:
+    return sum(len(batch) for batch in iter_ats_event_batches(path))
+
+
+# filter_events: list input (parses once per call) vs. a prebuilt EventIndex.
+
+def _setup_filter_list(scale: int, data_path: str) -> Any:
+    events = load_ats_events(data_path)
+    index = EventIndex.from_events(events)
+    window = {k: pd.Timestamp(v, unit="us", tz="UTC").isoformat() for k, v in _window(index).items()}
+    return events, window
+
+
+def _run_filter_list(state: Any) -> int:
+    events, window = state
+    filter_events(events, stage="Interview", **window)
+    return len(events)
+
+
+def _setup_filter_index(scale: int, data_path: str) -> Any:
+    index = _read_index(data_path)
+    return index, _window(index)
+
+
+def _run_filter_index(state: Any) -> int:
+    index, window = state
+    index.select(stage="Interview", **window)
+    return len(index)
+
+
+# Funnel preparation: folding events into the cube and slicing it for the chart.
+
+def _run_funnel_build(index: EventIndex) -> int:
+    cube = FunnelCube(vocabularies=index.vocabularies)
+    cube.update(index)
+    cube.funnel_frame()
+    return len(index)
+
+
+def _setup_funnel_query(scale: int, data_path: str) -> Any:
+    index = _read_index(data_path)
+    cube = FunnelCube(vocabularies=index.vocabularies)
+    cube.update(index)
+    return cube, len(index), _window(index)
+
+
+def _run_funnel_query(state: Any) -> int:
+    cube, events, window = state
+    cube.funnel_frame(**window)
+    return events
+
+
+# ModelOrchestrator.
+
+def _setup_models(scale: int, data_path: str, parallel: bool = False) -> Any:
+    data = model_input(data_path)
+    orchestrator = ModelOrchestrator(parallel=parallel)
+    orchestrator.fit_all(data)
+    return orchestrator, data, scale
+
+
+def _run_fit(state: Any) -> int:
+    orchestrator, data, scale = state
+    orchestrator.fit_all(data)
+    return scale
+
+
+def _setup_fit_stream(scale: int, data_path: str) -> Any:
+    # Partitions are built once per dataset; fitting then streams them without loading all features.
+    directory = f"{data_path}.partitions"
+    if not os.path.exists(os.path.join(directory, "manifest.json")):
+        build_feature_partitions([data_path], directory, partitions=8)
+    return ModelOrchestrator(), FeatureBatches(directory), scale
+
+
+def _run_fit_stream(state: Any) -> int:
+    orchestrator, batches, scale = state
+    orchestrator.fit_stream(batches)
+    return scale
+
+
+def _run_predict(state: Any) -> int:
+    orchestrator, data, scale = state
+    orchestrator.invalidate_cache()
+    orchestrator.predict_all(data)
+    return scale
+
+
+def _run_predict_cached(state: Any) -> int:
+    # Warm cache: measures content hashing plus the lookup.
+    orchestrator, data, scale = state
+    orchestrator.predict_all(data)
+    return scale
+
+
+def _setup_predict_delta(scale: int, data_path: str) -> Any:
+    # Two feature sets that differ in 2k candidates; alternating them leaves 2k row-memo misses per call.
+    orchestrator, data, scale = _setup_models(scale, data_path)
+    changed = data.features.copy()
+    changed[:2_000, 0] += 1
+    variants = [data, dataclasses.replace(data, features=changed)]
+    orchestrator.predict_all(data)
+    return orchestrator, variants, scale
+
+
+def _run_predict_delta(state: Any) -> int:
+    orchestrator, variants, scale = state
+    variants.reverse()
+    # Skip the whole-batch cache so only the row memo can serve the unchanged candidates.
+    orchestrator.predict_all(variants[0], cache=False)
+    return scale
+
+
+# explain_all: attributions for an HR review page of 5,000 candidates, cold cache.
+
+EXPLAIN_ROWS = 5_000
+
+
+def _setup_explain(scale: int, data_path: str) -> Any:
+    orchestrator, data, _ = _setup_models(scale, data_path)
+    return orchestrator, data.features[:EXPLAIN_ROWS]
+
+
+def _run_explain(state: Any) -> int:
+    orchestrator, rows = state
+    orchestrator.invalidate_cache()
+    orchestrator.explain_all(rows)
+    return len(rows)
+
+
+# MicroBatcher: 2,000 single-candidate requests submitted at once.
+
+MICRO_BATCH_REQUESTS = 2_000
+
+
+def _setup_micro_batch(scale: int, data_path: str) -> Any:
+    orchestrator, data, _ = _setup_models(scale, data_path)
+    batcher = MicroBatcher(orchestrator, max_batch_size=256, max_wait_ms=2).start()
+    return batcher, data.features[:MICRO_BATCH_REQUESTS]
+
+
+def _run_micro_batch(state: Any) -> int:
+    batcher, rows = state
+    futures = [batcher.submit(row) for row in rows]
+    for future in futures:
+        future.result()
+    return len(rows)
+
+
+# Dash callback.
+
+def _setup_dashboard(scale: int, data_path: str) -> Any:
+    import talent_insights
+    talent_insights.funnel_cube.update(_read_index(data_path))
+    return talent_insights, scale
+
+
+def _run_dashboard(state: Any) -> int:
+    module, scale = state
+    module.update_dashboard([], [])
+    return scale
+
+
+CASES: Dict[str, BenchmarkCase] = {case.name: case for case in [
+    BenchmarkCase("load_ats_events", lambda scale, path: path, _run_load, repeats=1, max_scale=1_000_000),
+    BenchmarkCase("iter_ats_event_batches", lambda scale, path: path, _run_stream, repeats=1),
+    BenchmarkCase("filter_events", _setup_filter_list, _run_filter_list, repeats=3, max_scale=1_000_000),
+    BenchmarkCase("filter_events_index", _setup_filter_index, _run_filter_index, repeats=200),
+    BenchmarkCase("funnel_build", lambda scale, path: _read_index(path), _run_funnel_build, repeats=3),
+    BenchmarkCase("funnel_query", _setup_funnel_query, _run_funnel_query, repeats=200),
+    BenchmarkCase("fit_all", _setup_models, _run_fit, repeats=3),
+    BenchmarkCase("fit_all_parallel", lambda scale, path: _setup_models(scale, path, parallel=True), _run_fit, repeats=3),
+    BenchmarkCase("fit_stream", _setup_fit_stream, _run_fit_stream, repeats=3),
+    BenchmarkCase("predict_all", _setup_models, _run_predict, repeats=5),
+    BenchmarkCase("predict_all_cached", _setup_models, _run_predict_cached, repeats=20),
+    BenchmarkCase("predict_all_delta", _setup_predict_delta, _run_predict_delta, repeats=10),
+    BenchmarkCase("explain_all", _setup_explain, _run_explain, repeats=3),
+    BenchmarkCase("micro_batch_predict", _setup_micro_batch, _run_micro_batch, repeats=5),
+    BenchmarkCase("update_dashboard", _setup_dashboard, _run_dashboard, repeats=20),
+]}
@@ -0,0 +1,207 @@
+"""
+Benchmark runner and regression check for the talent-analytics data path.
+
+Usage (from the repository root):
+
+    python -m benchmarks.run_benchmarks --scales 1e4 1e6 1e7 --save benchmarks/baseline.json
+    python -m benchmarks.run_benchmarks --scales 1e4 1e6 --compare benchmarks/baseline.json --budget 0.2
+
+Every (case, scale) pair runs in a fresh subprocess so that peak RSS is
+attributable to that case alone.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DATA_DIR = os.path.join(REPO_ROOT, "benchmarks", ".data")
+DEFAULT_SCALES = ("1e4", "1e6", "1e7")
+EVENTS_PER_CANDIDATE = 2.95  # mean journey length of the synthetic generator
+
+logger = logging.getLogger(__name__)
+
+
+def dataset_path(data_dir: str, scale: int) -> str:
+    """
+    Generate (once) and return the synthetic CSV export used for a scale.
+    """
+    from kaizen_talent_analytics.data.generation.generate_dummy_data import generate_ats_dataset
+
+    path = os.path.join(data_dir, f"ats_events_{scale}.csv")
+    if not os.path.exists(path):
+        os.makedirs(data_dir, exist_ok=True)
+        tmp_path = f"{path}.tmp.csv"
+        generate_ats_dataset(tmp_path, max(1, int(scale / EVENTS_PER_CANDIDATE)), seed=scale,
+                             processes=os.cpu_count() or 1)
+        os.replace(tmp_path, path)
+    return path
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_case(name: str, scale: int, data_path: str) -> Dict[str, Any]:
+    """
+    Run one case in the current process and summarize its timings.
+    """
+    from benchmarks.cases import CASES
+
+    case = CASES[name]
+    started = time.perf_counter()
+    state = case.setup(scale, data_path)
+    setup_seconds = time.perf_counter() - started
+
+    latencies: List[float] = []
+    events = 0
+    for _ in range(case.repeats):
+        started = time.perf_counter()
+        events = case.run(state)
+        latencies.append(time.perf_counter() - started)
+
+    p50 = float(np.percentile(latencies, 50))
+    return {
+        "case": name,
+        "scale": scale,
+        "events": events,
+        "repeats": case.repeats,
+        "setup_s": round(setup_seconds, 4),
+        "p50_ms": p50 * 1e3,
+        "p99_ms": float(np.percentile(latencies, 99)) * 1e3,
+        "throughput_eps": events / p50 if p50 > 0 else float("inf"),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+    }
+
+
+def run_isolated(name: str, scale: int, data_path: str, timeout: Optional[float]) -> Dict[str, Any]:
+    """
+    Run one case in a subprocess and return its result (or an error record).
+    """
+    command = [sys.executable, "-m", "benchmarks.run_benchmarks", "--worker", name, str(scale), data_path]
+    try:
+        completed = subprocess.run(command, cwd=REPO_ROOT, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {"case": name, "scale": scale, "error": f"timed out after {timeout}s"}
+    if completed.returncode != 0:
+        return {"case": name, "scale": scale, "error": completed.stderr.strip().splitlines()[-1:]}
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+            budget: float, rss_budget: float, min_delta_ms: float = 0.05) -> List[str]:
+    """
+    Compare results against a baseline and describe every budget violation.
+
+    Args:
+        results (Dict[str, Dict[str, Any]]): Current results keyed by "case@scale".
+        baseline (Dict[str, Dict[str, Any]]): Baseline results keyed the same way.
+        budget (float): Allowed fractional increase in p50/p99 latency.
+        rss_budget (float): Allowed fractional increase in peak RSS.
+        min_delta_ms (float): Latency increases smaller than this are treated as timer noise.
+
+    Returns:
+        List[str]: Human-readable regressions; empty when within budget.
+    """
+    regressions = []
+    for key, current in sorted(results.items()):
+        reference = baseline.get(key)
+        if reference is None or "error" in reference:
+            continue
+        if "error" in current:
+            regressions.append(f"{key}: failed ({current['error']})")
+            continue
+        for metric, allowed in (("p50_ms", budget), ("p99_ms", budget), ("peak_rss_mb", rss_budget)):
+            if metric.endswith("_ms") and current[metric] - reference[metric] < min_delta_ms:
+                continue
+            if reference[metric] > 0 and current[metric] > reference[metric] * (1 + allowed):
+                regressions.append(
+                    f"{key}: {metric} {current[metric]:.2f} exceeds baseline {reference[metric]:.2f} "
+                    f"by more than {allowed:.0%}"
+                )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", nargs="+", default=list(DEFAULT_SCALES), help="Event counts, e.g. 1e4 1e6 1e7")
+    parser.add_argument("--cases", nargs="+", help="Subset of cases to run (default: all)")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="Where synthetic datasets are cached")
+    parser.add_argument("--save", help="Write results to this JSON baseline file")
+    parser.add_argument("--compare", help="Baseline JSON file to check results against")
+    parser.add_argument("--budget", type=float, default=0.25, help="Allowed latency regression (fraction)")
+    parser.add_argument("--rss-budget", type=float, default=0.25, help="Allowed peak RSS regression (fraction)")
+    parser.add_argument("--min-delta-ms", type=float, default=0.05, help="Ignore latency changes below this")
+    parser.add_argument("--timeout", type=float, default=None, help="Per-case timeout in seconds")
+    parser.add_argument("--worker", nargs=3, metavar=("CASE", "SCALE", "DATA"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        logging.disable(logging.INFO)
+        name, scale, data_path = args.worker
+        print(json.dumps(run_case(name, int(scale), data_path)))
+        return 0
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    from benchmarks.cases import CASES
+
+    names = args.cases or list(CASES)
+    unknown = set(names) - set(CASES)
+    if unknown:
+        parser.error(f"Unknown cases: {', '.join(sorted(unknown))}")
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for scale in (int(float(s)) for s in args.scales):
+        data_path = dataset_path(args.data_dir, scale)
+        for name in names:
+            max_scale = CASES[name].max_scale
+            if max_scale is not None and scale > max_scale:
+                continue
+            result = run_isolated(name, scale, data_path, args.timeout)
+            results[f"{name}@{scale}"] = result
+            if "error" in result:
+                logger.info(f"{name:<24} {scale:>10,}  ERROR {result['error']}")
+            else:
+                logger.info(
+                    f"{name:<24} {scale:>10,}  p50 {result['p50_ms']:>10.2f} ms  p99 {result['p99_ms']:>10.2f} ms  "
+                    f"{result['throughput_eps']:>14,.0f} ev/s  rss {result['peak_rss_mb']:>8.1f} MB"
+                )
+
+    if args.save:
+        payload = {
+            "meta": {
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+            },
+            "results": results,
+        }
+        with open(args.save, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2, sort_keys=True)
+        logger.info(f"Saved {len(results)} results to {args.save}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as handle:
+            baseline = json.load(handle)["results"]
+        regressions = compare(results, baseline, args.budget, args.rss_budget, args.min_delta_ms)
+        for line in regressions:
+            logger.error(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        logger.info("All benchmarks within budget.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
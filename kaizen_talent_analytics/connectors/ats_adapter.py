@@ -1,50 +1,239 @@
+import csv
+import gzip
+import io
+import json
 import logging
-from typing import List, Dict, Optional
-from datetime import datetime
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from pydantic import ValidationError
+
+from kaizen_talent_analytics.data.categorical import new_vocabularies
+from kaizen_talent_analytics.data.event_index import CATEGORICAL_COLUMNS, EventIndex
+from kaizen_talent_analytics.data.schema import ATSEvent
 
 logger = logging.getLogger(__name__)
 
-def load_ats_events(source: str) -> List[Dict]:
+DEFAULT_CHUNK_SIZE = 50_000
+SUPPORTED_FORMATS = ("csv", "ndjson", "parquet")
+
+
+def detect_format(source: str) -> str:
+    """
+    Infer the record format of an ATS export from its file name.
+
+    Args:
+        source (str): Path to the export, optionally ending in ".gz", or a
+            directory of Parquet files (e.g. an ``ATSEventStore`` root).
+
+    Returns:
+        str: One of ``SUPPORTED_FORMATS``.
+    """
+    if os.path.isdir(source):
+        return "parquet"
+    name = source.lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+    if name.endswith((".ndjson", ".jsonl", ".json")):
+        return "ndjson"
+    if name.endswith((".csv", ".txt")):
+        return "csv"
+    if name.endswith((".parquet", ".pq")):
+        return "parquet"
+    raise ValueError(f"Cannot infer ATS export format from '{source}'")
+
+
+def _open_text(source: str) -> io.TextIOBase:
+    """
+    Open an ATS export as text, transparently decompressing gzip input.
+    """
+    if source.lower().endswith(".gz"):
+        return gzip.open(source, mode="rt", newline="", encoding="utf-8")
+    return open(source, mode="r", newline="", encoding="utf-8")
+
+
+def iter_ats_records(source: str, fmt: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield raw ATS records from a CSV or NDJSON export, one at a time.
+
+    Args:
+        source (str): Path to the export (".csv", ".ndjson", optionally ".gz", or Parquet).
+        fmt (Optional[str]): Force a format instead of inferring it from the name.
+
+    Returns:
+        Iterator[Dict[str, Any]]: Raw, unvalidated record dictionaries.
+    """
+    fmt = fmt or detect_format(source)
+    if fmt not in SUPPORTED_FORMATS:
+        raise ValueError(f"Unsupported ATS export format: {fmt}")
+    if fmt == "parquet":
+        for frame in iter_ats_frames(source, fmt=fmt):
+            yield from frame.to_dict("records")
+        return
+
+    with _open_text(source) as handle:
+        if fmt == "csv":
+            yield from csv.DictReader(handle)
+        else:
+            for line_no, line in enumerate(handle, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Skipping malformed NDJSON line {line_no} in {source}: {e}")
+
+
+def iter_ats_event_batches(source: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                           fmt: Optional[str] = None) -> Iterator[List[ATSEvent]]:
+    """
+    Stream typed ATS events from an export in batches of at most ``chunk_size``.
+
+    Only one batch is held in memory at a time, so peak memory is bounded by
+    the chunk size rather than by the size of the export. Rows that fail
+    validation are logged and skipped.
+
+    Args:
+        source (str): Path to the export (".csv", ".ndjson", optionally ".gz").
+        chunk_size (int): Maximum number of events per yielded batch.
+        fmt (Optional[str]): Force a format instead of inferring it from the name.
+
+    Returns:
+        Iterator[List[ATSEvent]]: Batches of validated events.
+    """
+    return batch_ats_events(iter_ats_records(source, fmt=fmt), chunk_size=chunk_size, source=source)
+
+
+def iter_ats_frames(source: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    fmt: Optional[str] = None) -> Iterator[pd.DataFrame]:
     """
-    Stub function to load ATS events from a given source.
+    Stream an ATS export as raw, all-string DataFrame chunks for column-wise processing.
 
     Args:
-        source (str): The source path or identifier for ATS event data.
+        source (str): Path to the export (".csv", ".ndjson", optionally ".gz"), or a
+            Parquet file or directory of Parquet files (requires pyarrow).
+        chunk_size (int): Maximum number of rows per chunk.
+        fmt (Optional[str]): Force a format instead of inferring it from the name.
 
     Returns:
-        List[Dict]: A list of ATS event dictionaries.
+        Iterator[pd.DataFrame]: Unvalidated chunks with the export's columns.
     """
+    fmt = fmt or detect_format(source)
+    if fmt == "parquet":
+        yield from _iter_parquet_frames(source, chunk_size)
+        return
+    if fmt == "csv":
+        reader = pd.read_csv(source, chunksize=chunk_size, dtype=str, keep_default_na=False,
+                             compression="infer")
+    elif fmt == "ndjson":
+        reader = pd.read_json(source, lines=True, chunksize=chunk_size, dtype=False,
+                              convert_dates=False, compression="infer")
+    else:
+        raise ValueError(f"Unsupported ATS export format: {fmt}")
+    with reader:
+        yield from reader
+
+
+def _iter_parquet_frames(source: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+    try:
+        import pyarrow.dataset as ds
+    except ImportError as e:  # pragma: no cover - exercised only without pyarrow
+        raise ImportError("Reading Parquet ATS exports requires pyarrow; install it with 'pip install pyarrow'") from e
+    dataset = ds.dataset(source, format="parquet", partitioning="hive")
+    for batch in dataset.to_batches(batch_size=chunk_size):
+        frame = batch.to_pandas()
+        # Same all-string view as the CSV reader, with missing values as empty strings.
+        yield frame.astype(object).where(frame.notna(), "").astype(str)
+
+
+def batch_ats_events(records: Iterable[Dict[str, Any]], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     source: str = "<records>") -> Iterator[List[ATSEvent]]:
+    """
+    Validate raw ATS records into ``ATSEvent`` batches of at most ``chunk_size``.
+
+    Args:
+        records (Iterable[Dict[str, Any]]): Raw record dictionaries.
+        chunk_size (int): Maximum number of events per yielded batch.
+        source (str): Name of the originating source, used in log messages.
+
+    Returns:
+        Iterator[List[ATSEvent]]: Batches of validated events.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    batch: List[ATSEvent] = []
+    skipped = 0
+    for record in records:
+        try:
+            batch.append(ATSEvent(**record))
+        except (ValidationError, TypeError) as e:
+            skipped += 1
+            logger.debug(f"Skipping invalid ATS record {record!r}: {e}")
+            continue
+        if len(batch) >= chunk_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+    if skipped:
+        logger.warning(f"Skipped {skipped} invalid ATS records from {source}")
+
+
+def load_ats_events(source: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Dict]:
+    """
+    Load all ATS events from a given source into memory.
+
+    Compatibility wrapper around :func:`iter_ats_event_batches` for callers that
+    expect a flat list of dictionaries. Prefer the batch iterator for large exports.
+
+    Args:
+        source (str): The source path for ATS event data.
+        chunk_size (int): Batch size used while streaming the source.
+
+    Returns:
+        List[Dict]: A list of ATS event dictionaries with ISO format timestamps.
+    """
+    events: List[Dict] = []
     try:
-        # TODO: Implement actual loading logic (e.g., CSV, API)
         logger.info(f"Loading ATS events from source: {source}")
-        return []
+        for batch in iter_ats_event_batches(source, chunk_size=chunk_size):
+            events.extend(event.model_dump(mode="json") for event in batch)
+        return events
     except Exception as e:
         logger.error(f"Error loading ATS events from {source}: {e}")
         return []
 
-def filter_events(events: List[Dict], stage: Optional[str] = None, start_time: Optional[str] = None, end_time: Optional[str] = None) -> List[Dict]:
+def filter_events(events: Union[List[Dict], EventIndex], stage: Optional[str] = None, start_time: Optional[str] = None, end_time: Optional[str] = None) -> List[Dict]:
     """
     Filter ATS events by stage and/or time range.
 
+    Timestamps are parsed once into an :class:`EventIndex`; the time range is
+    resolved by binary search and the stage predicate by a vectorized mask.
+    Callers filtering the same events repeatedly should build the index once
+    and pass it in directly.
+
     Args:
-        events (List[Dict]): List of ATS event dictionaries.
+        events (Union[List[Dict], EventIndex]): ATS event dictionaries or a prebuilt index.
         stage (Optional[str]): Stage to filter by (e.g., "Interview").
         start_time (Optional[str]): ISO format start time to filter from.
         end_time (Optional[str]): ISO format end time to filter to.
 
     Returns:
-        List[Dict]: Filtered list of ATS events.
+        List[Dict]: Filtered ATS events, in input order for lists and time order for indexes.
     """
-    filtered = events
+    filtered = events if isinstance(events, list) else []
     try:
-        if stage:
-            filtered = [e for e in filtered if e.get("stage") == stage]
-        if start_time:
-            start_dt = datetime.fromisoformat(start_time)
-            filtered = [e for e in filtered if datetime.fromisoformat(e.get("timestamp")) >= start_dt]
-        if end_time:
-            end_dt = datetime.fromisoformat(end_time)
-            filtered = [e for e in filtered if datetime.fromisoformat(e.get("timestamp")) <= end_dt]
+        if isinstance(events, EventIndex):
+            filtered = events.to_records(events.select(stage=stage or None, start_time=start_time, end_time=end_time))
+        elif events and (stage or start_time or end_time):
+            index = EventIndex.from_events(events, vocabularies=new_vocabularies(CATEGORICAL_COLUMNS))
+            rows = index.select(stage=stage or None, start_time=start_time, end_time=end_time)
+            filtered = [events[i] for i in np.sort(index.positions[rows])]
         logger.info(f"Filtered events count: {len(filtered)}")
     except Exception as e:
         logger.error(f"Error filtering ATS events: {e}")
@@ -0,0 +1,289 @@
+import csv
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from kaizen_talent_analytics.connectors.ats_adapter import (
+    DEFAULT_CHUNK_SIZE, batch_ats_events, detect_format,
+)
+from kaizen_talent_analytics.data.schema import ATSEvent
+from kaizen_talent_analytics.data.timestamps import from_epoch_us, to_epoch_us
+
+logger = logging.getLogger(__name__)
+
+DeltaCallback = Callable[[str, List[ATSEvent]], None]
+
+
+@dataclass
+class Watermark:
+    """
+    Dataclass recording how far an append-only ATS export has been ingested.
+    """
+    source: str
+    offset: int = 0  # byte offset just past the last fully ingested line
+    rows: int = 0  # total rows consumed from the source, valid or not
+    last_timestamp: Optional[str] = None  # ISO timestamp of the latest ingested event
+
+
+class CheckpointStore:
+    """
+    JSON-file backed persistence for per-source watermarks.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._watermarks: Dict[str, Watermark] = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as handle:
+                    for entry in json.load(handle):
+                        self._watermarks[entry["source"]] = Watermark(**entry)
+            except (OSError, ValueError, TypeError, KeyError) as e:
+                logger.error(f"Ignoring unreadable checkpoint file {path}: {e}")
+
+    def get(self, source: str) -> Watermark:
+        """
+        Retrieve the watermark for a source, starting from zero if none was saved.
+
+        Args:
+            source (str): Path of the ATS export.
+
+        Returns:
+            Watermark: The stored watermark, or a fresh one.
+        """
+        with self._lock:
+            return self._watermarks.get(source) or Watermark(source=source)
+
+    def save(self, watermark: Watermark) -> None:
+        """
+        Persist a watermark, atomically replacing the checkpoint file.
+
+        Args:
+            watermark (Watermark): The watermark to store.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._watermarks[watermark.source] = watermark
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump([asdict(w) for w in self._watermarks.values()], handle)
+            os.replace(tmp_path, self.path)
+
+
+def _iter_new_lines(source: str, offset: int) -> Iterator[Tuple[bytes, int]]:
+    """
+    Yield complete lines appended after ``offset`` with the offset just past each.
+
+    A trailing line without a newline is still being written and is left for
+    the next poll.
+    """
+    with open(source, "rb") as handle:
+        handle.seek(offset)
+        while True:
+            line = handle.readline()
+            if not line or not line.endswith(b"\n"):
+                return
+            offset += len(line)
+            yield line, offset
+
+
+class _LineCursor:
+    """
+    Iterator of complete decoded lines from ``offset`` that tracks the byte offset reached.
+
+    Feeding it to ``csv.reader`` lets quoted fields span lines while offsets are
+    still only taken at record boundaries.
+    """
+
+    def __init__(self, source: str, offset: int) -> None:
+        self.offset = offset
+        self.exhausted = False
+        self._lines = _iter_new_lines(source, offset)
+
+    def __iter__(self) -> "_LineCursor":
+        return self
+
+    def __next__(self) -> str:
+        try:
+            line, self.offset = next(self._lines)
+        except StopIteration:
+            self.exhausted = True
+            raise
+        return line.decode("utf-8")
+
+
+def read_new_records(source: str, watermark: Watermark, max_rows: Optional[int] = None
+                     ) -> Tuple[List[Dict[str, str]], Watermark]:
+    """
+    Read the raw records appended to an export since ``watermark``.
+
+    Args:
+        source (str): Path to an uncompressed CSV or NDJSON export.
+        watermark (Watermark): Position reached by the previous read.
+        max_rows (Optional[int]): Stop after this many rows; the rest is picked up next call.
+
+    Returns:
+        Tuple[List[Dict[str, str]], Watermark]: The new records and the advanced watermark.
+    """
+    if source.lower().endswith(".gz"):
+        raise ValueError("Incremental ingestion requires an uncompressed export")
+    fmt = detect_format(source)
+    if fmt not in ("csv", "ndjson"):
+        raise ValueError("Incremental ingestion requires a CSV or NDJSON export")
+    offset, rows = watermark.offset, watermark.rows
+    if os.path.getsize(source) < offset:
+        logger.warning(f"{source} shrank below its watermark; assuming rotation and re-reading")
+        offset, rows = 0, 0
+
+    records: List[Dict[str, str]] = []
+    if fmt == "csv":
+        header_lines = _LineCursor(source, 0)
+        try:
+            header = next(csv.reader(header_lines, strict=True))
+        except (StopIteration, csv.Error):
+            return [], watermark  # header not fully written yet
+        offset = max(offset, header_lines.offset)
+        lines = _LineCursor(source, offset)
+        reader = csv.reader(lines, strict=True)
+        while max_rows is None or len(records) < max_rows:
+            start = lines.offset
+            try:
+                fields = next(reader)
+            except StopIteration:
+                break
+            except csv.Error as e:
+                if lines.exhausted:
+                    break  # a quoted field is still being written; retry from ``offset`` next poll
+                logger.warning(f"Skipping malformed record at byte {start} in {source}: {e}")
+                offset = lines.offset
+                rows += 1
+                continue
+            # The reader consumes exactly the lines of one record, so this is a record boundary.
+            offset = lines.offset
+            if not fields:
+                continue
+            rows += 1
+            records.append(dict(zip(header, fields)))
+    else:
+        for line, end in _iter_new_lines(source, offset):
+            offset = end
+            text = line.decode("utf-8").strip()
+            if not text:
+                continue
+            rows += 1
+            try:
+                records.append(json.loads(text))
+            except ValueError as e:
+                logger.warning(f"Skipping malformed line at byte {end - len(line)} in {source}: {e}")
+            if max_rows is not None and len(records) >= max_rows:
+                break
+
+    return records, Watermark(source=source, offset=offset, rows=rows, last_timestamp=watermark.last_timestamp)
+
+
+class ATSIngestor:
+    """
+    Stateful service that incrementally ingests append-only ATS exports.
+
+    Each poll reads only the rows appended since the source's watermark,
+    validates them, and hands the delta to every subscriber before advancing
+    and persisting the watermark.
+    """
+
+    def __init__(self, checkpoint: Optional[CheckpointStore] = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self.checkpoint = checkpoint
+        self.chunk_size = chunk_size
+        self._watermarks: Dict[str, Watermark] = {}
+        self._subscribers: List[DeltaCallback] = []
+
+    def subscribe(self, callback: DeltaCallback) -> None:
+        """
+        Register a callback that receives ``(source, delta_events)`` after each poll.
+
+        Args:
+            callback (DeltaCallback): Consumer of newly ingested events.
+
+        Returns:
+            None
+        """
+        self._subscribers.append(callback)
+
+    def watermark(self, source: str) -> Watermark:
+        """
+        Current watermark for a source.
+        """
+        if source not in self._watermarks:
+            self._watermarks[source] = self.checkpoint.get(source) if self.checkpoint else Watermark(source=source)
+        return self._watermarks[source]
+
+    def poll(self, source: str) -> int:
+        """
+        Ingest everything appended to ``source`` since the last poll.
+
+        Args:
+            source (str): Path to the export.
+
+        Returns:
+            int: Number of valid events delivered to subscribers.
+        """
+        delivered = 0
+        while True:
+            watermark = self.watermark(source)
+            try:
+                records, advanced = read_new_records(source, watermark, max_rows=self.chunk_size)
+            except Exception as e:
+                logger.error(f"Error reading new ATS events from {source}: {e}")
+                return delivered
+            if advanced.offset == watermark.offset:
+                return delivered
+
+            for events in batch_ats_events(records, chunk_size=self.chunk_size, source=source):
+                latest = max(to_epoch_us(e.timestamp) for e in events)
+                if advanced.last_timestamp is None or latest > to_epoch_us(advanced.last_timestamp):
+                    advanced.last_timestamp = from_epoch_us(latest).isoformat()
+                self._notify(source, events)
+                delivered += len(events)
+
+            self._watermarks[source] = advanced
+            if self.checkpoint:
+                self.checkpoint.save(advanced)
+            if len(records) < self.chunk_size:
+                return delivered
+
+    def _notify(self, source: str, events: List[ATSEvent]) -> None:
+        for callback in self._subscribers:
+            try:
+                callback(source, events)
+            except Exception as e:
+                logger.error(f"ATS delta subscriber {callback!r} failed: {e}")
+
+    def follow(self, sources: Sequence[str], poll_interval: float = 1.0,
+               stop_event: Optional[threading.Event] = None, max_polls: Optional[int] = None) -> None:
+        """
+        Tail-follow sources, polling each for new rows until stopped.
+
+        Args:
+            sources (Sequence[str]): Export paths to follow.
+            poll_interval (float): Seconds to wait between polling rounds.
+            stop_event (Optional[threading.Event]): Set to stop following.
+            max_polls (Optional[int]): Stop after this many rounds (useful for tests and cron jobs).
+
+        Returns:
+            None
+        """
+        stop_event = stop_event or threading.Event()
+        polls = 0
+        while not stop_event.is_set():
+            for source in sources:
+                if os.path.exists(source):
+                    self.poll(source)
+            polls += 1
+            if max_polls is not None and polls >= max_polls:
+                return
+            stop_event.wait(poll_interval)
@@ -0,0 +1,125 @@
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def code_dtype(cardinality: int) -> np.dtype:
+    """
+    Smallest signed integer dtype able to hold codes for ``cardinality`` values.
+    """
+    for dtype in (np.int8, np.int16, np.int32):
+        if cardinality <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+class Vocabulary:
+    """
+    Append-only mapping between categorical values and small integer codes.
+
+    A vocabulary is shared by every batch it encodes, so codes stay stable
+    across ingestion deltas and arrays from different batches can be combined
+    and grouped without decoding.
+    """
+
+    def __init__(self, values: Iterable[Any] = ()) -> None:
+        self._codes: Dict[Any, int] = {}
+        self._values: List[Any] = []
+        # Object array of the values, grown by doubling, so decoding never rebuilds it.
+        self._lookup = np.empty(0, dtype=object)
+        self._size = 0  # filled prefix of _lookup
+        self._lock = threading.Lock()
+        self.encode(list(values))
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Locks cannot be pickled; the values alone rebuild the mapping.
+        return {"values": self._values}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["values"])
+
+    @property
+    def values(self) -> List[Any]:
+        """
+        Known values, indexed by their code.
+        """
+        return list(self._values)
+
+    def code(self, value: Any) -> int:
+        """
+        Look up the code for a value without adding it.
+
+        Args:
+            value (Any): Categorical value.
+
+        Returns:
+            int: The value's code, or -1 if it has never been encoded.
+        """
+        return self._codes.get(value, -1)
+
+    def encode(self, values: Iterable[Any]) -> np.ndarray:
+        """
+        Encode values to integer codes, adding unseen values to the vocabulary.
+
+        Only the distinct values of the batch are looked up in Python; the
+        per-row mapping is a single vectorized take.
+
+        Args:
+            values (Iterable[Any]): Values to encode.
+
+        Returns:
+            np.ndarray: Codes using the smallest dtype that fits the vocabulary.
+        """
+        labels, uniques = pd.factorize(np.asarray(values, dtype=object), use_na_sentinel=False)
+        with self._lock:
+            mapping = np.empty(len(uniques), dtype=np.int64)
+            for i, value in enumerate(uniques):
+                code = self._codes.get(value)
+                if code is None:
+                    code = len(self._values)
+                    self._codes[value] = code
+                    self._values.append(value)
+                mapping[i] = code
+            size = len(self._values)
+            if size > self._size:
+                if size > len(self._lookup):
+                    grown = np.empty(max(size, 2 * len(self._lookup), 64), dtype=object)
+                    grown[:self._size] = self._lookup[:self._size]
+                    self._lookup = grown
+                self._lookup[self._size:size] = self._values[self._size:size]
+                self._size = size  # published last: readers only index the filled prefix
+            dtype = code_dtype(size)
+        return mapping[labels].astype(dtype, copy=False)
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        """
+        Map integer codes back to their values.
+
+        Args:
+            codes (np.ndarray): Codes produced by :meth:`encode`.
+
+        Returns:
+            np.ndarray: Object array of decoded values.
+        """
+        size = self._size  # read before the array, which is filled at least this far
+        return self._lookup[:size][np.asarray(codes, dtype=np.int64)]
+
+
+def new_vocabularies(columns: Iterable[str], initial: Optional[Dict[str, Iterable[Any]]] = None) -> Dict[str, Vocabulary]:
+    """
+    Create one empty (or pre-seeded) vocabulary per column.
+
+    Args:
+        columns (Iterable[str]): Column names.
+        initial (Optional[Dict[str, Iterable[Any]]]): Values to seed specific columns with.
+
+    Returns:
+        Dict[str, Vocabulary]: Vocabularies keyed by column name.
+    """
+    initial = initial or {}
+    return {name: Vocabulary(initial.get(name, ())) for name in columns}
@@ -0,0 +1,220 @@
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from kaizen_talent_analytics.data.categorical import Vocabulary, new_vocabularies
+from kaizen_talent_analytics.data.schema import ATSEvent
+from kaizen_talent_analytics.data.timestamps import (
+    TimestampLike, from_epoch_us, to_epoch_us, to_epoch_us_array,
+)
+
+logger = logging.getLogger(__name__)
+
+CATEGORICAL_COLUMNS = ("candidate_id", "source", "stage", "outcome")
+
+# Process-wide vocabularies, so codes agree across every index built from ingestion deltas.
+SHARED_VOCABULARIES: Dict[str, Vocabulary] = new_vocabularies(CATEGORICAL_COLUMNS)
+
+EventLike = Union[ATSEvent, Dict[str, Any]]
+
+
+class EventIndex:
+    """
+    Immutable, time-sorted columnar view over a set of ATS events.
+
+    Timestamps are normalized to int64 epoch microseconds once, when the index
+    is built, and rows are kept sorted by time. Categorical columns are
+    dictionary-encoded into small integer codes against shared vocabularies.
+    Time-window queries are binary searches over the sorted timestamp column;
+    categorical predicates and groupbys run on the integer code arrays.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], timestamps: np.ndarray,
+                 positions: Optional[np.ndarray] = None,
+                 vocabularies: Optional[Dict[str, Vocabulary]] = None) -> None:
+        """
+        Args:
+            columns (Dict[str, np.ndarray]): Raw values for each of ``CATEGORICAL_COLUMNS``.
+            timestamps (np.ndarray): int64 epoch microseconds, one per event.
+            positions (Optional[np.ndarray]): Original input position of each event.
+            vocabularies (Optional[Dict[str, Vocabulary]]): Encoders per column;
+                defaults to ``SHARED_VOCABULARIES``.
+        """
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        if positions is None:
+            positions = np.arange(len(timestamps), dtype=np.int64)
+        order = np.argsort(timestamps, kind="stable")
+        self.vocabularies = vocabularies if vocabularies is not None else SHARED_VOCABULARIES
+        self.timestamps = timestamps[order]
+        self.positions = np.asarray(positions, dtype=np.int64)[order]
+        self.codes = {
+            name: self.vocabularies[name].encode(np.asarray(columns[name], dtype=object)[order])
+            for name in CATEGORICAL_COLUMNS
+        }
+
+    @classmethod
+    def from_events(cls, events: Sequence[EventLike],
+                    vocabularies: Optional[Dict[str, Vocabulary]] = None) -> "EventIndex":
+        """
+        Build an index from ``ATSEvent`` instances or event dictionaries.
+
+        Args:
+            events (Sequence[EventLike]): Events in any order.
+            vocabularies (Optional[Dict[str, Vocabulary]]): Encoders per column.
+
+        Returns:
+            EventIndex: Time-sorted index over the events.
+        """
+        records = [e if isinstance(e, dict) else e.__dict__ for e in events]
+        columns = {name: [r.get(name) for r in records] for name in CATEGORICAL_COLUMNS}
+        timestamps = to_epoch_us_array([r.get("timestamp") for r in records])
+        return cls(columns, timestamps, vocabularies=vocabularies)
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame,
+                   vocabularies: Optional[Dict[str, Vocabulary]] = None) -> "EventIndex":
+        """
+        Build an index from a DataFrame with the ATS event columns.
+        """
+        columns = {name: frame[name].to_numpy(dtype=object) for name in CATEGORICAL_COLUMNS}
+        return cls(columns, to_epoch_us_array(frame["timestamp"]), vocabularies=vocabularies)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory held by the index arrays (codes, timestamps and positions).
+        """
+        return self.timestamps.nbytes + self.positions.nbytes + sum(c.nbytes for c in self.codes.values())
+
+    def column(self, name: str, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Decode a categorical column back to its values.
+
+        Args:
+            name (str): One of ``CATEGORICAL_COLUMNS``.
+            rows (Optional[np.ndarray]): Rows to decode; defaults to all rows.
+
+        Returns:
+            np.ndarray: Object array of decoded values.
+        """
+        codes = self.codes[name] if rows is None else self.codes[name][rows]
+        return self.vocabularies[name].decode(codes)
+
+    def time_window(self, start_time: Optional[TimestampLike] = None,
+                    end_time: Optional[TimestampLike] = None) -> slice:
+        """
+        Locate the rows inside an inclusive time range with two binary searches.
+
+        Args:
+            start_time (Optional[TimestampLike]): Inclusive lower bound.
+            end_time (Optional[TimestampLike]): Inclusive upper bound.
+
+        Returns:
+            slice: Row range in time order.
+        """
+        lo = 0 if start_time is None else int(np.searchsorted(self.timestamps, to_epoch_us(start_time), side="left"))
+        hi = len(self) if end_time is None else int(np.searchsorted(self.timestamps, to_epoch_us(end_time), side="right"))
+        return slice(lo, max(lo, hi))
+
+    def select(self, stage: Optional[str] = None, source: Optional[str] = None,
+               start_time: Optional[TimestampLike] = None, end_time: Optional[TimestampLike] = None,
+               stages: Optional[Iterable[str]] = None) -> np.ndarray:
+        """
+        Find rows matching all given predicates.
+
+        Args:
+            stage (Optional[str]): Keep only this stage.
+            source (Optional[str]): Keep only this source.
+            start_time (Optional[TimestampLike]): Inclusive lower time bound.
+            end_time (Optional[TimestampLike]): Inclusive upper time bound.
+            stages (Optional[Iterable[str]]): Keep only these stages.
+
+        Returns:
+            np.ndarray: Row numbers into this index, in time order.
+        """
+        window = self.time_window(start_time, end_time)
+        mask = None
+        for name, value in (("stage", stage), ("source", source)):
+            if value is not None:
+                hit = self.codes[name][window] == self.vocabularies[name].code(value)
+                mask = hit if mask is None else mask & hit
+        if stages is not None:
+            wanted = [self.vocabularies["stage"].code(s) for s in stages]
+            hit = np.isin(self.codes["stage"][window], wanted)
+            mask = hit if mask is None else mask & hit
+        rows = np.arange(window.start, window.stop, dtype=np.int64)
+        return rows if mask is None else rows[mask]
+
+    def count_by(self, name: str, rows: Optional[np.ndarray] = None) -> Dict[Any, int]:
+        """
+        Count events per value of a categorical column with a single bincount.
+
+        Args:
+            name (str): One of ``CATEGORICAL_COLUMNS``.
+            rows (Optional[np.ndarray]): Restrict the count to these rows.
+
+        Returns:
+            Dict[Any, int]: Event counts for every value that occurs.
+        """
+        codes = self.codes[name] if rows is None else self.codes[name][rows]
+        vocabulary = self.vocabularies[name]
+        counts = np.bincount(codes.astype(np.int64, copy=False), minlength=len(vocabulary))
+        present = np.flatnonzero(counts)
+        # One vectorized decode; indexing ``vocabulary.values`` per code would copy the value list each time.
+        return dict(zip(vocabulary.decode(present).tolist(), counts[present].tolist()))
+
+    def take(self, rows: np.ndarray) -> "EventIndex":
+        """
+        Return a new index restricted to the given rows.
+        """
+        index = EventIndex.__new__(EventIndex)
+        index.vocabularies = self.vocabularies
+        index.timestamps = self.timestamps[rows]
+        index.positions = self.positions[rows]
+        index.codes = {name: codes[rows] for name, codes in self.codes.items()}
+        return index
+
+    def reencode(self, vocabularies: Dict[str, Vocabulary]) -> "EventIndex":
+        """
+        Return this index with its codes taken from other vocabularies.
+
+        Codes are only comparable between indexes sharing vocabularies, so
+        consumers keeping code-indexed state translate foreign deltas first.
+
+        Args:
+            vocabularies (Dict[str, Vocabulary]): Encoders per column.
+
+        Returns:
+            EventIndex: ``self`` if it already uses ``vocabularies``, else a re-encoded copy.
+        """
+        if self.vocabularies is vocabularies:
+            return self
+        columns = {name: self.column(name) for name in CATEGORICAL_COLUMNS}
+        return EventIndex(columns, self.timestamps, positions=self.positions, vocabularies=vocabularies)
+
+    def to_records(self, rows: Optional[np.ndarray] = None) -> List[Dict[str, Any]]:
+        """
+        Materialize rows back into event dictionaries with ISO format timestamps.
+
+        Args:
+            rows (Optional[np.ndarray]): Row numbers to materialize; defaults to all rows.
+
+        Returns:
+            List[Dict[str, Any]]: Event dictionaries in time order.
+        """
+        if rows is None:
+            rows = np.arange(len(self))
+        decoded = {name: self.column(name, rows) for name in CATEGORICAL_COLUMNS}
+        timestamps = self.timestamps[rows]
+        return [
+            {
+                **{name: decoded[name][i] for name in CATEGORICAL_COLUMNS},
+                "timestamp": from_epoch_us(int(timestamps[i])).isoformat(),
+            }
+            for i in range(len(rows))
+        ]
@@ -0,0 +1,218 @@
+import logging
+import os
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from kaizen_talent_analytics.data.schema import ATSEvent
+from kaizen_talent_analytics.data.timestamps import (
+    MICROS_PER_DAY, TimestampLike, epoch_us_to_date, to_epoch_us, to_epoch_us_array,
+)
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - exercised only without pyarrow
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+EVENT_COLUMNS = ("candidate_id", "source", "stage", "outcome", "timestamp")
+PARTITION_KEY = "event_date"
+STORAGE_FORMATS = {"parquet": "parquet", "arrow": "ipc"}
+
+EventLike = Union[ATSEvent, Dict[str, Any]]
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("ATSEventStore requires pyarrow; install it with 'pip install pyarrow'")
+
+
+def events_to_table(events: Sequence[EventLike]) -> "pa.Table":
+    """
+    Convert ATS events into an Arrow table with UTC microsecond timestamps.
+
+    Args:
+        events (Sequence[EventLike]): ``ATSEvent`` instances or event dictionaries.
+
+    Returns:
+        pa.Table: Table with the columns in ``EVENT_COLUMNS``.
+    """
+    _require_pyarrow()
+    columns: Dict[str, List[Any]] = {name: [] for name in EVENT_COLUMNS}
+    for event in events:
+        record = event if isinstance(event, dict) else event.__dict__
+        for name in EVENT_COLUMNS[:-1]:
+            columns[name].append(record[name])
+        columns["timestamp"].append(to_epoch_us(record["timestamp"]))
+
+    timestamps = pa.array(np.asarray(columns.pop("timestamp"), dtype=np.int64))
+    arrays = [pa.array(columns[name], type=pa.string()) for name in EVENT_COLUMNS[:-1]]
+    arrays.append(timestamps.cast(pa.timestamp("us", tz="UTC")))
+    return pa.Table.from_arrays(arrays, names=list(EVENT_COLUMNS))
+
+
+def frame_to_table(frame: pd.DataFrame) -> "pa.Table":
+    """
+    Convert a DataFrame of ATS events into an Arrow table, column by column.
+    """
+    _require_pyarrow()
+    arrays = [pa.array(frame[name].astype(str).to_numpy(dtype=object), type=pa.string())
+              for name in EVENT_COLUMNS[:-1]]
+    timestamps = pa.array(to_epoch_us_array(frame["timestamp"]))
+    arrays.append(timestamps.cast(pa.timestamp("us", tz="UTC")))
+    return pa.Table.from_arrays(arrays, names=list(EVENT_COLUMNS))
+
+
+class ATSEventStore:
+    """
+    Columnar on-disk store for ATS events, partitioned by UTC event date.
+
+    Events are written as Parquet (or Arrow IPC) files under hive-style
+    ``event_date=YYYY-MM-DD`` directories. Reads prune partitions by time range
+    and push ``stage``/``source`` predicates down to the file scanner, so
+    consumers only touch the days and columns they ask for.
+    """
+
+    def __init__(self, root: str, storage_format: str = "parquet") -> None:
+        _require_pyarrow()
+        if storage_format not in STORAGE_FORMATS:
+            raise ValueError(f"Unsupported storage format: {storage_format}")
+        self.root = root
+        self.storage_format = storage_format
+        os.makedirs(root, exist_ok=True)
+
+    def write(self, events: Sequence[EventLike]) -> int:
+        """
+        Append events to the store, writing one new file per touched partition.
+
+        Args:
+            events (Sequence[EventLike]): Events to persist.
+
+        Returns:
+            int: Number of events written.
+        """
+        if not events:
+            return 0
+        return self._write_table(events_to_table(events))
+
+    def write_frame(self, frame: pd.DataFrame) -> int:
+        """
+        Append events held in a DataFrame without materializing per-row objects.
+
+        Args:
+            frame (pd.DataFrame): ATS event columns; ``timestamp`` may be ISO strings,
+                datetimes, or int64 epoch microseconds.
+
+        Returns:
+            int: Number of events written.
+        """
+        if frame.empty:
+            return 0
+        return self._write_table(frame_to_table(frame))
+
+    def _write_table(self, table: "pa.Table") -> int:
+        days = table.column("timestamp").cast(pa.int64()).to_numpy() // MICROS_PER_DAY
+        order = np.argsort(days, kind="stable")
+        sorted_days = days[order]
+        boundaries = np.flatnonzero(np.diff(sorted_days)) + 1
+        for chunk in np.split(order, boundaries):
+            day = epoch_us_to_date(int(days[chunk[0]]) * MICROS_PER_DAY)
+            self._write_partition(day.isoformat(), table.take(pa.array(chunk)))
+        logger.info(f"Wrote {table.num_rows} ATS events to {self.root}")
+        return table.num_rows
+
+    def write_batches(self, batches: Iterable[Sequence[EventLike]]) -> int:
+        """
+        Persist a stream of event batches, e.g. from ``iter_ats_event_batches``.
+
+        Args:
+            batches (Iterable[Sequence[EventLike]]): Event batches to persist.
+
+        Returns:
+            int: Total number of events written.
+        """
+        return sum(self.write(batch) for batch in batches)
+
+    def _write_partition(self, day: str, table: "pa.Table") -> None:
+        directory = os.path.join(self.root, f"{PARTITION_KEY}={day}")
+        os.makedirs(directory, exist_ok=True)
+        extension = "parquet" if self.storage_format == "parquet" else "arrow"
+        path = os.path.join(directory, f"part-{uuid.uuid4().hex}.{extension}")
+        if self.storage_format == "parquet":
+            pq.write_table(table, path)
+        else:
+            feather.write_feather(table, path, compression="uncompressed")
+
+    def partitions(self) -> List[str]:
+        """
+        List the event dates (ISO format) that have data in the store.
+
+        Returns:
+            List[str]: Sorted partition dates.
+        """
+        prefix = f"{PARTITION_KEY}="
+        return sorted(name[len(prefix):] for name in os.listdir(self.root) if name.startswith(prefix))
+
+    def _dataset(self) -> "ds.Dataset":
+        partitioning = ds.partitioning(pa.schema([(PARTITION_KEY, pa.string())]), flavor="hive")
+        return ds.dataset(self.root, format=STORAGE_FORMATS[self.storage_format], partitioning=partitioning)
+
+    def scan(self, columns: Optional[List[str]] = None, stages: Optional[Iterable[str]] = None,
+             sources: Optional[Iterable[str]] = None, start_time: Optional[TimestampLike] = None,
+             end_time: Optional[TimestampLike] = None) -> "pa.Table":
+        """
+        Read events as an Arrow table, pushing all predicates down to the scanner.
+
+        Args:
+            columns (Optional[List[str]]): Columns to read; defaults to all event columns.
+            stages (Optional[Iterable[str]]): Keep only events in these stages.
+            sources (Optional[Iterable[str]]): Keep only events from these sources.
+            start_time (Optional[TimestampLike]): Inclusive lower time bound.
+            end_time (Optional[TimestampLike]): Inclusive upper time bound.
+
+        Returns:
+            pa.Table: Matching events.
+        """
+        columns = list(columns) if columns else list(EVENT_COLUMNS)
+        if not self.partitions():
+            return events_to_table([]).select(columns)
+
+        predicate = None
+
+        def _and(expr):
+            nonlocal predicate
+            predicate = expr if predicate is None else predicate & expr
+
+        if stages is not None:
+            _and(ds.field("stage").isin(list(stages)))
+        if sources is not None:
+            _and(ds.field("source").isin(list(sources)))
+        ts_type = pa.timestamp("us", tz="UTC")
+        if start_time is not None:
+            start_us = to_epoch_us(start_time)
+            _and(ds.field(PARTITION_KEY) >= epoch_us_to_date(start_us).isoformat())
+            _and(ds.field("timestamp") >= pa.scalar(start_us, type=pa.int64()).cast(ts_type))
+        if end_time is not None:
+            end_us = to_epoch_us(end_time)
+            _and(ds.field(PARTITION_KEY) <= epoch_us_to_date(end_us).isoformat())
+            _and(ds.field("timestamp") <= pa.scalar(end_us, type=pa.int64()).cast(ts_type))
+
+        return self._dataset().to_table(columns=columns, filter=predicate)
+
+    def read(self, columns: Optional[List[str]] = None, stages: Optional[Iterable[str]] = None,
+             sources: Optional[Iterable[str]] = None, start_time: Optional[TimestampLike] = None,
+             end_time: Optional[TimestampLike] = None) -> pd.DataFrame:
+        """
+        Read events as a pandas DataFrame. See :meth:`scan` for the arguments.
+
+        Returns:
+            pd.DataFrame: Matching events.
+        """
+        return self.scan(columns=columns, stages=stages, sources=sources,
+                         start_time=start_time, end_time=end_time).to_pandas()
@@ -1,37 +1,237 @@
-import csv
-import random
-from datetime import datetime, timedelta
+import logging
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
 
-def generate_dummy_ats_events(filename: str, num_rows: int = 10) -> None:
+import numpy as np
+import pandas as pd
+
+from kaizen_talent_analytics.data.timestamps import MICROS_PER_DAY, to_epoch_us
+
+logger = logging.getLogger(__name__)
+
+# Funnel stages in order, with the probability of advancing from each stage to the next.
+STAGE_FLOW = ("Sourced", "Application", "Screened", "Interview", "Offer", "Hired")
+ADVANCE_PROBABILITY = np.array([0.60, 0.50, 0.40, 0.35, 0.80])
+# Mean days spent in each stage before the next event.
+MEAN_DWELL_DAYS = np.array([2.0, 4.0, 5.0, 7.0, 4.0, 0.0])
+
+# Source mix and how much each source scales the advance probabilities.
+SOURCE_PROFILES: Dict[str, Tuple[float, float]] = {
+    "LinkedIn": (0.40, 1.00),
+    "Job Board": (0.30, 0.80),
+    "Referral": (0.20, 1.35),
+    "Career Fair": (0.10, 0.90),
+}
+
+# Share of candidates who stop advancing but are still open at the end of the window.
+IN_PIPELINE_PROBABILITY = 0.15
+WITHDRAW_PROBABILITY = 0.25
+
+OUTPUT_FORMATS = ("csv", "ndjson", "parquet", "arrow")
+DEFAULT_START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+EVENT_COLUMNS = ["candidate_id", "source", "stage", "outcome", "timestamp"]
+
+
+def generate_journeys(n_candidates: int, seed: int = 0, start: datetime = DEFAULT_START,
+                      window_days: int = 90, first_candidate: int = 0) -> pd.DataFrame:
+    """
+    Generate synthetic ATS events for complete candidate journeys, fully vectorized.
+
+    Every candidate enters at "Sourced" and advances stage by stage with
+    source-skewed probabilities; those who stop are rejected, withdraw, or are
+    left open in the pipeline. The same arguments always produce the same frame.
+
+    Args:
+        n_candidates (int): Number of candidate journeys.
+        seed (int): Random seed.
+        start (datetime): Start of the window in which journeys begin.
+        window_days (int): Length of that window in days.
+        first_candidate (int): Number of the first candidate, for chunked generation.
+
+    Returns:
+        pd.DataFrame: Events sorted by candidate and time, with int64 epoch-microsecond timestamps.
+    """
+    rng = np.random.default_rng(seed)
+    sources = list(SOURCE_PROFILES)
+    weights = np.array([SOURCE_PROFILES[s][0] for s in sources])
+    skew = np.array([SOURCE_PROFILES[s][1] for s in sources])
+    n_steps = len(STAGE_FLOW) - 1
+
+    source = rng.choice(len(sources), size=n_candidates, p=weights / weights.sum())
+    advance_p = np.clip(ADVANCE_PROBABILITY[None, :] * skew[source][:, None], 0.0, 0.98)
+    advanced = np.cumprod(rng.random((n_candidates, n_steps)) < advance_p, axis=1)
+    depth = 1 + advanced.sum(axis=1)  # funnel stages reached, 1..len(STAGE_FLOW)
+
+    hired = depth == len(STAGE_FLOW)
+    exit_draw = rng.random(n_candidates)
+    open_ = ~hired & (exit_draw < IN_PIPELINE_PROBABILITY)
+    withdrew = ~hired & ~open_ & (exit_draw < IN_PIPELINE_PROBABILITY + WITHDRAW_PROBABILITY)
+    has_exit = ~hired & ~open_
+
+    lengths = depth + has_exit
+    offsets = np.r_[0, np.cumsum(lengths)]
+    candidate = np.repeat(np.arange(n_candidates), lengths)
+    step = np.arange(offsets[-1]) - offsets[candidate]
+    is_exit = has_exit[candidate] & (step == lengths[candidate] - 1)
+
+    stage_labels = np.array(STAGE_FLOW + ("Rejected", "Withdrawn"), dtype=object)
+    stage = np.where(is_exit, np.where(withdrew[candidate], len(STAGE_FLOW) + 1, len(STAGE_FLOW)),
+                     np.minimum(step, len(STAGE_FLOW) - 1))
+
+    last_funnel = ~is_exit & (step == depth[candidate] - 1)
+    outcome = np.full(len(step), "Passed", dtype=object)
+    outcome[last_funnel & open_[candidate]] = "Pending"
+    outcome[last_funnel & has_exit[candidate]] = "Failed"
+    outcome[is_exit] = "Failed"
+
+    # Gap before each event: the dwell time of the previous stage, jittered exponentially.
+    previous = np.maximum(step - 1, 0)
+    gap_days = np.where(step == 0, 0.0, rng.exponential(np.maximum(MEAN_DWELL_DAYS[previous], 0.25)))
+    gap_us = (gap_days * MICROS_PER_DAY).astype(np.int64)
+    elapsed = np.cumsum(gap_us)
+    elapsed -= np.repeat(elapsed[offsets[:-1]] - gap_us[offsets[:-1]], lengths)
+    entry = to_epoch_us(start) + rng.integers(0, window_days * MICROS_PER_DAY, size=n_candidates)
+
+    ids = np.arange(first_candidate, first_candidate + n_candidates).astype(str)
+    return pd.DataFrame({
+        "candidate_id": np.char.add("C", np.char.zfill(ids, 8)).astype(object)[candidate],
+        "source": pd.Categorical.from_codes(source[candidate], categories=sources),
+        "stage": pd.Categorical.from_codes(stage, categories=list(stage_labels)),
+        "outcome": pd.Categorical(outcome, categories=["Passed", "Failed", "Pending"]),
+        "timestamp": entry[candidate] + elapsed,
+    })
+
+
+def _iso_timestamps(epoch_us: np.ndarray) -> np.ndarray:
+    return np.char.add(np.datetime_as_string(epoch_us.astype("datetime64[us]").astype("datetime64[s]"), unit="s"), "Z")
+
+
+def write_events(frame: pd.DataFrame, path: str, fmt: str, header: bool = True) -> None:
+    """
+    Write a generated frame as CSV, NDJSON (optionally gzipped) or into a columnar store.
+
+    Args:
+        frame (pd.DataFrame): Output of :func:`generate_journeys`.
+        path (str): Output file, or store root directory for columnar formats.
+        fmt (str): One of ``OUTPUT_FORMATS``.
+        header (bool): Whether to write the CSV header row.
+
+    Returns:
+        None
+    """
+    if fmt in ("parquet", "arrow"):
+        from kaizen_talent_analytics.data.event_store import ATSEventStore
+        ATSEventStore(path, storage_format=fmt).write_frame(frame)
+        return
+    text = frame.assign(timestamp=_iso_timestamps(frame["timestamp"].to_numpy()))
+    compression = {"method": "gzip", "compresslevel": 1} if path.lower().endswith(".gz") else None
+    if fmt == "csv":
+        text.to_csv(path, index=False, header=header, compression=compression)
+    elif fmt == "ndjson":
+        text.to_json(path, orient="records", lines=True, compression=compression)
+    else:
+        raise ValueError(f"Unsupported output format: {fmt}")
+
+
+def _infer_output_format(path: str) -> str:
+    name = path.lower()[:-3] if path.lower().endswith(".gz") else path.lower()
+    if name.endswith((".ndjson", ".jsonl")):
+        return "ndjson"
+    if name.endswith(".csv"):
+        return "csv"
+    return "parquet"
+
+
+def _generate_chunk(args: Tuple[str, str, int, int, int, np.random.SeedSequence, datetime, int]) -> int:
+    path, fmt, chunk, first_candidate, n_candidates, seed_seq, start, window_days = args
+    seed = int(seed_seq.generate_state(1)[0])
+    frame = generate_journeys(n_candidates, seed=seed, start=start, window_days=window_days,
+                              first_candidate=first_candidate)
+    write_events(frame, path, fmt, header=chunk == 0)
+    return len(frame)
+
+
+def generate_ats_dataset(path: str, n_candidates: int, seed: int = 0, fmt: Optional[str] = None,
+                         chunk_candidates: int = 500_000, processes: int = 1,
+                         start: datetime = DEFAULT_START, window_days: int = 90) -> int:
+    """
+    Generate a large synthetic ATS export in chunks, optionally across processes.
+
+    Each chunk gets its own child seed, so the output depends only on ``seed``
+    and ``chunk_candidates``, not on the number of processes. CSV and NDJSON
+    chunks are written to temporary part files and concatenated in order;
+    columnar chunks are written straight into the partitioned store.
+
+    Args:
+        path (str): Output file (".csv", ".ndjson", optionally ".gz") or store directory.
+        n_candidates (int): Number of candidate journeys to generate.
+        seed (int): Root random seed.
+        fmt (Optional[str]): One of ``OUTPUT_FORMATS``; inferred from ``path`` if omitted.
+        chunk_candidates (int): Candidates generated per chunk; bounds memory per worker.
+        processes (int): Worker processes; 1 generates in-process.
+        start (datetime): Start of the window in which journeys begin.
+        window_days (int): Length of that window in days.
+
+    Returns:
+        int: Number of events written.
+    """
+    fmt = fmt or _infer_output_format(path)
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format: {fmt}")
+    n_chunks = max(1, -(-n_candidates // chunk_candidates))
+    seeds = np.random.SeedSequence(seed).spawn(n_chunks)
+    columnar = fmt in ("parquet", "arrow")
+    workdir = None if columnar else tempfile.mkdtemp(prefix="ats_gen_", dir=os.path.dirname(os.path.abspath(path)))
+    suffix = ".gz" if path.lower().endswith(".gz") else ""
+
+    tasks: List[Tuple] = []
+    parts: List[str] = []
+    for chunk in range(n_chunks):
+        first = chunk * chunk_candidates
+        size = min(chunk_candidates, n_candidates - first)
+        target = path if columnar else os.path.join(workdir, f"part-{chunk:05d}.{fmt}{suffix}")
+        parts.append(target)
+        tasks.append((target, fmt, chunk, first, size, seeds[chunk], start, window_days))
+
+    try:
+        if processes > 1 and n_chunks > 1:
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                rows = sum(pool.map(_generate_chunk, tasks))
+        else:
+            rows = sum(_generate_chunk(task) for task in tasks)
+        if not columnar:
+            # Concatenated gzip members form a valid gzip stream, so parts can be joined byte-wise.
+            with open(path, "wb") as out:
+                for part in parts:
+                    with open(part, "rb") as handle:
+                        shutil.copyfileobj(handle, out, length=16 * 1024 * 1024)
+    finally:
+        if workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    logger.info(f"Generated {rows} ATS events for {n_candidates} candidates into {path}")
+    return rows
+
+
+def generate_dummy_ats_events(filename: str, num_rows: int = 10, seed: Optional[int] = None) -> None:
     """
     Generate dummy ATS event data and save to CSV.
 
     Args:
         filename (str): Output CSV file path.
         num_rows (int): Number of rows to generate.
+        seed (Optional[int]): Random seed; a random one is drawn if omitted.
 
     Returns:
         None
     """
-    stages = ['Sourced', 'Screened', 'Interview', 'Hired', 'Rejected']
-    sources = ['LinkedIn', 'Referral', 'Job Board', 'Career Fair']
-    outcomes = ['Passed', 'Failed', 'Pending']
-
-    start_date = datetime.now() - timedelta(days=90)
-
-    with open(filename, mode='w', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(['candidate_id', 'source', 'stage', 'outcome', 'timestamp'])
-
-        for i in range(1, num_rows + 1):
-            candidate_id = f"C{i:05d}"
-            source = random.choice(sources)
-            stage = random.choice(stages)
-            outcome = random.choice(outcomes)
-            timestamp = (start_date + timedelta(days=random.randint(0, 90),
-                                                hours=random.randint(0, 23),
-                                                minutes=random.randint(0, 59))).isoformat()
-            writer.writerow([candidate_id, source, stage, outcome, timestamp])
+    seed = int(np.random.SeedSequence().entropy % 2**32) if seed is None else seed
+    frame = generate_journeys(num_rows, seed=seed).head(num_rows)
+    write_events(frame, filename, "csv")
 
 if __name__ == "__main__":
     generate_dummy_ats_events("data/dummy_ats_events.csv", num_rows=20)
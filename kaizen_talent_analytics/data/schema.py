@@ -2,6 +2,11 @@ from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import datetime
 
+# Stages an ATS export may report, in funnel order followed by terminal exits.
+FUNNEL_STAGES = ("Sourced", "Application", "Screened", "Interview", "Offer", "Hired")
+EXIT_STAGES = ("Rejected", "Withdrawn")
+ATS_STAGES = FUNNEL_STAGES + EXIT_STAGES
+
 class ATSEvent(BaseModel):
     """
     Pydantic model representing an ATS event.
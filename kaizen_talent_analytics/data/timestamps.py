@@ -0,0 +1,99 @@
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, Union
+
+import numpy as np
+import pandas as pd
+
+# Event timestamps are normalized to int64 microseconds since the Unix epoch (UTC).
+# Naive timestamps are interpreted as UTC.
+MICROS_PER_SECOND = 1_000_000
+MICROS_PER_DAY = 86_400 * MICROS_PER_SECOND
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+TimestampLike = Union[str, datetime, int]
+
+
+def parse_timestamp(value: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp, accepting a trailing "Z" on every Python version.
+
+    Args:
+        value (str): ISO format timestamp string.
+
+    Returns:
+        datetime: Timezone-aware datetime in UTC.
+    """
+    text = value.strip()
+    if text.endswith(("Z", "z")):
+        text = text[:-1] + "+00:00"
+    return to_utc(datetime.fromisoformat(text))
+
+
+def to_utc(value: datetime) -> datetime:
+    """
+    Convert a datetime to UTC, treating naive values as already being UTC.
+    """
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def to_epoch_us(value: TimestampLike) -> int:
+    """
+    Normalize a timestamp to integer microseconds since the Unix epoch.
+
+    Args:
+        value (TimestampLike): ISO string, datetime, or an epoch value already in microseconds.
+
+    Returns:
+        int: Microseconds since 1970-01-01T00:00:00Z.
+    """
+    if isinstance(value, bool):
+        raise TypeError("Booleans are not valid timestamps")
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        value = parse_timestamp(value)
+    if isinstance(value, datetime):
+        delta = to_utc(value) - _EPOCH
+        return (delta.days * 86_400 + delta.seconds) * MICROS_PER_SECOND + delta.microseconds
+    raise TypeError(f"Unsupported timestamp type: {type(value).__name__}")
+
+
+def from_epoch_us(value: int) -> datetime:
+    """
+    Convert epoch microseconds back to a timezone-aware UTC datetime.
+    """
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def epoch_us_to_date(value: int) -> date:
+    """
+    Return the UTC calendar date an epoch-microsecond timestamp falls on.
+    """
+    return date.fromordinal(_EPOCH.date().toordinal() + value // MICROS_PER_DAY)
+
+
+def to_epoch_us_array(values: Iterable[TimestampLike]) -> np.ndarray:
+    """
+    Vectorized :func:`to_epoch_us` for whole columns of timestamps.
+
+    Args:
+        values (Iterable[TimestampLike]): ISO strings, datetimes, a datetime64 series,
+            or an integer series already in epoch microseconds.
+
+    Returns:
+        np.ndarray: int64 microseconds since the Unix epoch.
+    """
+    series = pd.Series(values, dtype=object) if not isinstance(values, pd.Series) else values
+    if series.empty:
+        return np.empty(0, dtype=np.int64)
+    if pd.api.types.is_integer_dtype(series.dtype):
+        return series.to_numpy(dtype=np.int64)
+    if isinstance(series.dtype, pd.DatetimeTZDtype) or pd.api.types.is_datetime64_dtype(series.dtype):
+        if getattr(series.dt, "tz", None) is None:
+            series = series.dt.tz_localize("UTC")
+        return series.dt.tz_convert("UTC").dt.as_unit("us").astype("int64").to_numpy()
+    parsed = pd.to_datetime(series, utc=True, format="ISO8601")
+    return parsed.dt.as_unit("us").astype("int64").to_numpy()
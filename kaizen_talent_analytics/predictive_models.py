@@ -1,5 +1,297 @@
+import inspect
+import logging
+import os
 from abc import ABC, abstractmethod
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from kaizen_talent_analytics.data.categorical import Vocabulary
+from kaizen_talent_analytics.data.schema import PredictionOutput
+
+logger = logging.getLogger(__name__)
+
+
+def as_feature_matrix(data: Any) -> np.ndarray:
+    """
+    Coerce model input to a 2-D float64 feature matrix.
+
+    Args:
+        data (Any): A 2-D array, a DataFrame, or an object exposing ``features``.
+
+    Returns:
+        np.ndarray: Feature matrix with one row per candidate.
+    """
+    if hasattr(data, "features"):
+        data = data.features
+    if isinstance(data, pd.DataFrame):
+        data = data.to_numpy(dtype=np.float64)
+    matrix = np.asarray(data, dtype=np.float64)
+    if matrix.ndim != 2:
+        raise ValueError(f"Expected a 2-D feature matrix, got shape {matrix.shape}")
+    return matrix
+
+
+def split_features_target(data: Any, target: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Separate training input into a feature matrix and a target vector.
+
+    Args:
+        data (Any): ``(X, y)``, a DataFrame containing a ``target`` column, or an
+            object exposing ``features`` and a ``labels`` mapping.
+        target (str): Name of the target column or label.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Features and target.
+    """
+    if isinstance(data, (tuple, list)) and len(data) == 2:
+        X, y = data
+    elif isinstance(data, pd.DataFrame):
+        if target not in data.columns:
+            raise ValueError(f"Training frame has no '{target}' column")
+        X, y = data.drop(columns=[target]), data[target]
+    elif hasattr(data, "features") and hasattr(data, "labels"):
+        if target not in data.labels:
+            raise ValueError(f"Training data has no '{target}' label")
+        X, y = data.features, data.labels[target]
+    else:
+        raise ValueError("Training data must be (X, y), a DataFrame, or expose features and labels")
+    X = as_feature_matrix(X)
+    y = np.asarray(y, dtype=np.float64).ravel()
+    if len(y) != len(X):
+        raise ValueError(f"Feature rows ({len(X)}) and targets ({len(y)}) differ in length")
+    return X, y
+
+
+def split_survival_data(data: Any) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Separate survival training input into covariates, durations, event flags and cohorts.
+
+    Args:
+        data (Any): ``(X, durations, observed)`` or ``(X, durations, observed, cohorts)``,
+            a DataFrame with ``time_to_hire_days`` and ``hired`` (and optional ``cohort``)
+            columns, or an object exposing ``features``, those ``labels`` and ``cohorts``.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Covariates, durations in
+            days, observed-event flags, and cohort labels ("all" when not given).
+    """
+    cohorts = None
+    if isinstance(data, (tuple, list)) and len(data) in (3, 4):
+        X, durations, observed = data[:3]
+        cohorts = data[3] if len(data) == 4 else None
+    elif isinstance(data, pd.DataFrame):
+        missing = {"time_to_hire_days", "hired"} - set(data.columns)
+        if missing:
+            raise ValueError(f"Training frame is missing columns: {sorted(missing)}")
+        durations, observed = data["time_to_hire_days"], data["hired"]
+        cohorts = data["cohort"] if "cohort" in data.columns else None
+        X = data.drop(columns=[c for c in ("time_to_hire_days", "hired", "cohort") if c in data.columns])
+    elif hasattr(data, "features") and hasattr(data, "labels"):
+        X, durations, observed = data.features, data.labels["time_to_hire_days"], data.labels["hired"]
+        cohorts = getattr(data, "cohorts", None)
+    else:
+        raise ValueError("Survival data must be (X, durations, observed[, cohorts]), a DataFrame, "
+                         "or expose features and labels")
+    X = as_feature_matrix(X)
+    durations = np.asarray(durations, dtype=np.float64).ravel()
+    observed = np.asarray(observed, dtype=bool).ravel()
+    cohorts = np.full(len(X), "all", dtype=object) if cohorts is None else np.asarray(cohorts, dtype=object).ravel()
+    if not len(X) == len(durations) == len(observed) == len(cohorts):
+        raise ValueError("Survival arrays differ in length")
+    if np.any(durations < 0):
+        raise ValueError("Durations must be non-negative")
+    return X, durations, observed, cohorts
+
+
+def sigmoid(z: np.ndarray) -> np.ndarray:
+    """
+    Numerically stable logistic function.
+    """
+    out = np.empty_like(z, dtype=np.float64)
+    positive = z >= 0
+    out[positive] = 1.0 / (1.0 + np.exp(-z[positive]))
+    exp_z = np.exp(z[~positive])
+    out[~positive] = exp_z / (1.0 + exp_z)
+    return out
+
+
+def merge_moments(n: int, mean: Optional[np.ndarray], m2: Optional[np.ndarray],
+                  X: np.ndarray) -> Tuple[int, Optional[np.ndarray], Optional[np.ndarray]]:
+    """
+    Fold a batch into running column means and sums of squared deviations.
+
+    Uses the pairwise merge of Chan et al., which stays accurate over any
+    number of batches.
+
+    Args:
+        n (int): Rows seen so far.
+        mean (Optional[np.ndarray]): Running column means, None before the first batch.
+        m2 (Optional[np.ndarray]): Running sums of squared deviations from the mean.
+        X (np.ndarray): New rows.
+
+    Returns:
+        Tuple[int, Optional[np.ndarray], Optional[np.ndarray]]: Updated ``n``, ``mean`` and ``m2``.
+    """
+    if len(X) == 0:
+        return n, mean, m2
+    batch_mean = X.mean(axis=0)
+    batch_m2 = ((X - batch_mean) ** 2).sum(axis=0)
+    if mean is None or n == 0:
+        return len(X), batch_mean, batch_m2
+    total = n + len(X)
+    delta = batch_mean - mean
+    return total, mean + delta * len(X) / total, m2 + batch_m2 + delta ** 2 * n * len(X) / total
+
+
+def _stream_moments(batches: Iterable[Any],
+                    columns: Callable[[Any], np.ndarray]) -> Tuple[int, np.ndarray, np.ndarray]:
+    # One pass over a batch stream: row count, column means and population standard deviations.
+    n, mean, m2 = 0, None, None
+    for batch in batches:
+        n, mean, m2 = merge_moments(n, mean, m2, columns(batch))
+    if n == 0:
+        raise ValueError("Cannot fit on an empty batch stream")
+    scale = np.sqrt(m2 / n)
+    return n, mean, np.where(scale > 0, scale, 1.0)
+
+@dataclass
+class Explanation:
+    """
+    Dataclass of per-row feature attributions for one model output.
+
+    ``attributions[i, j]`` is how much row ``i``'s output moves away from what
+    the model predicts once feature ``j`` is replaced by background values.
+    """
+    model_name: str
+    output: str  # key of the explained entry in PredictionOutput.prediction
+    feature_names: List[str]
+    base_value: float  # mean output over the background sample
+    predictions: np.ndarray  # one output per row
+    attributions: np.ndarray  # rows x features
+    top_features: np.ndarray  # rows x k feature positions, largest |attribution| first
+    top_attributions: np.ndarray  # rows x k
+
+    def top_k_frame(self, candidate_ids: Optional[Any] = None) -> pd.DataFrame:
+        """
+        Long-format view of the top-k attributions, one row per candidate and rank.
+
+        Args:
+            candidate_ids (Optional[Any]): Candidate of each explained row; defaults to row positions.
+
+        Returns:
+            pd.DataFrame: Candidate, rank, feature, attribution and the candidate's prediction.
+        """
+        n, k = self.top_features.shape
+        ids = np.arange(n) if candidate_ids is None else np.asarray(candidate_ids)
+        return pd.DataFrame({
+            "candidate_id": np.repeat(ids, k),
+            "rank": np.tile(np.arange(1, k + 1), n),
+            "feature": np.asarray(self.feature_names, dtype=object)[self.top_features.ravel()],
+            "attribution": self.top_attributions.ravel(),
+            "prediction": np.repeat(self.predictions, k),
+        })
+
+
+def feature_names_of(data: Any, n_features: int) -> List[str]:
+    """
+    Feature names carried by model input, or positional names when it has none.
+    """
+    names = getattr(data, "feature_names", None)
+    if names is None and isinstance(data, pd.DataFrame):
+        names = data.columns
+    if names is None or len(names) != n_features:
+        return [f"feature_{j}" for j in range(n_features)]
+    return [str(name) for name in names]
+
+
+def _occlusion_chunk(score: Any, X: np.ndarray, columns: np.ndarray, values: np.ndarray,
+                     weights: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    # Every row repeated once per (feature, distinct background value), with that value swapped in.
+    Z = np.repeat(X[:, None, :], len(values), axis=1)
+    Z[:, np.arange(len(values)), columns] = values
+    occluded = score(Z.reshape(-1, X.shape[1])).reshape(len(X), len(values)) * weights
+    return score(X)[:, None] - np.add.reduceat(occluded, starts, axis=1)
+
+
+def explain_predictions(model: "BaseModel", data: Any, output: str, background: Any = None,
+                        background_size: int = 100, top_k: int = 3, seed: int = 0,
+                        n_jobs: Optional[int] = None, max_evaluations: int = 250_000) -> Explanation:
+    """
+    Batched perturbation explanations for any model exposing ``predict``.
+
+    For each row and feature, the feature is replaced by every value in a
+    background sample while the other features stay put; the attribution is
+    the row's prediction minus the mean prediction over those perturbations.
+    Background values are deduplicated per feature and weighted by frequency,
+    so one-hot and count features cost a few evaluations instead of
+    ``background_size``. All perturbations of a chunk of rows are stacked into
+    one matrix and scored with a single ``predict`` call; chunks are spread
+    over a thread pool (numpy releases the GIL).
+
+    Args:
+        model (BaseModel): Fitted model.
+        data (Any): Rows to explain (array, DataFrame, or object exposing ``features``).
+        output (str): Prediction entry to explain, e.g. ``"retention_score"``.
+        background (Any): Reference rows; defaults to a sample of ``data``.
+        background_size (int): Rows sampled for the default background.
+        top_k (int): Attributions kept per row, by absolute size.
+        seed (int): Seed of the background sample.
+        n_jobs (Optional[int]): Worker threads; defaults to the CPU count.
+        max_evaluations (int): Perturbed rows scored per ``predict`` call, bounding memory.
+
+    Returns:
+        Explanation: Full attribution matrix plus the top-k per row.
+    """
+    X = as_feature_matrix(data)
+    if background is None:
+        rng = np.random.default_rng(seed)
+        background = X[np.sort(rng.choice(len(X), size=min(background_size, len(X)), replace=False))]
+    else:
+        background = as_feature_matrix(background)
+    if len(background) == 0:
+        raise ValueError("Cannot explain predictions without background rows")
+    if background.shape[1] != X.shape[1]:
+        raise ValueError(f"Background has {background.shape[1]} features, data has {X.shape[1]}")
+
+    def score(rows: np.ndarray) -> np.ndarray:
+        return np.asarray(model.predict(rows).prediction[output], dtype=np.float64)
+
+    width = X.shape[1]
+    distinct = [np.unique(background[:, j], return_counts=True) for j in range(width)]
+    columns = np.repeat(np.arange(width), [len(v) for v, _ in distinct])
+    values = np.concatenate([v for v, _ in distinct])
+    weights = np.concatenate([c for _, c in distinct]) / len(background)
+    starts = np.r_[0, np.cumsum([len(v) for v, _ in distinct])[:-1]]
+    chunk = max(1, max_evaluations // len(values))
+    offsets = range(0, len(X), chunk)
+    workers = min(n_jobs or os.cpu_count() or 1, len(offsets))
+
+    def explain_chunk(offset: int) -> np.ndarray:
+        return _occlusion_chunk(score, X[offset:offset + chunk], columns, values, weights, starts)
+
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="explain") as pool:
+            parts = list(pool.map(explain_chunk, offsets))
+    else:
+        parts = [explain_chunk(offset) for offset in offsets]
+    attributions = np.vstack(parts) if parts else np.empty((0, width))
+
+    k = min(top_k, width)
+    top = np.argsort(-np.abs(attributions), axis=1, kind="stable")[:, :k]
+    return Explanation(
+        model_name=type(model).__name__,
+        output=output,
+        feature_names=feature_names_of(data, width),
+        base_value=float(score(background).mean()),
+        predictions=score(X),
+        attributions=attributions,
+        top_features=top,
+        top_attributions=np.take_along_axis(attributions, top, axis=1),
+    )
 
 class BaseModel(ABC):
     """
@@ -45,59 +337,614 @@ class BaseModel(ABC):
         """
         pass
 
+    # Models that can learn from a stream of batches override this flag and partial_fit.
+    supports_partial_fit = False
+
+    def partial_fit(self, batch: Any) -> None:
+        """
+        Incrementally update the model with a new batch, in time and memory proportional to the batch.
+
+        Optional: models that only support full refits leave this unimplemented.
+
+        Args:
+            batch (Any): New training data, in the same form accepted by :meth:`fit`.
+
+        Returns:
+            None
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support partial_fit")
+
+    def fit_batches(self, batches: Iterable[Any]) -> None:
+        """
+        Fit the model from scratch on data streamed in batches, holding one batch at a time.
+
+        Optional: models that can only fit in memory leave this unimplemented.
+
+        Args:
+            batches (Iterable[Any]): Re-iterable source; every ``iter(batches)`` is one
+                pass over the training data, yielding batches in any form accepted by
+                :meth:`fit` (e.g. ``FeatureBatches``, or a list of batches).
+
+        Returns:
+            None
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support fit_batches")
+
+    # Fitted attributes captured by get_state; array values may come back read-only (memory-mapped).
+    state_attributes: Tuple[str, ...] = ()
+
+    def get_params(self) -> Dict[str, Any]:
+        """
+        Constructor arguments needed to rebuild an unfitted copy of the model.
+        """
+        names = list(inspect.signature(type(self).__init__).parameters)[1:]
+        return {name: getattr(self, name) for name in names}
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Fitted state as a mapping of attribute names to arrays or JSON-serializable values.
+        """
+        return {name: getattr(self, name) for name in self.state_attributes}
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """
+        Restore fitted state produced by :meth:`get_state`.
+
+        Args:
+            state (Dict[str, Any]): Attribute values; arrays are used as given, without copying.
+
+        Returns:
+            None
+        """
+        for name in self.state_attributes:
+            setattr(self, name, state[name])
+
 class RetentionModel(BaseModel):
     """
     Predictive model for employee retention.
+
+    L2-regularized logistic regression on standardized features, fitted with
+    Newton's method. Scoring is a single matrix-vector product over the batch.
     """
 
+    target = "retained"
+    state_attributes = ("mean_", "scale_", "coef_", "intercept_")
+
+    def __init__(self, l2: float = 1.0, max_iter: int = 25, tol: float = 1e-6) -> None:
+        if max_iter < 1:
+            raise ValueError(f"max_iter must be at least 1, got {max_iter}")
+        self.l2 = l2
+        self.max_iter = max_iter
+        self.tol = tol
+        self.mean_: Optional[np.ndarray] = None
+        self.scale_: Optional[np.ndarray] = None
+        self.coef_: Optional[np.ndarray] = None
+        self.intercept_: float = 0.0
+
+    @property
+    def is_fitted(self) -> bool:
+        return self.coef_ is not None
+
     def fit(self, data: Any) -> None:
-        # Placeholder for fitting logic
-        print("Fitting RetentionModel")
+        """
+        Fit the model to the provided data.
 
-    def predict(self, data: Any) -> Any:
-        # Placeholder for prediction logic
-        print("Predicting with RetentionModel")
-        return None
+        Args:
+            data (Any): ``(X, y)`` with binary retention targets, a DataFrame with a
+                ``retained`` column, or an object exposing ``features`` and ``labels``.
 
-    def explain(self, data: Any) -> Any:
-        # Placeholder for explanation logic
-        print("Explaining RetentionModel predictions")
-        return None
+        Returns:
+            None
+        """
+        X, y = split_features_target(data, self.target)
+        if len(X) == 0:
+            raise ValueError("Cannot fit RetentionModel on an empty feature matrix")
+        self.mean_ = X.mean(axis=0)
+        scale = X.std(axis=0)
+        self.scale_ = np.where(scale > 0, scale, 1.0)
+        Z = np.hstack([np.ones((len(X), 1)), (X - self.mean_) / self.scale_])
+
+        weights = np.zeros(Z.shape[1])
+        penalty = np.full(Z.shape[1], self.l2)
+        penalty[0] = 0.0  # do not shrink the intercept
+        for iteration in range(self.max_iter):
+            p = sigmoid(Z @ weights)
+            gradient = Z.T @ (p - y) + penalty * weights
+            hessian = (Z * (p * (1 - p))[:, None]).T @ Z + np.diag(penalty)
+            step = np.linalg.solve(hessian + 1e-9 * np.eye(len(weights)), gradient)
+            weights -= step
+            if np.max(np.abs(step)) < self.tol:
+                break
+        self.intercept_ = float(weights[0])
+        self.coef_ = weights[1:]
+        logger.info(f"RetentionModel fitted on {len(X)} rows in {iteration + 1} Newton iterations")
+
+    def fit_batches(self, batches: Iterable[Any]) -> None:
+        """
+        Out-of-core equivalent of :meth:`fit`.
+
+        One pass computes the standardization moments; each Newton iteration
+        is then one more pass that sums the gradient and Hessian batch by
+        batch, so memory is one batch plus O(features^2).
+
+        Args:
+            batches (Iterable[Any]): Re-iterable batch source; see :meth:`BaseModel.fit_batches`.
+
+        Returns:
+            None
+        """
+        n, self.mean_, self.scale_ = _stream_moments(
+            batches, lambda batch: split_features_target(batch, self.target)[0])
+        weights = np.zeros(len(self.mean_) + 1)
+        penalty = np.full(len(weights), self.l2)
+        penalty[0] = 0.0  # do not shrink the intercept
+        for iteration in range(self.max_iter):
+            gradient, hessian = penalty * weights, np.diag(penalty)
+            for batch in batches:
+                X, y = split_features_target(batch, self.target)
+                Z = np.hstack([np.ones((len(X), 1)), (X - self.mean_) / self.scale_])
+                p = sigmoid(Z @ weights)
+                gradient += Z.T @ (p - y)
+                hessian += (Z * (p * (1 - p))[:, None]).T @ Z
+            step = np.linalg.solve(hessian + 1e-9 * np.eye(len(weights)), gradient)
+            weights = weights - step
+            if np.max(np.abs(step)) < self.tol:
+                break
+        self.intercept_ = float(weights[0])
+        self.coef_ = weights[1:]
+        logger.info(f"RetentionModel fitted out of core on {n} rows in {iteration + 1} Newton passes")
+
+    def predict_proba(self, data: Any) -> np.ndarray:
+        """
+        Retention probability for every row of the feature matrix.
+        """
+        if not self.is_fitted:
+            raise RuntimeError("RetentionModel must be fitted before predicting")
+        X = as_feature_matrix(data)
+        if X.shape[1] != len(self.coef_):
+            raise ValueError(f"Expected {len(self.coef_)} features, got {X.shape[1]}")
+        # Standardization folded into the weights: one pass over X instead of three.
+        weights = self.coef_ / self.scale_
+        return sigmoid(X @ weights + (self.intercept_ - self.mean_ @ weights))
+
+    def predict(self, data: Any) -> PredictionOutput:
+        """
+        Score a batch of candidates in one vectorized call.
+
+        Args:
+            data (Any): Feature matrix (array, DataFrame, or object exposing ``features``).
+
+        Returns:
+            PredictionOutput: ``prediction["retention_score"]`` holds one probability per row.
+        """
+        scores = self.predict_proba(data)
+        return PredictionOutput(model_name=type(self).__name__, prediction={"retention_score": scores})
+
+    def explain(self, data: Any, background_size: int = 100, top_k: int = 3, **options: Any) -> Explanation:
+        """
+        Per-candidate attributions of the retention score.
+
+        Args:
+            data (Any): Rows to explain.
+            background_size (int): Background rows each feature is perturbed with.
+            top_k (int): Attributions kept per candidate.
+            **options: Further arguments of :func:`explain_predictions`.
+
+        Returns:
+            Explanation: Attributions of ``retention_score``.
+        """
+        return explain_predictions(self, data, "retention_score", background_size=background_size, top_k=top_k, **options)
 
 class TimeToHireModel(BaseModel):
     """
     Predictive model for time to hire.
+
+    Survival analysis over event/censoring arrays: a Kaplan-Meier estimate per
+    cohort kept as per-day event and removal histograms, plus an exponential
+    proportional-hazards model for covariates fitted by Newton's method.
+    Candidates still in the pipeline (or who left it) enter as right-censored.
+
+    Both parts update incrementally through :meth:`partial_fit`: histograms
+    are added to, and the hazard coefficients take Newton steps on the new
+    batch only, using the accumulated Fisher information as a Gaussian prior.
     """
 
+    target = "time_to_hire_days"
+    supports_partial_fit = True
+    state_attributes = ("cohorts", "events_", "removed_", "mean_", "scale_", "coef_", "precision_")
+
+    def __init__(self, horizon_days: int = 365, l2: float = 1.0, max_iter: int = 25,
+                 tol: float = 1e-6, hire_window_days: int = 30) -> None:
+        if max_iter < 1:
+            raise ValueError(f"max_iter must be at least 1, got {max_iter}")
+        self.horizon_days = horizon_days
+        self.l2 = l2
+        self.max_iter = max_iter
+        self.tol = tol
+        self.hire_window_days = hire_window_days
+        self._reset()
+
+    def _reset(self) -> None:
+        self.cohorts = Vocabulary()
+        self.events_ = np.zeros((0, self.horizon_days))
+        self.removed_ = np.zeros((0, self.horizon_days))
+        self.mean_: Optional[np.ndarray] = None
+        self.scale_: Optional[np.ndarray] = None
+        self.coef_: Optional[np.ndarray] = None  # intercept first
+        self.precision_: Optional[np.ndarray] = None
+
+    @property
+    def is_fitted(self) -> bool:
+        return self.coef_ is not None
+
+    def _accumulate(self, durations: np.ndarray, observed: np.ndarray, cohorts: np.ndarray, sign: int = 1) -> None:
+        codes = self.cohorts.encode(cohorts).astype(np.int64)
+        if len(self.cohorts) > len(self.events_):
+            grow = len(self.cohorts) - len(self.events_)
+            self.events_ = np.vstack([self.events_, np.zeros((grow, self.horizon_days))])
+            self.removed_ = np.vstack([self.removed_, np.zeros((grow, self.horizon_days))])
+        bins = np.clip(np.floor(durations).astype(np.int64), 0, self.horizon_days - 1)
+        flat = codes * self.horizon_days + bins
+        size = self.events_.size
+        self.events_ = self.events_ + sign * np.bincount(
+            flat, weights=observed.astype(np.float64), minlength=size).reshape(self.events_.shape)
+        self.removed_ = self.removed_ + sign * np.bincount(flat, minlength=size).reshape(self.removed_.shape)
+
+    def get_state(self) -> Dict[str, Any]:
+        state = super().get_state()
+        state["cohorts"] = self.cohorts.values
+        return state
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        super().set_state(state)
+        self.cohorts = Vocabulary(state["cohorts"])
+
+    def _design(self, X: np.ndarray) -> np.ndarray:
+        return np.hstack([np.ones((len(X), 1)), (X - self.mean_) / self.scale_])
+
+    def _linear_predictor(self, X: np.ndarray) -> np.ndarray:
+        # Equals self._design(X) @ self.coef_ without materializing the design matrix.
+        weights = self.coef_[1:] / self.scale_
+        return X @ weights + (self.coef_[0] - self.mean_ @ weights)
+
+    def _newton(self, Z: np.ndarray, exposure: np.ndarray, observed: np.ndarray,
+                weights: np.ndarray, prior_precision: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        prior_mean = weights.copy()
+        for _ in range(self.max_iter):
+            mu = exposure * np.exp(np.clip(Z @ weights, -30, 30))
+            gradient = Z.T @ (mu - observed) + prior_precision @ (weights - prior_mean)
+            hessian = (Z * mu[:, None]).T @ Z + prior_precision
+            step = np.linalg.solve(hessian, gradient)
+            weights = weights - step
+            if np.max(np.abs(step)) < self.tol:
+                break
+        mu = exposure * np.exp(np.clip(Z @ weights, -30, 30))
+        return weights, (Z * mu[:, None]).T @ Z
+
     def fit(self, data: Any) -> None:
-        # Placeholder for fitting logic
-        print("Fitting TimeToHireModel")
+        """
+        Fit the model to the provided data.
 
-    def predict(self, data: Any) -> Any:
-        # Placeholder for prediction logic
-        print("Predicting with TimeToHireModel")
-        return None
+        Args:
+            data (Any): ``(X, durations, observed[, cohorts])``, a DataFrame with
+                ``time_to_hire_days``/``hired`` (and optional ``cohort``) columns, or an
+                object exposing ``features``, those ``labels`` and optional ``cohorts``.
 
-    def explain(self, data: Any) -> Any:
-        # Placeholder for explanation logic
-        print("Explaining TimeToHireModel predictions")
-        return None
+        Returns:
+            None
+        """
+        X, durations, observed, cohorts = split_survival_data(data)
+        if len(X) == 0:
+            raise ValueError("Cannot fit TimeToHireModel on an empty feature matrix")
+        self._reset()
+        self._accumulate(durations, observed, cohorts)
+
+        self.mean_ = X.mean(axis=0)
+        scale = X.std(axis=0)
+        self.scale_ = np.where(scale > 0, scale, 1.0)
+        exposure = np.maximum(durations, 1.0 / 24)
+        weights = np.zeros(X.shape[1] + 1)
+        weights[0] = np.log(max(observed.sum(), 0.5) / exposure.sum())
+        prior = np.diag(np.r_[1e-6, np.full(X.shape[1], self.l2)])
+        self.coef_, information = self._newton(self._design(X), exposure, observed, weights, prior)
+        self.precision_ = information + prior
+        logger.info(f"TimeToHireModel fitted on {len(X)} candidates ({int(observed.sum())} hires)")
+
+    def fit_batches(self, batches: Iterable[Any]) -> None:
+        """
+        Out-of-core equivalent of :meth:`fit`.
+
+        The first pass builds the Kaplan-Meier histograms and standardization
+        moments; each Newton iteration of the hazard model is one more pass
+        summing the gradient and Fisher information batch by batch.
+
+        Args:
+            batches (Iterable[Any]): Re-iterable batch source; see :meth:`BaseModel.fit_batches`.
+
+        Returns:
+            None
+        """
+        self._reset()
+        totals = np.zeros(2)  # observed events, exposure
+
+        def first_pass(batch: Any) -> np.ndarray:
+            X, durations, observed, cohorts = split_survival_data(batch)
+            self._accumulate(durations, observed, cohorts)
+            totals[:] += observed.sum(), np.maximum(durations, 1.0 / 24).sum()
+            return X
+
+        n, self.mean_, self.scale_ = _stream_moments(batches, first_pass)
+        weights = np.zeros(len(self.mean_) + 1)
+        weights[0] = np.log(max(totals[0], 0.5) / totals[1])
+        prior_mean = weights.copy()
+        prior = np.diag(np.r_[1e-6, np.full(len(self.mean_), self.l2)])
+        for _ in range(self.max_iter):
+            gradient, information = prior @ (weights - prior_mean), np.zeros_like(prior)
+            for batch in batches:
+                X, durations, observed, _ = split_survival_data(batch)
+                Z = self._design(X)
+                mu = np.maximum(durations, 1.0 / 24) * np.exp(np.clip(Z @ weights, -30, 30))
+                gradient += Z.T @ (mu - observed)
+                information += (Z * mu[:, None]).T @ Z
+            step = np.linalg.solve(information + prior, gradient)
+            weights = weights - step
+            if np.max(np.abs(step)) < self.tol:
+                break
+        # Information from the last pass; the final step is below tol, so it barely moves.
+        self.coef_, self.precision_ = weights, information + prior
+        logger.info(f"TimeToHireModel fitted out of core on {n} candidates ({int(totals[0])} hires)")
+
+    def partial_fit(self, data: Any, replaces: Any = None) -> None:
+        """
+        Update the model with new survival records without refitting from scratch.
+
+        Args:
+            data (Any): New or updated records, in any form accepted by :meth:`fit`.
+            replaces (Any): Earlier records superseded by ``data`` (e.g. candidates
+                previously censored who have since been hired). Their Kaplan-Meier
+                contributions are retracted; the hazard coefficients keep them, as
+                the Laplace-approximated posterior cannot be un-conditioned.
+
+        Returns:
+            None
+        """
+        if not self.is_fitted:
+            self.fit(data)
+            return
+        X, durations, observed, cohorts = split_survival_data(data)
+        if replaces is not None:
+            _, old_durations, old_observed, old_cohorts = split_survival_data(replaces)
+            self._accumulate(old_durations, old_observed, old_cohorts, sign=-1)
+        if len(X) == 0:
+            return
+        self._accumulate(durations, observed, cohorts)
+        exposure = np.maximum(durations, 1.0 / 24)
+        self.coef_, information = self._newton(self._design(X), exposure, observed, self.coef_, self.precision_)
+        self.precision_ = self.precision_ + information
+
+    def survival_curve(self, cohort: Optional[Any] = None) -> pd.Series:
+        """
+        Kaplan-Meier probability of still not being hired after each day.
+
+        Args:
+            cohort (Optional[Any]): Cohort label; pools all cohorts when omitted.
+
+        Returns:
+            pd.Series: Survival probability indexed by day.
+        """
+        if cohort is None:
+            events, removed = self.events_.sum(axis=0), self.removed_.sum(axis=0)
+        else:
+            code = self.cohorts.code(cohort)
+            if code < 0:
+                raise ValueError(f"Unknown cohort: {cohort}")
+            events, removed = self.events_[code], self.removed_[code]
+        at_risk = removed.sum() - np.r_[0.0, np.cumsum(removed)[:-1]]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            hazard = np.where(at_risk > 0, events / at_risk, 0.0)
+        return pd.Series(np.cumprod(1.0 - hazard), index=pd.RangeIndex(self.horizon_days, name="day"))
+
+    def median_days(self, cohort: Optional[Any] = None) -> float:
+        """
+        Kaplan-Meier median time to hire for a cohort, or NaN if never reached.
+        """
+        curve = self.survival_curve(cohort).to_numpy()
+        below = np.flatnonzero(curve <= 0.5)
+        return float(below[0]) if len(below) else float("nan")
+
+    def predict(self, data: Any) -> PredictionOutput:
+        """
+        Predict time to hire for a batch of candidates from their covariates.
+
+        Args:
+            data (Any): Feature matrix (array, DataFrame, or object exposing ``features``).
+
+        Returns:
+            PredictionOutput: Per-row ``median_days_to_hire`` and the probability of a
+                hire within ``hire_window_days``.
+        """
+        if not self.is_fitted:
+            raise RuntimeError("TimeToHireModel must be fitted before predicting")
+        X = as_feature_matrix(data)
+        if X.shape[1] != len(self.coef_) - 1:
+            raise ValueError(f"Expected {len(self.coef_) - 1} features, got {X.shape[1]}")
+        rate = np.exp(np.clip(self._linear_predictor(X), -30, 30))
+        return PredictionOutput(model_name=type(self).__name__, prediction={
+            "median_days_to_hire": np.log(2.0) / rate,
+            f"hire_probability_{self.hire_window_days}d": -np.expm1(-rate * self.hire_window_days),
+        })
+
+    def explain(self, data: Any, background_size: int = 100, top_k: int = 3, **options: Any) -> Explanation:
+        """
+        Per-candidate attributions of the probability of a hire within ``hire_window_days``.
+
+        Args:
+            data (Any): Rows to explain.
+            background_size (int): Background rows each feature is perturbed with.
+            top_k (int): Attributions kept per candidate.
+            **options: Further arguments of :func:`explain_predictions`.
+
+        Returns:
+            Explanation: Attributions of ``hire_probability_<window>d``.
+        """
+        return explain_predictions(self, data, f"hire_probability_{self.hire_window_days}d", background_size=background_size, top_k=top_k, **options)
 
 class FlightRiskDetector(BaseModel):
     """
     Predictive model for detecting flight risk.
+
+    Online logistic regression trained with AdaGrad. Feature standardization
+    uses running means and variances merged batch by batch, so every update
+    costs O(batch x features) time and the model holds O(features) state no
+    matter how much history it has seen. Scoring cost is constant per row.
     """
 
+    target = "dropped_out"
+    supports_partial_fit = True
+    state_attributes = ("n_seen_", "mean_", "m2_", "coef_", "grad_sq_")
+
+    def __init__(self, learning_rate: float = 0.5, l2: float = 1e-4, minibatch_size: int = 1024,
+                 epochs: int = 5, seed: int = 0) -> None:
+        self.learning_rate = learning_rate
+        self.l2 = l2
+        self.minibatch_size = minibatch_size
+        self.epochs = epochs
+        self.seed = seed
+        self._reset()
+
+    def _reset(self) -> None:
+        self.n_seen_ = 0
+        self.mean_: Optional[np.ndarray] = None
+        self.m2_: Optional[np.ndarray] = None
+        self.coef_: Optional[np.ndarray] = None  # intercept first
+        self.grad_sq_: Optional[np.ndarray] = None
+
+    @property
+    def is_fitted(self) -> bool:
+        return self.coef_ is not None and self.n_seen_ > 0
+
+    @property
+    def scale_(self) -> np.ndarray:
+        variance = self.m2_ / max(self.n_seen_ - 1, 1)
+        return np.where(variance > 0, np.sqrt(variance), 1.0)
+
+    def _update_moments(self, X: np.ndarray) -> None:
+        self.n_seen_, self.mean_, self.m2_ = merge_moments(self.n_seen_, self.mean_, self.m2_, X)
+
+    def _design(self, X: np.ndarray) -> np.ndarray:
+        return np.hstack([np.ones((len(X), 1)), (X - self.mean_) / self.scale_])
+
+    def _linear_predictor(self, X: np.ndarray) -> np.ndarray:
+        # Equals self._design(X) @ self.coef_ without materializing the design matrix.
+        weights = self.coef_[1:] / self.scale_
+        return X @ weights + (self.coef_[0] - self.mean_ @ weights)
+
     def fit(self, data: Any) -> None:
-        # Placeholder for fitting logic
-        print("Fitting FlightRiskDetector")
+        """
+        Fit the model from scratch with a few shuffled passes of minibatch updates.
 
-    def predict(self, data: Any) -> Any:
-        # Placeholder for prediction logic
-        print("Predicting with FlightRiskDetector")
-        return None
+        Args:
+            data (Any): ``(X, y)`` with binary ``dropped_out`` targets, a DataFrame with
+                that column, or an object exposing ``features`` and ``labels``.
 
-    def explain(self, data: Any) -> Any:
-        # Placeholder for explanation logic
-        print("Explaining FlightRiskDetector predictions")
-        return None
+        Returns:
+            None
+        """
+        X, y = split_features_target(data, self.target)
+        if len(X) == 0:
+            raise ValueError("Cannot fit FlightRiskDetector on an empty feature matrix")
+        self._reset()
+        self._update_moments(X)
+        rng = np.random.default_rng(self.seed)
+        for _ in range(self.epochs):
+            order = rng.permutation(len(X))
+            for start in range(0, len(X), self.minibatch_size):
+                rows = order[start:start + self.minibatch_size]
+                self._step(X[rows], y[rows])
+        logger.info(f"FlightRiskDetector fitted on {len(X)} rows")
+
+    def fit_batches(self, batches: Iterable[Any]) -> None:
+        """
+        Out-of-core equivalent of :meth:`fit`: one pass for the standardization
+        moments, then ``epochs`` passes of minibatch updates. Shuffling is left
+        to the batch source (``FeatureBatches`` reshuffles every pass).
+
+        Args:
+            batches (Iterable[Any]): Re-iterable batch source; see :meth:`BaseModel.fit_batches`.
+
+        Returns:
+            None
+        """
+        self._reset()
+        for batch in batches:
+            self._update_moments(split_features_target(batch, self.target)[0])
+        if not self.n_seen_:
+            raise ValueError("Cannot fit FlightRiskDetector on an empty batch stream")
+        for _ in range(self.epochs):
+            for batch in batches:
+                X, y = split_features_target(batch, self.target)
+                for start in range(0, len(X), self.minibatch_size):
+                    self._step(X[start:start + self.minibatch_size], y[start:start + self.minibatch_size])
+        logger.info(f"FlightRiskDetector fitted out of core on {self.n_seen_} rows")
+
+    def partial_fit(self, batch: Any) -> None:
+        """
+        Learn from a new batch of streamed examples without revisiting history.
+
+        Args:
+            batch (Any): New examples, in any form accepted by :meth:`fit`.
+
+        Returns:
+            None
+        """
+        X, y = split_features_target(batch, self.target)
+        if len(X) == 0:
+            return
+        if self.coef_ is not None and X.shape[1] != len(self.coef_) - 1:
+            raise ValueError(f"Expected {len(self.coef_) - 1} features, got {X.shape[1]}")
+        self._update_moments(X)
+        for start in range(0, len(X), self.minibatch_size):
+            self._step(X[start:start + self.minibatch_size], y[start:start + self.minibatch_size])
+
+    def _step(self, X: np.ndarray, y: np.ndarray) -> None:
+        Z = self._design(X)
+        if self.coef_ is None:
+            self.coef_ = np.zeros(Z.shape[1])
+            self.grad_sq_ = np.zeros(Z.shape[1])
+        gradient = Z.T @ (sigmoid(Z @ self.coef_) - y) / len(Z)
+        gradient[1:] += self.l2 * self.coef_[1:]
+        self.grad_sq_ = self.grad_sq_ + gradient ** 2
+        self.coef_ = self.coef_ - self.learning_rate * gradient / (np.sqrt(self.grad_sq_) + 1e-8)
+
+    def predict(self, data: Any) -> PredictionOutput:
+        """
+        Score a batch of candidates' flight risk.
+
+        Args:
+            data (Any): Feature matrix (array, DataFrame, or object exposing ``features``).
+
+        Returns:
+            PredictionOutput: ``prediction["flight_risk"]`` holds one probability per row.
+        """
+        if not self.is_fitted:
+            raise RuntimeError("FlightRiskDetector must be fitted before predicting")
+        X = as_feature_matrix(data)
+        if X.shape[1] != len(self.coef_) - 1:
+            raise ValueError(f"Expected {len(self.coef_) - 1} features, got {X.shape[1]}")
+        return PredictionOutput(model_name=type(self).__name__,
+                                prediction={"flight_risk": sigmoid(self._linear_predictor(X))})
+
+    def explain(self, data: Any, background_size: int = 100, top_k: int = 3, **options: Any) -> Explanation:
+        """
+        Per-candidate attributions of the flight risk.
+
+        Args:
+            data (Any): Rows to explain.
+            background_size (int): Background rows each feature is perturbed with.
+            top_k (int): Attributions kept per candidate.
+            **options: Further arguments of :func:`explain_predictions`.
+
+        Returns:
+            Explanation: Attributions of ``flight_risk``.
+        """
+        return explain_predictions(self, data, "flight_risk", background_size=background_size, top_k=top_k, **options)
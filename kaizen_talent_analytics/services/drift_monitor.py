@@ -0,0 +1,378 @@
+import logging
+import math
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from kaizen_talent_analytics.predictive_models import as_feature_matrix
+from kaizen_talent_analytics.services.feature_store import LABEL_NAMES
+
+logger = logging.getLogger(__name__)
+
+PSI_THRESHOLD = 0.2  # conventional "significant shift" level
+KS_THRESHOLD = 0.1
+OTHER_CATEGORY = "__other__"
+
+# Label and cohort columns that may ride along with training data but are not model features.
+NON_FEATURE_COLUMNS = (*LABEL_NAMES, "cohort")
+# ``FeatureSet`` attributes and the ``FeatureSet.frame()`` columns that carry them.
+FRAME_COLUMNS = {"cohorts": "cohort"}
+
+
+class QuantileSketch:
+    """
+    Mergeable, constant-memory quantile sketch with relative-error buckets (DDSketch).
+
+    A value ``x`` lands in bucket ``ceil(log_gamma(|x|))``, signed so that bucket
+    keys sort in value order, with one bucket for values near zero. Any quantile
+    is then known to within ``relative_accuracy`` of its value. Updates are one
+    vectorized bincount over the batch; merging adds counts key by key. When
+    more than ``max_buckets`` buckets are in use, the lowest ones are collapsed,
+    which only loses accuracy in the extreme lower tail.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048,
+                 min_value: float = 1e-9) -> None:
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.min_value = min_value
+        self._log_gamma = math.log((1 + relative_accuracy) / (1 - relative_accuracy))
+        # Bucket 0 holds every value with magnitude up to min_value.
+        self._key_offset = math.ceil(math.log(min_value) / self._log_gamma)
+        self.keys = np.empty(0, dtype=np.int64)  # sorted
+        self.counts = np.empty(0, dtype=np.float64)
+
+    @property
+    def count(self) -> float:
+        return float(self.counts.sum())
+
+    def key(self, values: np.ndarray) -> np.ndarray:
+        """
+        Bucket key of every value; keys are monotone in the value.
+        """
+        # float32 logs are several times faster and far finer than the 1% bucket width.
+        keys = np.abs(values).astype(np.float32)
+        np.clip(keys, self.min_value, np.finfo(np.float32).max, out=keys)
+        np.log(keys, out=keys)
+        keys *= np.float32(1 / self._log_gamma)
+        np.ceil(keys, out=keys)
+        keys -= self._key_offset
+        np.copysign(keys, values, out=keys)
+        return keys.astype(np.int64)
+
+    def value(self, keys: np.ndarray) -> np.ndarray:
+        """
+        Representative value of each bucket (within ``relative_accuracy`` of its members).
+        """
+        exponent = np.abs(keys) + self._key_offset
+        magnitude = 2 * np.exp(exponent * self._log_gamma) / (1 + math.exp(self._log_gamma))
+        return np.where(keys == 0, 0.0, np.sign(keys) * magnitude)
+
+    def _add(self, keys: np.ndarray, counts: np.ndarray) -> None:
+        merged = np.union1d(self.keys, keys)
+        totals = np.zeros(len(merged))
+        totals[np.searchsorted(merged, self.keys)] += self.counts
+        np.add.at(totals, np.searchsorted(merged, keys), counts)
+        if len(merged) > self.max_buckets:
+            excess = len(merged) - self.max_buckets
+            totals[excess] += totals[:excess].sum()
+            merged, totals = merged[excess:], totals[excess:]
+        self.keys, self.counts = merged, totals
+
+    def update(self, values: Any, weight: float = 1.0) -> None:
+        """
+        Add a batch of values, each counted ``weight`` times; NaNs are ignored.
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        missing = np.isnan(values)
+        if missing.any():
+            values = values[~missing]
+        if not len(values):
+            return
+        keys = self.key(values)
+        low = keys.min()
+        counts = np.bincount(keys - low)
+        present = np.flatnonzero(counts)
+        self._add(present + low, counts[present] * float(weight))
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """
+        Fold another sketch with the same accuracy into this one.
+        """
+        if other.relative_accuracy != self.relative_accuracy or other.min_value != self.min_value:
+            raise ValueError("Cannot merge sketches with different bucket layouts")
+        self._add(other.keys, other.counts)
+
+    def quantile(self, q: float) -> float:
+        """
+        Approximate ``q``-quantile of everything added so far; NaN when empty.
+        """
+        if not len(self.keys):
+            return float("nan")
+        rank = q * (self.count - 1)
+        position = int(np.searchsorted(np.cumsum(self.counts), rank, side="right"))
+        return float(self.value(self.keys[min(position, len(self.keys) - 1):][:1])[0])
+
+
+class CategoryCounts:
+    """
+    Mergeable count table of categorical values, capped at ``max_categories`` entries.
+
+    Values first seen after the cap is reached are counted under ``OTHER_CATEGORY``.
+    """
+
+    def __init__(self, max_categories: int = 1024) -> None:
+        self.max_categories = max_categories
+        self.counts: Dict[Any, float] = {}
+
+    @property
+    def count(self) -> float:
+        return float(sum(self.counts.values()))
+
+    def _add(self, value: Any, count: float) -> None:
+        if value not in self.counts and len(self.counts) >= self.max_categories:
+            value = OTHER_CATEGORY
+        self.counts[value] = self.counts.get(value, 0.0) + count
+
+    def update(self, values: Any, weight: float = 1.0) -> None:
+        """
+        Add a batch of categorical values, each counted ``weight`` times.
+        """
+        series = pd.Series(np.asarray(values, dtype=object).ravel(), dtype=object)
+        for value, count in series.value_counts(sort=False).items():
+            self._add(value, count * float(weight))
+
+    def merge(self, other: "CategoryCounts") -> None:
+        for value, count in other.counts.items():
+            self._add(value, count)
+
+
+@dataclass
+class DriftScore:
+    """
+    Dataclass of one feature's drift between the training and live distributions.
+    """
+    feature: str
+    kind: str  # "numeric" or "categorical"
+    psi: float
+    ks: Optional[float]  # None for categorical features
+    reference_count: float
+    live_count: float
+
+    @property
+    def drifted(self) -> bool:
+        return self.psi > PSI_THRESHOLD or (self.ks is not None and self.ks > KS_THRESHOLD)
+
+
+def _psi(reference: np.ndarray, live: np.ndarray, epsilon: float = 1e-4) -> float:
+    p = np.maximum(reference / max(reference.sum(), 1e-12), epsilon)
+    q = np.maximum(live / max(live.sum(), 1e-12), epsilon)
+    return float(np.sum((q - p) * np.log(q / p)))
+
+
+def numeric_drift(reference: QuantileSketch, live: QuantileSketch, bins: int = 10) -> Tuple[float, float]:
+    """
+    PSI and Kolmogorov-Smirnov distance between two sketches, in O(sketch size).
+
+    KS is the largest gap between the two bucketed CDFs. PSI uses ``bins``
+    equal-mass bins of the reference distribution, cut at bucket boundaries.
+
+    Returns:
+        Tuple[float, float]: ``(psi, ks)``; NaN when either sketch is empty.
+    """
+    if not reference.count or not live.count:
+        return float("nan"), float("nan")
+    keys = np.union1d(reference.keys, live.keys)
+    ref = np.zeros(len(keys))
+    ref[np.searchsorted(keys, reference.keys)] = reference.counts
+    cur = np.zeros(len(keys))
+    cur[np.searchsorted(keys, live.keys)] = live.counts
+    ref_cdf, cur_cdf = np.cumsum(ref) / ref.sum(), np.cumsum(cur) / cur.sum()
+    ks = float(np.max(np.abs(ref_cdf - cur_cdf)))
+    edges = np.unique(np.searchsorted(ref_cdf, np.arange(1, bins) / bins, side="left"))
+    starts = np.r_[0, edges[edges < len(keys) - 1] + 1]
+    return _psi(np.add.reduceat(ref, starts), np.add.reduceat(cur, starts)), ks
+
+
+def categorical_drift(reference: CategoryCounts, live: CategoryCounts) -> float:
+    """
+    PSI over the union of categories seen in either table; NaN when either is empty.
+    """
+    if not reference.count or not live.count:
+        return float("nan")
+    categories = list(reference.counts.keys() | live.counts.keys())
+    return _psi(np.array([reference.counts.get(c, 0.0) for c in categories]),
+                np.array([live.counts.get(c, 0.0) for c in categories]))
+
+
+def training_features(data: Any) -> Any:
+    """
+    The feature part of training input in any form accepted by ``fit``.
+    """
+    if isinstance(data, (tuple, list)):
+        return data[0]
+    if isinstance(data, pd.DataFrame):
+        # Cohorts stay: the monitor sketches them as a categorical feature.
+        return data.drop(columns=[c for c in LABEL_NAMES if c in data.columns])
+    return data
+
+
+class DriftMonitor:
+    """
+    Tracks per-feature distributions of training data and live traffic.
+
+    Each numeric feature keeps a ``QuantileSketch`` and each categorical one a
+    ``CategoryCounts`` table for the reference (training) data and for live
+    traffic. Memory is constant in the number of rows seen, updates cost one
+    vectorized pass per column, and sketches from other workers or shards can
+    be merged in. Drift scores are computed on demand from the sketches alone.
+    """
+
+    def __init__(self, feature_names: Optional[Sequence[str]] = None, categorical: Sequence[str] = ("cohorts",),
+                 relative_accuracy: float = 0.01, max_buckets: int = 2048, psi_bins: int = 10,
+                 max_rows: Optional[int] = 65_536, seed: int = 0) -> None:
+        """
+        Args:
+            feature_names (Optional[Sequence[str]]): Names of the feature matrix columns;
+                taken from the data (or numbered) on first update when omitted.
+            categorical (Sequence[str]): Features tracked as category counts: matrix
+                columns by name, or attributes/DataFrame columns of the input such as
+                ``FeatureSet.cohorts`` (the ``cohort`` column of ``FeatureSet.frame()``).
+                Ones absent from the input are skipped.
+            relative_accuracy (float): Quantile sketch accuracy.
+            max_buckets (int): Bucket cap per quantile sketch.
+            psi_bins (int): Reference-quantile bins used for numeric PSI.
+            max_rows (Optional[int]): Larger batches are sketched from an evenly spaced
+                sample of about this many rows, each weighted to stand for the rows it
+                skips, so an update costs the same for any batch size. None sketches every row.
+            seed (int): Seed of the sample offsets.
+        """
+        self.feature_names = list(feature_names) if feature_names is not None else None
+        self.categorical = tuple(categorical)
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.psi_bins = psi_bins
+        self.max_rows = max_rows
+        self._rng = np.random.default_rng(seed)
+        self._lock = threading.Lock()
+        self.reference: Dict[str, Any] = {}
+        self.live: Dict[str, Any] = {}
+
+    def _columns(self, data: Any) -> Tuple[Dict[str, np.ndarray], float]:
+        categories = {}
+        for name in self.categorical:
+            if isinstance(data, pd.DataFrame):
+                column = name if name in data.columns else FRAME_COLUMNS.get(name)
+                values = data[column] if column in data.columns else None
+            else:
+                values = getattr(data, name, None)
+            if values is not None and not isinstance(values, pd.DataFrame):
+                categories[name] = np.asarray(values)
+        if isinstance(data, pd.DataFrame):
+            dropped = {*self.categorical, *NON_FEATURE_COLUMNS}
+            data = data.drop(columns=[c for c in data.columns if c in dropped])
+        X = as_feature_matrix(data)
+        rows, weight = slice(None), 1.0
+        if self.max_rows and len(X) > self.max_rows:
+            step = -(-len(X) // self.max_rows)
+            rows = slice(int(self._rng.integers(step)), None, step)
+            weight = len(X) / len(range(len(X))[rows])
+        columns = {name: values[rows] for name, values in categories.items()}
+        if self.feature_names is None:
+            names = getattr(data, "feature_names", None)
+            if names is None and isinstance(data, pd.DataFrame):
+                names = data.columns
+            self.feature_names = [str(n) for n in names] if names is not None else [f"feature_{j}" for j in range(X.shape[1])]
+        if X.shape[1] != len(self.feature_names):
+            raise ValueError(f"Expected {len(self.feature_names)} features, got {X.shape[1]}")
+        # One transposed copy makes every column contiguous for the sketches.
+        for name, values in zip(self.feature_names, np.ascontiguousarray(X[rows].T, dtype=np.float64)):
+            columns[name] = values
+        return columns, weight
+
+    def _sketch(self, name: str) -> Any:
+        if name in self.categorical:
+            return CategoryCounts()
+        return QuantileSketch(self.relative_accuracy, self.max_buckets)
+
+    def _update(self, target: Dict[str, Any], data: Any) -> None:
+        with self._lock:
+            columns, weight = self._columns(data)
+            for name, values in columns.items():
+                if name not in target:
+                    target[name] = self._sketch(name)
+                target[name].update(values, weight)
+
+    def set_reference(self, data: Any) -> None:
+        """
+        Replace the reference distribution with training data (features only are used).
+        """
+        self.reset_reference()
+        self.update_reference(data)
+
+    def reset_reference(self) -> None:
+        """
+        Drop the reference sketches, e.g. before streaming a new training set into them.
+        """
+        with self._lock:
+            self.reference = {}
+
+    def update_reference(self, data: Any) -> None:
+        """
+        Add a batch of training data to the reference distribution, e.g. while streaming.
+        """
+        self._update(self.reference, training_features(data))
+
+    def update(self, data: Any) -> None:
+        """
+        Add a batch of live model input to the live distribution.
+        """
+        self._update(self.live, data)
+
+    def reset_live(self) -> None:
+        """
+        Start a new live window, e.g. after reporting or after retraining.
+        """
+        with self._lock:
+            self.live = {}
+
+    def merge(self, other: "DriftMonitor") -> None:
+        """
+        Fold another monitor's reference and live sketches into this one.
+        """
+        with self._lock:
+            for mine, theirs in ((self.reference, other.reference), (self.live, other.live)):
+                for name, sketch in theirs.items():
+                    if name not in mine:
+                        mine[name] = self._sketch(name)
+                    mine[name].merge(sketch)
+
+    def scores(self) -> Dict[str, DriftScore]:
+        """
+        Drift of every feature with both a reference and a live sketch.
+
+        Returns:
+            Dict[str, DriftScore]: Feature name to PSI (and KS for numeric features).
+        """
+        scores = {}
+        with self._lock:
+            for name, reference in self.reference.items():
+                live = self.live.get(name)
+                if live is None:
+                    continue
+                if isinstance(reference, QuantileSketch):
+                    psi, ks = numeric_drift(reference, live, self.psi_bins)
+                    scores[name] = DriftScore(name, "numeric", psi, ks, reference.count, live.count)
+                else:
+                    psi = categorical_drift(reference, live)
+                    scores[name] = DriftScore(name, "categorical", psi, None, reference.count, live.count)
+        return scores
+
+    def drifted(self) -> List[str]:
+        """
+        Features whose PSI or KS exceeds the drift thresholds.
+        """
+        return [name for name, score in self.scores().items() if score.drifted]
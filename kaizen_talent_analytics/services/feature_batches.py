@@ -0,0 +1,172 @@
+import json
+import logging
+import math
+import os
+import shutil
+import tempfile
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from kaizen_talent_analytics.connectors.ats_adapter import DEFAULT_CHUNK_SIZE, iter_ats_frames
+from kaizen_talent_analytics.data.categorical import new_vocabularies
+from kaizen_talent_analytics.data.event_index import CATEGORICAL_COLUMNS, EventIndex
+from kaizen_talent_analytics.services.feature_store import (
+    FEATURE_NAMES, FeatureSet, FeatureStore, load_feature_set, save_feature_set,
+)
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+DEFAULT_PARTITION_BYTES = 64 * 1024 * 1024
+DEFAULT_BATCH_SIZE = 8_192
+
+_SPILL_COLUMNS = [*CATEGORICAL_COLUMNS, "timestamp"]
+
+
+def _input_bytes(source: str) -> int:
+    if not os.path.isdir(source):
+        return os.path.getsize(source)
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(source) for name in names)
+
+
+def build_feature_partitions(sources: Sequence[str], directory: str, partitions: Optional[int] = None,
+                             partition_bytes: int = DEFAULT_PARTITION_BYTES,
+                             chunk_size: int = DEFAULT_CHUNK_SIZE, seed: int = 0) -> str:
+    """
+    Materialize candidate features from ATS history too large to hold in memory.
+
+    The first pass streams every source in chunks and appends each event to
+    one of ``partitions`` spill files chosen by a hash of its candidate, so a
+    candidate's whole history lands in one partition. The second pass builds
+    each partition's features with its own ``FeatureStore`` and saves them,
+    rows shuffled, as ``.npy`` files. Peak memory is one input chunk plus one
+    partition, no matter how long the history is.
+
+    Args:
+        sources (Sequence[str]): ATS exports (CSV/NDJSON, optionally gzipped) or
+            Parquet files and directories.
+        directory (str): Output directory; replaced if it already exists.
+        partitions (Optional[int]): Number of partitions; by default one per
+            ``partition_bytes`` of input.
+        partition_bytes (int): Input bytes per partition when ``partitions`` is omitted.
+        chunk_size (int): Rows read per chunk.
+        seed (int): Seed of the row shuffle inside each partition.
+
+    Returns:
+        str: ``directory``, ready to be read with ``FeatureBatches``.
+    """
+    if partitions is None:
+        partitions = max(1, math.ceil(sum(_input_bytes(s) for s in sources) / partition_bytes))
+    rng = np.random.default_rng(seed)
+    parent = os.path.dirname(os.path.abspath(directory))
+    os.makedirs(parent, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix=".partitions-", dir=parent)
+    spill_dir = os.path.join(tmp_dir, "events")
+    os.makedirs(spill_dir)
+    try:
+        as_of, events = -1, 0
+        for source in sources:
+            for frame in iter_ats_frames(source, chunk_size=chunk_size):
+                if frame.empty:
+                    continue
+                # Timestamps are parsed once here and spilled as epoch microseconds.
+                parsed = pd.to_datetime(frame["timestamp"], utc=True, format="ISO8601", errors="coerce")
+                valid = parsed.notna().to_numpy()
+                if not valid.all():
+                    logger.warning(f"Skipping {int((~valid).sum())} events with malformed timestamps in {source}")
+                    if not valid.any():
+                        continue
+                frame = frame.loc[valid, _SPILL_COLUMNS].assign(
+                    timestamp=parsed[valid].dt.as_unit("us").astype("int64").to_numpy())
+                as_of = max(as_of, int(frame["timestamp"].max()))
+                events += len(frame)
+                part = pd.util.hash_array(frame["candidate_id"].to_numpy(dtype=object), categorize=False) % partitions
+                for number, rows in frame.groupby(part, sort=False):
+                    path = os.path.join(spill_dir, f"events-{number:05d}.csv")
+                    rows.to_csv(path, mode="a", header=not os.path.exists(path), index=False)
+
+        manifest: Dict[str, Any] = {"as_of": as_of, "events": events, "feature_names": list(FEATURE_NAMES),
+                                    "partitions": []}
+        for name in sorted(os.listdir(spill_dir)):
+            spill = os.path.join(spill_dir, name)
+            store = FeatureStore(vocabularies=new_vocabularies(CATEGORICAL_COLUMNS))
+            for frame in iter_ats_frames(spill, chunk_size=chunk_size):
+                frame["timestamp"] = frame["timestamp"].astype(np.int64)
+                store.update(EventIndex.from_frame(frame, vocabularies=store.vocabularies))
+            os.remove(spill)
+            snapshot = store.snapshot(as_of=as_of)
+            part_name = f"part-{len(manifest['partitions']):05d}"
+            # Rows are stored in random order, so epochs can shuffle contiguous blocks instead of gathering rows.
+            save_feature_set(os.path.join(tmp_dir, part_name), snapshot.take(rng.permutation(len(snapshot))))
+            manifest["partitions"].append({"name": part_name, "rows": len(snapshot)})
+        os.rmdir(spill_dir)
+        with open(os.path.join(tmp_dir, MANIFEST_FILE), "w", encoding="utf-8") as handle:
+            json.dump(manifest, handle, indent=2)
+        shutil.rmtree(directory, ignore_errors=True)
+        os.replace(tmp_dir, directory)
+    except Exception:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    rows = sum(p["rows"] for p in manifest["partitions"])
+    logger.info(f"Built features for {rows} candidates from {events} events in {len(manifest['partitions'])} partitions")
+    return directory
+
+
+class FeatureBatches:
+    """
+    Re-iterable stream of ``FeatureSet`` batches over on-disk feature partitions.
+
+    Every ``iter()`` is one epoch. Partition rows were shuffled when they were
+    written; each epoch visits the partitions in a fresh random order and the
+    ``batch_size`` blocks inside each partition in a fresh random order too.
+    Batches are therefore zero-copy slices of memory-mapped arrays, and only
+    the partition being read is paged in. Pass it to ``BaseModel.fit_batches``
+    or ``ModelOrchestrator.fit_stream``.
+    """
+
+    def __init__(self, directory: str, batch_size: int = DEFAULT_BATCH_SIZE,
+                 shuffle: bool = True, seed: int = 0) -> None:
+        """
+        Args:
+            directory (str): Output of :func:`build_feature_partitions`.
+            batch_size (int): Maximum rows per batch; batches never span partitions.
+            shuffle (bool): Shuffle the partition and block order every epoch.
+            seed (int): Root seed; epoch ``e`` is shuffled with ``(seed, e)``.
+        """
+        self.directory = directory
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.seed = seed
+        with open(os.path.join(directory, MANIFEST_FILE), "r", encoding="utf-8") as handle:
+            manifest = json.load(handle)
+        self.as_of: int = manifest["as_of"]
+        self.feature_names = tuple(manifest["feature_names"])
+        self.partitions: List[Dict[str, Any]] = manifest["partitions"]
+        self._epochs = 0
+
+    def __len__(self) -> int:
+        return sum(p["rows"] for p in self.partitions)
+
+    def __iter__(self) -> Iterator[FeatureSet]:
+        epoch, self._epochs = self._epochs, self._epochs + 1
+        return self.epoch(epoch)
+
+    def epoch(self, number: int) -> Iterator[FeatureSet]:
+        """
+        Batches of one pass over every partition.
+
+        Args:
+            number (int): Epoch number, which determines the shuffle.
+
+        Returns:
+            Iterator[FeatureSet]: Batches of at most ``batch_size`` candidates.
+        """
+        rng = np.random.default_rng([self.seed, number])
+        order = rng.permutation(len(self.partitions)) if self.shuffle else range(len(self.partitions))
+        for position in order:
+            partition = load_feature_set(os.path.join(self.directory, self.partitions[position]["name"]))
+            starts = np.arange(0, len(partition), self.batch_size)
+            for start in rng.permutation(starts) if self.shuffle else starts:
+                yield partition.take(slice(start, start + self.batch_size))
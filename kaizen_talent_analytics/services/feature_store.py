@@ -0,0 +1,462 @@
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from kaizen_talent_analytics.data.categorical import Vocabulary
+from kaizen_talent_analytics.data.event_index import SHARED_VOCABULARIES, EventIndex
+from kaizen_talent_analytics.data.schema import EXIT_STAGES, FUNNEL_STAGES
+from kaizen_talent_analytics.data.timestamps import MICROS_PER_DAY
+from kaizen_talent_analytics.services.funnel_cube import EventDelta
+
+logger = logging.getLogger(__name__)
+
+# Sources one-hot encoded from each candidate's first funnel event; others encode as all zeros.
+FEATURE_SOURCES = ("LinkedIn", "Job Board", "Referral", "Career Fair")
+FEATURE_NAMES = ("events", "stage_depth", "days_active", "mean_gap_days") + tuple(
+    f"source_{s.lower().replace(' ', '_')}" for s in FEATURE_SOURCES
+)
+LABEL_NAMES = ("retained", "dropped_out", "hired", "time_to_hire_days")
+# Bumped whenever the meaning of the saved aggregates changes, so stale caches are ignored.
+STATE_VERSION = 2
+
+_NEVER = np.iinfo(np.int64).max
+_NONE = -1
+_WITHDRAWN = EXIT_STAGES.index("Withdrawn")
+_HIRED = FUNNEL_STAGES.index("Hired")
+
+# Per-candidate aggregates; all of them merge associatively across ingestion deltas.
+# Feature aggregates only see pipeline events before the outcome: the Hired and exit
+# events that define the labels (and anything after a hire) never reach them.
+_STATE_FIELDS = {
+    "events": (np.int64, 0),  # pre-outcome funnel events seen
+    "first_us": (np.int64, _NEVER),  # first pre-outcome funnel event
+    "last_us": (np.int64, _NONE),  # latest pre-outcome funnel event
+    "first_source": (np.int64, _NONE),  # source code of the first pre-outcome funnel event
+    "depth": (np.int64, _NONE),  # furthest FUNNEL_STAGES position reached before Hired
+    "hired_us": (np.int64, _NEVER),  # first Hired event
+    "exit_us": (np.int64, _NONE),  # latest exit event
+    "exit_kind": (np.int64, _NONE),  # EXIT_STAGES position of that exit event
+}
+
+
+def watermark_key(watermarks: Iterable[Any]) -> str:
+    """
+    Stable cache key for the ingestion state described by a set of watermarks.
+
+    Args:
+        watermarks (Iterable[Any]): ``Watermark`` records (anything with
+            ``source``, ``offset`` and ``rows``), one per ingested source.
+
+    Returns:
+        str: Hex digest that changes whenever any source advances.
+    """
+    parts = sorted(f"{w.source}\0{w.offset}\0{w.rows}" for w in watermarks)
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class FeatureSet:
+    """
+    Dataclass holding a read-only candidate x feature snapshot with its labels.
+
+    Satisfies the model input contract: ``features`` for prediction, ``labels``
+    for supervised targets and ``cohorts`` for the time-to-hire model.
+    """
+    candidate_ids: np.ndarray
+    features: np.ndarray  # candidates x FEATURE_NAMES, read-only
+    labels: Dict[str, np.ndarray]  # LABEL_NAMES -> one read-only array per candidate
+    cohorts: np.ndarray  # source of each candidate's first funnel event
+    last_event_us: np.ndarray  # latest event of any kind per candidate
+    as_of: int  # censoring time for open candidates, epoch microseconds
+    feature_names: Tuple[str, ...] = FEATURE_NAMES
+
+    def __len__(self) -> int:
+        return len(self.candidate_ids)
+
+    def frame(self) -> pd.DataFrame:
+        """
+        Features and labels as a DataFrame indexed by candidate ID.
+        """
+        frame = pd.DataFrame(self.features, columns=list(self.feature_names),
+                             index=pd.Index(self.candidate_ids, name="candidate_id"))
+        for name, values in self.labels.items():
+            frame[name] = values
+        frame["cohort"] = self.cohorts
+        return frame
+
+    def take(self, rows: np.ndarray) -> "FeatureSet":
+        """
+        Snapshot restricted to the given row positions.
+        """
+        return dataclasses.replace(
+            self,
+            candidate_ids=self.candidate_ids[rows],
+            features=self.features[rows],
+            labels={name: values[rows] for name, values in self.labels.items()},
+            cohorts=self.cohorts[rows],
+            last_event_us=self.last_event_us[rows],
+        )
+
+
+def _readonly(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+def save_feature_set(directory: str, features: FeatureSet) -> None:
+    """
+    Write a feature snapshot as ``.npy`` files that can be memory-mapped back.
+
+    Candidate IDs and cohorts are stored as fixed-width string arrays, so no
+    part of the mapped snapshot holds Python objects and every process mapping
+    it shares the same pages.
+
+    Args:
+        directory (str): Directory to create; must not exist yet.
+        features (FeatureSet): Snapshot to write.
+    """
+    os.makedirs(directory)
+    arrays = {
+        "features": features.features,
+        "candidate_ids": np.asarray(features.candidate_ids, dtype=str),
+        "cohorts": np.asarray(features.cohorts, dtype=str),
+        "last_event_us": features.last_event_us,
+        **{f"label_{name}": values for name, values in features.labels.items()},
+    }
+    for name, values in arrays.items():
+        np.save(os.path.join(directory, f"{name}.npy"), np.ascontiguousarray(values))
+    with open(os.path.join(directory, "meta.json"), "w", encoding="utf-8") as handle:
+        json.dump({"as_of": features.as_of, "feature_names": list(features.feature_names),
+                   "labels": list(features.labels)}, handle)
+
+
+def load_feature_set(directory: str) -> FeatureSet:
+    """
+    Memory-map a snapshot written by :func:`save_feature_set`, read-only.
+
+    Args:
+        directory (str): Directory written by :func:`save_feature_set`.
+
+    Returns:
+        FeatureSet: Snapshot whose arrays are backed by the files; slicing it copies nothing.
+    """
+    with open(os.path.join(directory, "meta.json"), "r", encoding="utf-8") as handle:
+        meta = json.load(handle)
+
+    def load(name: str) -> np.ndarray:
+        return np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+
+    return FeatureSet(
+        candidate_ids=load("candidate_ids"),
+        features=load("features"),
+        labels={name: load(f"label_{name}") for name in meta["labels"]},
+        cohorts=load("cohorts"),
+        last_event_us=load("last_event_us"),
+        as_of=meta["as_of"],
+        feature_names=tuple(meta["feature_names"]),
+    )
+
+
+def _segments(keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Unique keys of a key-sorted array with the first and last position of each run.
+    """
+    if not len(keys):
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, empty
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    ends = np.r_[starts[1:], len(keys)] - 1
+    return keys[starts], starts, ends
+
+
+class FeatureStore:
+    """
+    Stateful, incrementally maintained candidate feature matrix shared by all models.
+
+    Every candidate owns one row, addressed by its ``candidate_id`` vocabulary
+    code. Ingestion deltas are reduced to per-candidate aggregates with sorted
+    segment reductions and merged into the stored aggregates, after which only
+    the feature rows of the touched candidates are recomputed. Snapshots share
+    the materialized matrix read-only; the next update copies it first, so a
+    snapshot never changes under its reader. Materialized state can be saved to
+    and reloaded from ``cache_dir``, keyed by the ingestion watermark.
+    """
+
+    def __init__(self, vocabularies: Optional[Dict[str, Vocabulary]] = None,
+                 cache_dir: Optional[str] = None) -> None:
+        self.vocabularies = vocabularies if vocabularies is not None else SHARED_VOCABULARIES
+        self.cache_dir = cache_dir
+        self.max_timestamp = _NONE
+        self._state = {name: np.full(0, fill, dtype=dtype) for name, (dtype, fill) in _STATE_FIELDS.items()}
+        self._features = np.zeros((0, len(FEATURE_NAMES)))
+        self._shared = False
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        return len(self._features)
+
+    def _grow(self, size: int) -> None:
+        if size <= self.capacity:
+            return
+        capacity = max(size, 2 * self.capacity, 1024)
+        for name, (dtype, fill) in _STATE_FIELDS.items():
+            grown = np.full(capacity, fill, dtype=dtype)
+            grown[:self.capacity] = self._state[name]
+            self._state[name] = grown
+        features = np.zeros((capacity, len(FEATURE_NAMES)))
+        features[:self.capacity] = self._features
+        self._features, self._shared = features, False
+
+    def _stage_maps(self) -> Tuple[np.ndarray, np.ndarray]:
+        values = self.vocabularies["stage"].values
+        depth = np.array([FUNNEL_STAGES.index(v) if v in FUNNEL_STAGES else _NONE for v in values], dtype=np.int64)
+        exits = np.array([EXIT_STAGES.index(v) if v in EXIT_STAGES else _NONE for v in values], dtype=np.int64)
+        return depth, exits
+
+    def update(self, delta: EventDelta) -> np.ndarray:
+        """
+        Fold newly ingested events into the store and refresh the touched rows.
+
+        Events at or after a candidate's hire are kept out of the features. A
+        hire must therefore arrive no later than the events that follow it;
+        events already folded in are not retracted by a late, earlier hire.
+
+        Args:
+            delta (EventDelta): An ``EventIndex``, a validated frame, or a sequence of events.
+
+        Returns:
+            np.ndarray: Candidate codes whose features were recomputed.
+        """
+        if not isinstance(delta, EventIndex):
+            if len(delta) == 0:
+                return np.empty(0, dtype=np.int64)
+            if isinstance(delta, pd.DataFrame):
+                delta = EventIndex.from_frame(delta, vocabularies=self.vocabularies)
+            else:
+                delta = EventIndex.from_events(delta, vocabularies=self.vocabularies)
+        # Rows are addressed by this store's candidate codes; an index encoded elsewhere must be translated.
+        delta = delta.reencode(self.vocabularies)
+        if len(delta) == 0:
+            return np.empty(0, dtype=np.int64)
+
+        depth_of, exit_of = self._stage_maps()
+        candidates = delta.codes["candidate_id"].astype(np.int64)
+        # The index is time-sorted, so a stable sort by candidate keeps each run in time order.
+        order = np.argsort(candidates, kind="stable")
+        candidates = candidates[order]
+        timestamps = delta.timestamps[order]
+        stage = delta.codes["stage"][order].astype(np.int64)
+        depth, exit_kind = depth_of[stage], exit_of[stage]
+        source = delta.codes["source"][order].astype(np.int64)
+
+        with self._lock:
+            if self._shared:
+                self._features, self._shared = self._features.copy(), False
+            self._grow(int(candidates[-1]) + 1)
+            state = self._state
+
+            hired = depth == _HIRED
+            rows, starts, _ = _segments(candidates[hired])
+            state["hired_us"][rows] = np.minimum(state["hired_us"][rows], timestamps[hired][starts])
+
+            # Features describe the candidate before the outcome, so the hire and later events are left out.
+            funnel = (depth >= 0) & (depth < _HIRED) & (timestamps < state["hired_us"][candidates])
+            rows, starts, ends = _segments(candidates[funnel])
+            f_ts, f_depth, f_source = timestamps[funnel], depth[funnel], source[funnel]
+            state["events"][rows] += ends - starts + 1
+            earlier = f_ts[starts] < state["first_us"][rows]
+            state["first_us"][rows[earlier]] = f_ts[starts][earlier]
+            state["first_source"][rows[earlier]] = f_source[starts][earlier]
+            state["last_us"][rows] = np.maximum(state["last_us"][rows], f_ts[ends])
+            if len(rows):
+                state["depth"][rows] = np.maximum(state["depth"][rows], np.maximum.reduceat(f_depth, starts))
+
+            exited = exit_kind >= 0
+            rows, _, ends = _segments(candidates[exited])
+            later = timestamps[exited][ends] >= state["exit_us"][rows]
+            state["exit_us"][rows[later]] = timestamps[exited][ends][later]
+            state["exit_kind"][rows[later]] = exit_kind[exited][ends][later]
+
+            touched = np.unique(candidates)
+            self._features[touched] = self._feature_rows(touched)
+            self.max_timestamp = max(self.max_timestamp, int(delta.timestamps[-1]))
+        logger.debug(f"Recomputed features for {len(touched)} candidates from {len(delta)} events")
+        return touched
+
+    def _known_rows(self) -> np.ndarray:
+        state = self._state
+        return np.flatnonzero((state["events"] > 0) | (state["hired_us"] != _NEVER) | (state["exit_us"] >= 0))
+
+    def _feature_rows(self, rows: np.ndarray) -> np.ndarray:
+        state = {name: values[rows] for name, values in self._state.items()}
+        events = state["events"].astype(np.float64)
+        active = np.where(events > 0, (state["last_us"] - state["first_us"]) / MICROS_PER_DAY, 0.0)
+        out = np.zeros((len(rows), len(FEATURE_NAMES)))
+        out[:, 0] = events
+        out[:, 1] = np.maximum(state["depth"], 0)
+        out[:, 2] = active
+        out[:, 3] = active / np.maximum(events - 1, 1)
+        sources = self.vocabularies["source"]
+        for column, name in enumerate(FEATURE_SOURCES, start=4):
+            code = sources.code(name)
+            if code >= 0:
+                out[:, column] = state["first_source"] == code
+        return out
+
+    def subscribe_to(self, ingestor: Any) -> None:
+        """
+        Keep the store current by registering it as an ``ATSIngestor`` delta subscriber.
+        """
+        ingestor.subscribe(lambda source, events: self.update(events))
+
+    def snapshot(self, as_of: Optional[int] = None) -> FeatureSet:
+        """
+        Read-only features and labels for every candidate seen so far.
+
+        Labels: ``hired`` once a Hired event exists; ``dropped_out`` when the
+        latest event is a withdrawal; ``retained`` unless the latest event is an
+        exit. ``time_to_hire_days`` runs from the first event to the hire, or is
+        censored at the exit or at ``as_of`` for candidates still in the pipeline.
+        Features only reflect the pipeline before the outcome: Hired and exit
+        events are excluded, so ``stage_depth`` stops at Offer.
+
+        Args:
+            as_of (Optional[int]): Censoring time in epoch microseconds; defaults
+                to the latest ingested event.
+
+        Returns:
+            FeatureSet: Snapshot that is unaffected by later updates.
+        """
+        with self._lock:
+            state = self._state
+            rows = self._known_rows()
+            as_of = self.max_timestamp if as_of is None else as_of
+            first, last = state["first_us"][rows], state["last_us"][rows]
+            hired_us, exit_us = state["hired_us"][rows], state["exit_us"][rows]
+
+            hired = hired_us != _NEVER
+            exited = ~hired & (exit_us >= last)
+            start = np.where(first != _NEVER, first, np.where(hired, hired_us, exit_us))
+            end = np.where(hired, hired_us, np.where(exited, exit_us, max(as_of, 0)))
+            labels = {
+                "retained": ~exited,
+                "dropped_out": exited & (state["exit_kind"][rows] == _WITHDRAWN),
+                "hired": hired,
+                "time_to_hire_days": np.maximum(end - start, 0) / MICROS_PER_DAY,
+            }
+
+            source_codes = state["first_source"][rows]
+            cohorts = np.full(len(rows), "unknown", dtype=object)
+            known = source_codes >= 0
+            cohorts[known] = self.vocabularies["source"].decode(source_codes[known])
+
+            if len(rows) and rows[-1] == len(rows) - 1:
+                # Dense codes (the common case): share the materialized rows instead of copying.
+                features = self._features[:len(rows)]
+                self._shared = True
+            else:
+                features = self._features[rows]
+            return FeatureSet(
+                candidate_ids=_readonly(self.vocabularies["candidate_id"].decode(rows)),
+                features=_readonly(features),
+                labels={name: _readonly(values) for name, values in labels.items()},
+                cohorts=_readonly(cohorts),
+                last_event_us=_readonly(np.maximum.reduce([last, exit_us, np.where(hired, hired_us, _NONE)])),
+                as_of=int(as_of),
+            )
+
+    def _cache_path(self, watermarks: Iterable[Any]) -> str:
+        if not self.cache_dir:
+            raise ValueError("FeatureStore has no cache_dir configured")
+        return os.path.join(self.cache_dir, f"features-{watermark_key(watermarks)}")
+
+    def save(self, watermarks: Iterable[Any]) -> str:
+        """
+        Persist the materialized state, keyed by the watermarks it reflects.
+
+        Older cache entries are removed once the new one is in place.
+
+        Args:
+            watermarks (Iterable[Any]): Ingestion watermarks of every source fed to the store.
+
+        Returns:
+            str: Directory holding the cache entry.
+        """
+        path = self._cache_path(watermarks)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with self._lock:
+            rows = self._known_rows()
+            tmp_dir = tempfile.mkdtemp(prefix=".features-", dir=self.cache_dir)
+            np.save(os.path.join(tmp_dir, "features.npy"), self._features[rows])
+            for name, values in self._state.items():
+                np.save(os.path.join(tmp_dir, f"{name}.npy"), values[rows])
+            meta = {
+                "candidate_ids": [str(c) for c in self.vocabularies["candidate_id"].decode(rows)],
+                "sources": [str(s) for s in self.vocabularies["source"].values],
+                "max_timestamp": self.max_timestamp,
+                "feature_names": list(FEATURE_NAMES),
+                "state_version": STATE_VERSION,
+            }
+        with open(os.path.join(tmp_dir, "meta.json"), "w", encoding="utf-8") as handle:
+            json.dump(meta, handle)
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(tmp_dir, path)
+        for name in os.listdir(self.cache_dir):
+            stale = os.path.join(self.cache_dir, name)
+            if name.startswith("features-") and stale != path:
+                shutil.rmtree(stale, ignore_errors=True)
+        logger.info(f"Saved features for {len(rows)} candidates to {path}")
+        return path
+
+    def load(self, watermarks: Iterable[Any]) -> bool:
+        """
+        Restore state saved for exactly these watermarks, replacing the current state.
+
+        Args:
+            watermarks (Iterable[Any]): Ingestion watermarks the cache entry must match.
+
+        Returns:
+            bool: True if a matching cache entry was loaded.
+        """
+        path = self._cache_path(watermarks)
+        try:
+            with open(os.path.join(path, "meta.json"), "r", encoding="utf-8") as handle:
+                meta = json.load(handle)
+            if meta["feature_names"] != list(FEATURE_NAMES) or meta.get("state_version") != STATE_VERSION:
+                logger.info(f"Ignoring feature cache {path} built for a different feature schema")
+                return False
+            arrays = {name: np.load(os.path.join(path, f"{name}.npy")) for name in _STATE_FIELDS}
+            features = np.load(os.path.join(path, "features.npy"))
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"Ignoring unreadable feature cache {path}: {e}")
+            return False
+
+        # Codes are vocabulary-relative, so re-encode against this process's vocabularies.
+        rows = self.vocabularies["candidate_id"].encode(np.asarray(meta["candidate_ids"], dtype=object)).astype(np.int64)
+        source_map = self.vocabularies["source"].encode(np.asarray(meta["sources"], dtype=object)).astype(np.int64)
+        with self._lock:
+            self.max_timestamp = _NONE
+            self._state = {name: np.full(0, fill, dtype=dtype) for name, (dtype, fill) in _STATE_FIELDS.items()}
+            self._features, self._shared = np.zeros((0, len(FEATURE_NAMES))), False
+            self._grow(int(rows.max()) + 1 if len(rows) else 0)
+            for name, values in arrays.items():
+                if name == "first_source":
+                    values = np.where(values >= 0, source_map[np.maximum(values, 0)], _NONE)
+                self._state[name][rows] = values
+            self._features[rows] = features
+            self.max_timestamp = int(meta["max_timestamp"])
+        logger.info(f"Loaded features for {len(rows)} candidates from {path}")
+        return True
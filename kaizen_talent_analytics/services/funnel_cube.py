@@ -0,0 +1,163 @@
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from kaizen_talent_analytics.data.categorical import Vocabulary
+from kaizen_talent_analytics.data.event_index import SHARED_VOCABULARIES, EventIndex
+from kaizen_talent_analytics.data.schema import ATSEvent, FUNNEL_STAGES
+from kaizen_talent_analytics.data.timestamps import MICROS_PER_DAY, TimestampLike, to_epoch_us
+
+logger = logging.getLogger(__name__)
+
+CUBE_DIMENSIONS = ("stage", "source", "outcome")
+
+EventDelta = Union[EventIndex, pd.DataFrame, Sequence[ATSEvent], Sequence[Dict[str, Any]]]
+
+
+class FunnelCube:
+    """
+    Stateful aggregate of ATS event counts by day x stage x source x outcome.
+
+    Counts live in one dense int64 array indexed by day offset and by the
+    shared vocabulary codes of each dimension. Ingestion deltas are folded in
+    with a single bincount, and any date-range/source slice is answered by
+    summing the relevant block of the cube without touching raw events.
+    """
+
+    def __init__(self, vocabularies: Optional[Dict[str, Vocabulary]] = None) -> None:
+        self.vocabularies = vocabularies if vocabularies is not None else SHARED_VOCABULARIES
+        self._counts = np.zeros((0, 0, 0, 0), dtype=np.int64)
+        self._first_day = 0
+        self._lock = threading.Lock()
+
+    @property
+    def total(self) -> int:
+        return int(self._counts.sum())
+
+    def _grow(self, first_day: int, last_day: int) -> None:
+        days, *dims = self._counts.shape
+        if days == 0:
+            self._first_day = first_day
+        start = min(self._first_day, first_day)
+        end = max(self._first_day + days, last_day + 1)
+        shape = (end - start, *(max(d, len(self.vocabularies[name])) for d, name in zip(dims, CUBE_DIMENSIONS)))
+        if shape == self._counts.shape:
+            return
+        grown = np.zeros(shape, dtype=np.int64)
+        offset = self._first_day - start
+        grown[offset:offset + days, :dims[0], :dims[1], :dims[2]] = self._counts
+        self._counts, self._first_day = grown, start
+
+    def update(self, delta: EventDelta) -> int:
+        """
+        Fold a batch of newly ingested events into the cube.
+
+        Args:
+            delta (EventDelta): An ``EventIndex``, a validated frame, or a sequence of events.
+
+        Returns:
+            int: Number of events added.
+        """
+        if not isinstance(delta, EventIndex):
+            if len(delta) == 0:
+                return 0
+            if isinstance(delta, pd.DataFrame):
+                delta = EventIndex.from_frame(delta, vocabularies=self.vocabularies)
+            else:
+                delta = EventIndex.from_events(delta, vocabularies=self.vocabularies)
+        # The cube is indexed by this cube's codes; an index encoded elsewhere must be translated.
+        delta = delta.reencode(self.vocabularies)
+        if len(delta) == 0:
+            return 0
+
+        days = delta.timestamps // MICROS_PER_DAY
+        codes = [delta.codes[name].astype(np.int64) for name in CUBE_DIMENSIONS]
+        with self._lock:
+            # Timestamps are sorted, so the first and last rows bound the delta's days.
+            self._grow(int(days[0]), int(days[-1]))
+            shape = self._counts.shape
+            flat = np.ravel_multi_index((days - self._first_day, *codes), shape)
+            self._counts += np.bincount(flat, minlength=self._counts.size).reshape(shape)
+        return len(delta)
+
+    def subscribe_to(self, ingestor: Any) -> None:
+        """
+        Keep the cube current by registering it as an ``ATSIngestor`` delta subscriber.
+        """
+        ingestor.subscribe(lambda source, events: self.update(events))
+
+    def _codes(self, name: str, values: Optional[Iterable[str]]) -> Union[slice, List[int]]:
+        if values is None:
+            return slice(None)
+        vocabulary = self.vocabularies[name]
+        size = self._counts.shape[1 + CUBE_DIMENSIONS.index(name)]
+        return [c for c in (vocabulary.code(v) for v in values) if 0 <= c < size]
+
+    def slice(self, start_time: Optional[TimestampLike] = None, end_time: Optional[TimestampLike] = None,
+              sources: Optional[Iterable[str]] = None, outcomes: Optional[Iterable[str]] = None,
+              by: str = "stage") -> Dict[str, int]:
+        """
+        Count events in a date range, optionally restricted to sources and outcomes.
+
+        The cube has day granularity, so both bounds are inclusive of whole UTC days.
+
+        Args:
+            start_time (Optional[TimestampLike]): First day to include.
+            end_time (Optional[TimestampLike]): Last day to include.
+            sources (Optional[Iterable[str]]): Only count these sources.
+            outcomes (Optional[Iterable[str]]): Only count these outcomes.
+            by (str): Dimension to group the result by ("stage", "source" or "outcome").
+
+        Returns:
+            Dict[str, int]: Non-zero counts keyed by the ``by`` dimension's values.
+        """
+        if by not in CUBE_DIMENSIONS:
+            raise ValueError(f"Unknown funnel dimension: {by}")
+        with self._lock:
+            counts = self._counts
+            first_day = self._first_day
+            lo = 0 if start_time is None else to_epoch_us(start_time) // MICROS_PER_DAY - first_day
+            hi = counts.shape[0] if end_time is None else to_epoch_us(end_time) // MICROS_PER_DAY - first_day + 1
+            block = counts[max(lo, 0):max(hi, 0)]
+            block = block[:, :, self._codes("source", sources), :]
+            block = block[:, :, :, self._codes("outcome", outcomes)]
+            axis = 1 + CUBE_DIMENSIONS.index(by)
+            totals = block.sum(axis=tuple(a for a in range(4) if a != axis))
+        values = self.vocabularies[by].values
+        return {values[code]: int(totals[code]) for code in np.flatnonzero(totals)}
+
+    def daily(self, stage: str, start_time: Optional[TimestampLike] = None,
+              end_time: Optional[TimestampLike] = None) -> pd.Series:
+        """
+        Daily event counts for one stage, indexed by UTC date.
+        """
+        with self._lock:
+            code = self.vocabularies["stage"].code(stage)
+            if not 0 <= code < self._counts.shape[1]:
+                return pd.Series(dtype=np.int64)
+            series = self._counts[:, code].sum(axis=(1, 2))
+            first_day = self._first_day
+        index = pd.to_datetime(np.arange(first_day, first_day + len(series)), unit="D")
+        result = pd.Series(series, index=index)
+        if start_time is not None or end_time is not None:
+            start = None if start_time is None else pd.Timestamp(to_epoch_us(start_time) // MICROS_PER_DAY, unit="D")
+            end = None if end_time is None else pd.Timestamp(to_epoch_us(end_time) // MICROS_PER_DAY, unit="D")
+            result = result.loc[start:end]
+        return result
+
+    def funnel_frame(self, stages: Sequence[str] = FUNNEL_STAGES, **filters: Any) -> pd.DataFrame:
+        """
+        Funnel counts in a fixed stage order, shaped for the Dash funnel chart.
+
+        Args:
+            stages (Sequence[str]): Stages to report, in display order.
+            **filters (Any): Keyword arguments forwarded to :meth:`slice`.
+
+        Returns:
+            pd.DataFrame: ``Stage`` and ``Count`` columns, one row per requested stage.
+        """
+        counts = self.slice(by="stage", **filters)
+        return pd.DataFrame([{"Stage": stage, "Count": counts.get(stage, 0)} for stage in stages])
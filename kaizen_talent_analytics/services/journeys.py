@@ -0,0 +1,192 @@
+import logging
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from kaizen_talent_analytics.data.event_index import EventIndex
+from kaizen_talent_analytics.data.schema import ATS_STAGES, EXIT_STAGES
+from kaizen_talent_analytics.data.timestamps import MICROS_PER_DAY, MICROS_PER_SECOND
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class JourneySet:
+    """
+    Dataclass holding every candidate's ordered stage sequence in flat arrays.
+
+    Events are sorted by candidate and then time; journey ``j`` spans
+    ``stage[offsets[j]:offsets[j + 1]]``. Stage values are positions on the
+    ``stages`` axis, which is also the axis of every matrix.
+    """
+    stages: List[str]
+    candidate_ids: np.ndarray  # one per journey
+    offsets: np.ndarray  # n_journeys + 1 event offsets
+    stage: np.ndarray  # per event, position on the stages axis
+    timestamps: np.ndarray  # per event, epoch microseconds
+    transition_counts: np.ndarray  # stages x stages
+    dwell_mean_seconds: np.ndarray  # stages x stages, NaN where no transitions
+    dwell_median_seconds: np.ndarray  # stages x stages, NaN where no transitions
+
+    def __len__(self) -> int:
+        return len(self.candidate_ids)
+
+    @property
+    def lengths(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    @property
+    def first_timestamps(self) -> np.ndarray:
+        return self.timestamps[self.offsets[:-1]]
+
+    @property
+    def last_timestamps(self) -> np.ndarray:
+        return self.timestamps[self.offsets[1:] - 1]
+
+    @property
+    def last_stages(self) -> np.ndarray:
+        return self.stage[self.offsets[1:] - 1]
+
+    @property
+    def conversion_rates(self) -> np.ndarray:
+        """
+        Row-normalized transition matrix: P(next stage = j | leaving stage i).
+        """
+        outgoing = self.transition_counts.sum(axis=1, keepdims=True)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(outgoing > 0, self.transition_counts / outgoing, 0.0)
+
+    def first_reached(self, stage: str) -> np.ndarray:
+        """
+        Time each candidate first reached a stage.
+
+        Args:
+            stage (str): Stage label on the ``stages`` axis.
+
+        Returns:
+            np.ndarray: Epoch microseconds per journey, -1 where never reached.
+        """
+        if stage not in self.stages:
+            return np.full(len(self), -1, dtype=np.int64)
+        hit = np.where(self.stage == self.stages.index(stage), self.timestamps, np.iinfo(np.int64).max)
+        first = np.minimum.reduceat(hit, self.offsets[:-1]) if len(self) else hit[:0]
+        return np.where(first == np.iinfo(np.int64).max, -1, first)
+
+    def time_to_event(self, stage: str = "Hired", as_of: Optional[int] = None,
+                      exit_stages: Sequence[str] = EXIT_STAGES) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Survival-analysis arrays for the time from a candidate's first event to ``stage``.
+
+        Candidates who have not reached the stage are right-censored: at their
+        exit event if they left the funnel, otherwise at ``as_of`` because they
+        are still in the pipeline.
+
+        Args:
+            stage (str): Event of interest.
+            as_of (Optional[int]): Censoring time (epoch microseconds) for open
+                candidates; defaults to the latest event in the set.
+            exit_stages (Sequence[str]): Stages that end a journey without the event.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Durations in days and a boolean observed flag.
+        """
+        start = self.first_timestamps
+        reached = self.first_reached(stage)
+        observed = reached >= 0
+        if as_of is None:
+            as_of = int(self.timestamps.max()) if len(self.timestamps) else 0
+        exited = np.isin(self.last_stages, [self.stages.index(s) for s in exit_stages if s in self.stages])
+        end = np.where(observed, reached, np.where(exited, self.last_timestamps, as_of))
+        return np.maximum(end - start, 0) / MICROS_PER_DAY, observed
+
+    def reached_counts(self) -> np.ndarray:
+        """
+        Number of distinct candidates that reached each stage at least once.
+        """
+        journey = np.repeat(np.arange(len(self)), self.lengths)
+        pairs = np.unique(journey * len(self.stages) + self.stage)
+        return np.bincount(pairs % len(self.stages), minlength=len(self.stages))
+
+    def transition_frame(self) -> pd.DataFrame:
+        """
+        Long-format view of the non-empty transitions, convenient for plotting.
+        """
+        src, dst = np.nonzero(self.transition_counts)
+        return pd.DataFrame({
+            "from_stage": [self.stages[i] for i in src],
+            "to_stage": [self.stages[j] for j in dst],
+            "count": self.transition_counts[src, dst],
+            "conversion_rate": self.conversion_rates[src, dst],
+            "dwell_mean_seconds": self.dwell_mean_seconds[src, dst],
+            "dwell_median_seconds": self.dwell_median_seconds[src, dst],
+        })
+
+
+def _group_medians(values: np.ndarray, groups: np.ndarray, size: int) -> np.ndarray:
+    medians = np.full(size, np.nan)
+    if not len(values):
+        return medians
+    order = np.lexsort((values, groups))
+    values, groups = values[order], groups[order]
+    starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+    counts = np.diff(np.r_[starts, len(groups)])
+    medians[groups[starts]] = (values[starts + (counts - 1) // 2] + values[starts + counts // 2]) / 2
+    return medians
+
+
+def build_journeys(index: EventIndex, stages: Optional[Sequence[str]] = None) -> JourneySet:
+    """
+    Group events into per-candidate journeys and derive stage-transition statistics.
+
+    One lexsort orders events by candidate and time; journey boundaries are
+    where the candidate code changes. Transitions are consecutive event pairs
+    inside a journey, aggregated into dense matrices with bincount.
+
+    Args:
+        index (EventIndex): Events to group.
+        stages (Optional[Sequence[str]]): Stage axis order; defaults to ``ATS_STAGES``.
+            Stages seen in the data but not listed are appended.
+
+    Returns:
+        JourneySet: Journeys plus transition counts, conversion rates and dwell times.
+    """
+    vocabulary = index.vocabularies["stage"]
+    axis = list(stages or ATS_STAGES)
+    axis += [s for s in vocabulary.values if s not in axis]
+    to_axis = np.array([axis.index(s) for s in vocabulary.values], dtype=np.int64)
+    n_stages = len(axis)
+
+    candidates = index.codes["candidate_id"].astype(np.int64)
+    order = np.lexsort((index.timestamps, candidates))
+    candidates = candidates[order]
+    stage = to_axis[index.codes["stage"][order]] if len(order) else np.empty(0, dtype=np.int64)
+    timestamps = index.timestamps[order]
+
+    starts = np.flatnonzero(np.r_[True, candidates[1:] != candidates[:-1]]) if len(order) else np.empty(0, dtype=np.int64)
+    offsets = np.r_[starts, len(order)].astype(np.int64)
+
+    same = candidates[1:] == candidates[:-1]
+    pair = (stage[:-1] * n_stages + stage[1:])[same]
+    dwell = ((timestamps[1:] - timestamps[:-1])[same]) / MICROS_PER_SECOND
+
+    counts = np.bincount(pair, minlength=n_stages * n_stages)
+    totals = np.bincount(pair, weights=dwell, minlength=n_stages * n_stages)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(counts > 0, totals / np.maximum(counts, 1), np.nan)
+    median = _group_medians(dwell, pair, n_stages * n_stages)
+
+    shape = (n_stages, n_stages)
+    journeys = JourneySet(
+        stages=axis,
+        candidate_ids=index.vocabularies["candidate_id"].decode(candidates[starts]),
+        offsets=offsets,
+        stage=stage,
+        timestamps=timestamps,
+        transition_counts=counts.reshape(shape),
+        dwell_mean_seconds=mean.reshape(shape),
+        dwell_median_seconds=median.reshape(shape),
+    )
+    logger.info(f"Built {len(journeys)} candidate journeys from {len(index)} events")
+    return journeys
@@ -0,0 +1,213 @@
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+
+import numpy as np
+
+from kaizen_talent_analytics.data.schema import PredictionOutput
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Request:
+    row: np.ndarray
+    candidate_id: Optional[Any]
+    future: Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+@dataclass
+class BatcherMetrics:
+    """
+    Dataclass snapshot of micro-batching counters.
+    """
+    requests: int = 0
+    rejected: int = 0
+    batches: int = 0
+    failed_batches: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    mean_batch_size: float = 0.0
+    max_batch_size: int = 0
+    wait_ms_p50: float = 0.0
+    wait_ms_p99: float = 0.0
+    wait_ms_max: float = 0.0
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent single-candidate prediction requests into batched model calls.
+
+    Callers submit one feature row and get a future. A worker thread takes the
+    first waiting request, then keeps collecting until ``max_batch_size``
+    requests are gathered or ``max_wait_ms`` has passed since that first
+    request. It scores the batch with one ``predict_all`` call and fans the
+    per-row results back out to the callers' futures.
+    """
+
+    def __init__(self, orchestrator: Any, max_batch_size: int = 256, max_wait_ms: float = 5.0,
+                 max_queue: int = 10_000, window: int = 1024) -> None:
+        """
+        Args:
+            orchestrator (Any): ``ModelOrchestrator`` (anything with ``predict_all(data, candidate_ids)``).
+            max_batch_size (int): Largest batch handed to the models.
+            max_wait_ms (float): Longest a request waits for others to join its batch.
+            max_queue (int): Pending requests beyond this are rejected.
+            window (int): Number of recent requests the wait-time percentiles cover.
+        """
+        self.orchestrator = orchestrator
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._queue: "queue.Queue[_Request]" = queue.Queue(maxsize=max_queue)
+        self._waits: Deque[float] = deque(maxlen=window)
+        self._metrics = BatcherMetrics()
+        self._batched_rows = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    def start(self) -> "MicroBatcher":
+        """
+        Start the batching worker thread (idempotent).
+        """
+        if self._worker is None or not self._worker.is_alive():
+            self._stop.clear()
+            self._worker = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+            self._worker.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the worker after it finishes the batch in flight; queued requests are failed.
+        """
+        self._stop.set()
+        if self._worker is not None:
+            self._worker.join(timeout)
+            self._worker = None
+        while True:
+            try:
+                request = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            request.future.set_exception(RuntimeError("MicroBatcher stopped"))
+
+    def __enter__(self) -> "MicroBatcher":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def submit(self, row: Any, candidate_id: Optional[Any] = None) -> Future:
+        """
+        Queue one candidate's features for scoring. Requests are only served once
+        the worker runs (:meth:`start`, or use the batcher as a context manager).
+
+        Args:
+            row (Any): 1-D feature vector.
+            candidate_id (Optional[Any]): Candidate ID, enabling the orchestrator's row memo.
+
+        Returns:
+            Future: Resolves to ``{model name: PredictionOutput}`` with scalar predictions.
+        """
+        request = _Request(np.asarray(row, dtype=np.float64).ravel(), candidate_id, Future())
+        try:
+            self._queue.put_nowait(request)
+        except queue.Full:
+            with self._lock:
+                self._metrics.rejected += 1
+            raise RuntimeError(f"MicroBatcher queue is full ({self._queue.maxsize} pending requests)")
+        with self._lock:
+            self._metrics.requests += 1
+            depth = self._queue.qsize()
+            self._metrics.max_queue_depth = max(self._metrics.max_queue_depth, depth)
+        return request.future
+
+    def predict(self, row: Any, candidate_id: Optional[Any] = None,
+                timeout: Optional[float] = None) -> Dict[str, PredictionOutput]:
+        """
+        Score one candidate, blocking until its batch has been processed.
+
+        Args:
+            row (Any): 1-D feature vector.
+            candidate_id (Optional[Any]): Candidate ID.
+            timeout (Optional[float]): Seconds to wait for the result.
+
+        Returns:
+            Dict[str, PredictionOutput]: Per-model predictions for this candidate.
+        """
+        return self.submit(row, candidate_id).result(timeout)
+
+    def _collect(self) -> List[_Request]:
+        try:
+            first = self._queue.get(timeout=0.1)
+        except queue.Empty:
+            return []
+        batch = [first]
+        deadline = first.enqueued_at + self.max_wait_ms / 1000
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            batch = self._collect()
+            if batch:
+                self._process(batch)
+
+    def _process(self, batch: List[_Request]) -> None:
+        started = time.perf_counter()
+        ok = False
+        try:
+            X = np.vstack([request.row for request in batch])
+            ids = [request.candidate_id for request in batch]
+            # Coalesced batches are one-off compositions: skip the whole-batch cache, keep the row memo.
+            predictions = self.orchestrator.predict_all(X, candidate_ids=None if any(i is None for i in ids) else ids,
+                                                        cache=False)
+            if not predictions:
+                raise RuntimeError("All models failed for this batch")
+            for i, request in enumerate(batch):
+                request.future.set_result({
+                    name: PredictionOutput(model_name=output.model_name,
+                                           prediction={k: v[i].item() for k, v in output.prediction.items()})
+                    for name, output in predictions.items()
+                })
+            ok = True
+        except Exception as e:
+            logger.error(f"Error scoring a batch of {len(batch)} requests: {e}")
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+        with self._lock:
+            self._metrics.batches += 1
+            self._metrics.failed_batches += not ok
+            self._batched_rows += len(batch)
+            self._metrics.max_batch_size = max(self._metrics.max_batch_size, len(batch))
+            self._waits.extend((started - request.enqueued_at) * 1000 for request in batch)
+
+    def metrics(self) -> BatcherMetrics:
+        """
+        Current queue depth plus batch-size and wait-time statistics.
+
+        Returns:
+            BatcherMetrics: Counters since start; wait percentiles over the recent window.
+        """
+        with self._lock:
+            metrics = BatcherMetrics(**self._metrics.__dict__)
+            waits = np.fromiter(self._waits, dtype=np.float64)
+            batched = self._batched_rows
+        metrics.queue_depth = self._queue.qsize()
+        metrics.mean_batch_size = batched / metrics.batches if metrics.batches else 0.0
+        if len(waits):
+            metrics.wait_ms_p50, metrics.wait_ms_p99 = (float(p) for p in np.percentile(waits, [50, 99]))
+            metrics.wait_ms_max = float(waits.max())
+        return metrics
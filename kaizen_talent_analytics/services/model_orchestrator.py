@@ -1,21 +1,421 @@
+import copy
 import logging
-from typing import Any, Dict, Optional
-from kaizen_talent_analytics.predictive_models import RetentionModel, TimeToHireModel, FlightRiskDetector
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple, Type
+
+import numpy as np
+
+from kaizen_talent_analytics.data.schema import PredictionOutput
+from kaizen_talent_analytics.predictive_models import (
+    BaseModel, RetentionModel, TimeToHireModel, FlightRiskDetector, as_feature_matrix,
+)
+from kaizen_talent_analytics.services.drift_monitor import DriftMonitor, DriftScore
+from kaizen_talent_analytics.services.feature_store import FeatureSet
+from kaizen_talent_analytics.services.model_registry import ModelRegistry
+from kaizen_talent_analytics.services.prediction_cache import (
+    PredictionCache, RowMemo, content_hash, key_hashes, row_hashes,
+)
+from kaizen_talent_analytics.services.shared_models import SharedModelStore
+from kaizen_talent_analytics.services.tuning import ParamGrid, TuningResult, successive_halving
 
 logger = logging.getLogger(__name__)
 
+# Registry names of the orchestrated models, matching the keys of predict_all results.
+MODEL_CLASSES: Dict[str, Type[BaseModel]] = {
+    "retention": RetentionModel,
+    "time_to_hire": TimeToHireModel,
+    "flight_risk": FlightRiskDetector,
+}
+
+ModelTask = Tuple[Callable[..., Any], Tuple[Any, ...]]
+
+
+def _fit_context() -> Any:
+    """
+    Start method for fit workers: never plain fork, which would copy a process whose
+    serving threads may hold locks. Workers come from the single-threaded forkserver
+    where the platform has one, and are spawned elsewhere (e.g. on Windows).
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+@dataclass
+class ModelRunStatus:
+    """
+    Dataclass recording the outcome of one model's fit or predict call.
+    """
+    model: str
+    ok: bool
+    seconds: float
+    error: Optional[str] = None
+
+
+def _fit_model(model: BaseModel, data: Any) -> BaseModel:
+    # Module-level so it can run in a worker process; the fitted model is pickled back.
+    model.fit(data)
+    return model
+
+
+def _fit_model_batches(model: BaseModel, batches: Any) -> BaseModel:
+    model.fit_batches(batches)
+    return model
+
+
+def _refit_model(model: BaseModel, data: Any, incremental: bool, options: Dict[str, Any]) -> BaseModel:
+    # Train a copy, so predictions keep using the current model until it is swapped out.
+    model = copy.deepcopy(model)
+    if incremental:
+        model.partial_fit(data, **options)
+    else:
+        model.fit(data)
+    return model
+
+
+def _predict_model(model: BaseModel, data: Any) -> Any:
+    return model.predict(data)
+
+
+def _explain_model(model: BaseModel, data: Any, background_size: int, top_k: int, n_jobs: int) -> Any:
+    return model.explain(data, background_size=background_size, top_k=top_k, n_jobs=n_jobs)
+
+
 class ModelOrchestrator:
     """
     Orchestrates multiple predictive models with caching to simulate real-time compute vs reuse.
+
+    Models are created on first use. With a registry, first use loads the
+    current registered version from memory-mapped artifacts instead.
+
+    Predictions are cached under a content hash of the input plus a token of
+    the model state (a generation bumped on every refit or rollback, and the
+    registry versions in use), so a model change made through the orchestrator
+    can never serve stale results. A model fitted directly, e.g. through
+    ``retention_model.fit``, is not noticed: call :meth:`invalidate_cache`
+    afterwards. Inputs that cannot be content-hashed are predicted uncached.
+    When rows carry candidate IDs, a per-candidate memo additionally lets a
+    batch recompute only the candidates whose features changed.
+
+    With ``parallel=True`` the models run concurrently: fits in a process pool
+    (one worker per model, so wall-clock time approaches the slowest fit) and
+    predictions in a thread pool (numpy releases the GIL for the heavy work).
+    Both pools are started on first use and reused; a pool is only replaced
+    after a task overran ``timeout``, so abandoned work never starves later
+    calls. Each model gets its own status; one failing or timing out no
+    longer stops the others. Call :meth:`close` to release the pools.
     """
 
-    def __init__(self) -> None:
-        self.retention_model = RetentionModel()
-        self.time_to_hire_model = TimeToHireModel()
-        self.flight_risk_detector = FlightRiskDetector()
-        self._cache: Dict[str, Any] = {}
+    def __init__(self, registry: Optional[ModelRegistry] = None,
+                 feature_names: Optional[Sequence[str]] = None,
+                 cache: Optional[PredictionCache] = None, row_memo: Optional[RowMemo] = None,
+                 parallel: bool = False, max_workers: Optional[int] = None,
+                 timeout: Optional[float] = None, drift_monitor: Optional[DriftMonitor] = None,
+                 shared: Optional[SharedModelStore] = None) -> None:
+        """
+        Args:
+            registry (Optional[ModelRegistry]): Source of versioned models and target of ``save_all``.
+            feature_names (Optional[Sequence[str]]): Feature schema checked against registered models.
+            cache (Optional[PredictionCache]): Whole-batch prediction cache.
+            row_memo (Optional[RowMemo]): Per-candidate prediction memo.
+            parallel (bool): Run models concurrently (processes for fit, threads for predict).
+            max_workers (Optional[int]): Pool size; defaults to one worker per model.
+            timeout (Optional[float]): Per-model deadline in seconds for parallel runs. A
+                timed-out fit's worker process is terminated; a timed-out prediction
+                thread is abandoned and its result discarded. Either way the pool is
+                replaced, so the next call gets a full set of workers.
+            drift_monitor (Optional[DriftMonitor]): Sketches of training and live feature
+                distributions; fits set its reference and uncached predictions feed it.
+            shared (Optional[SharedModelStore]): Cross-process store of published models and
+                features. Whenever its generation advances, the next prediction first
+                attaches the new generation read-only and swaps its models in.
+        """
+        self.registry = registry
+        self.feature_names = feature_names
+        self._models: Dict[str, BaseModel] = {}
+        self._versions: Dict[str, Optional[int]] = {}
+        self._models_lock = threading.Lock()
+        self._generation = 0
+        self._cache = cache if cache is not None else PredictionCache()
+        self._row_memo = row_memo if row_memo is not None else RowMemo()
+        self.parallel = parallel
+        self.max_workers = max_workers or len(MODEL_CLASSES)
+        self.timeout = timeout
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._processes: Optional[Any] = None  # multiprocessing Pool for fits
+        self.last_status: Dict[str, ModelRunStatus] = {}
+        self.drift_monitor = drift_monitor if drift_monitor is not None else DriftMonitor(feature_names)
+        self.shared = shared
+        self._shared_features: Optional[FeatureSet] = None
+        self._shared_generation = 0
+
+    def model(self, name: str) -> BaseModel:
+        """
+        The model registered under ``name``, loading or creating it on first use.
+
+        Args:
+            name (str): One of ``MODEL_CLASSES``.
+
+        Returns:
+            BaseModel: The live model instance.
+        """
+        model = self._models.get(name)
+        if model is None:
+            with self._models_lock:
+                model = self._models.get(name)
+                if model is None:
+                    model, self._versions[name] = self._load(name)
+                    self._models[name] = model
+        return model
+
+    def _load(self, name: str):
+        version = self.registry.current_version(name) if self.registry else None
+        if version is not None:
+            try:
+                return self.registry.load(name, version, feature_names=self.feature_names), version
+            except Exception as e:
+                logger.error(f"Error loading {name} v{version} from the registry: {e}")
+        return MODEL_CLASSES[name](), None
+
+    @property
+    def retention_model(self) -> RetentionModel:
+        return self.model("retention")
+
+    @property
+    def time_to_hire_model(self) -> TimeToHireModel:
+        return self.model("time_to_hire")
+
+    @property
+    def flight_risk_detector(self) -> FlightRiskDetector:
+        return self.model("flight_risk")
+
+    @property
+    def model_versions(self) -> Dict[str, Optional[int]]:
+        """
+        Registry version of each loaded model; None for models not (yet) saved.
+        """
+        return dict(self._versions)
+
+    def _model_token(self) -> Tuple[Hashable, ...]:
+        return (self._generation, *sorted(self._versions.items()))
+
+    def _snapshot(self) -> Tuple[Dict[str, BaseModel], Tuple[Hashable, ...]]:
+        """
+        Every model together with the token describing exactly those models.
+
+        Models are swapped before the generation is bumped, both under the lock, so
+        a snapshot never pairs a new token with an old model; results computed from
+        it may be cached under its token even if a refit lands in the meantime.
+        """
+        for name in MODEL_CLASSES:
+            self.model(name)  # resolve lazily loaded versions before keying the cache
+        with self._models_lock:
+            return {name: self._models[name] for name in MODEL_CLASSES}, self._model_token()
+
+    def _models_changed(self) -> None:
+        """
+        Bump the generation and drop cached predictions made by the previous models.
+        """
+        with self._models_lock:
+            self._generation += 1
+            token = self._model_token()
+        dropped = self._cache.invalidate(lambda key: key[1] != token)
+        self._row_memo.reset(token)
+        logger.debug(f"Invalidated {dropped} cached predictions after a model change")
+
+    def invalidate_cache(self) -> None:
+        """
+        Drop cached predictions and explanations, e.g. after fitting a model directly.
+        """
+        self._models_changed()
+
+    def _sync_shared(self) -> None:
+        """
+        Attach the latest published generation if it is newer than the one being served.
+        """
+        if self.shared is None:
+            return
+        generation = self.shared.generation
+        if generation == self._shared_generation:
+            return
+        try:
+            attached = self.shared.attach(generation, feature_names=self.feature_names)
+        except Exception as e:
+            logger.error(f"Error attaching shared generation {generation}: {e}")
+            self._shared_generation = generation  # wait for the next one instead of retrying every call
+            return
+        with self._models_lock:
+            self._models.update(attached.models)
+            self._versions.update(dict.fromkeys(attached.models))
+            self._shared_features = attached.features
+            self._shared_generation = generation
+        self._models_changed()
+        logger.info(f"Attached shared generation {generation}")
+
+    @property
+    def shared_features(self) -> Optional[FeatureSet]:
+        """
+        Candidate features of the latest shared generation (read-only, memory-mapped), if published.
+        """
+        self._sync_shared()
+        return self._shared_features
+
+    def publish(self, features: Optional[FeatureSet] = None) -> int:
+        """
+        Publish the current models (and optionally a feature snapshot) to the shared store.
+
+        Every orchestrator attached to the store, in any process, swaps to them
+        on its next prediction.
 
-    def fit_all(self, data: Any) -> None:
+        Args:
+            features (Optional[FeatureSet]): Candidate features to serve alongside the models.
+
+        Returns:
+            int: The published generation.
+        """
+        if self.shared is None:
+            raise ValueError("ModelOrchestrator has no shared store configured")
+        models = {name: self.model(name) for name in MODEL_CLASSES}
+        generation = self.shared.publish(models, features, feature_names=self.feature_names)
+        # This process already serves these models; only the others need to attach.
+        self._shared_generation, self._shared_features = generation, features
+        return generation
+
+    @property
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Prediction cache hit/miss/eviction counters and size.
+        """
+        return self._cache.counters()
+
+    def close(self) -> None:
+        """
+        Shut down the fit process pool and the prediction thread pool, if started.
+        """
+        self._retire(processes=True)
+        self._retire(processes=False)
+
+    def _retire(self, processes: bool) -> None:
+        # Terminating the process pool also stops fits running past their deadline; abandoned
+        # threads cannot be stopped, so their executor is left to finish them in the background.
+        if processes and self._processes is not None:
+            self._processes.terminate()
+            self._processes = None
+        elif not processes and self._threads is not None:
+            self._threads.shutdown(wait=False, cancel_futures=True)
+            self._threads = None
+
+    def _run_serial(self, tasks: Dict[str, ModelTask]) -> Tuple[Dict[str, Any], Dict[str, ModelRunStatus]]:
+        results, status = {}, {}
+        for name, (fn, args) in tasks.items():
+            started = time.perf_counter()
+            try:
+                results[name] = fn(*args)
+                status[name] = ModelRunStatus(name, True, time.perf_counter() - started)
+            except Exception as e:
+                status[name] = ModelRunStatus(name, False, time.perf_counter() - started, f"{type(e).__name__}: {e}")
+        return results, status
+
+    def _run_parallel(self, tasks: Dict[str, ModelTask], processes: bool) -> Tuple[Dict[str, Any], Dict[str, ModelRunStatus]]:
+        results, status, finished = {}, {}, {}
+        if processes and self._processes is None:
+            self._processes = _fit_context().Pool(self.max_workers)
+        if not processes and self._threads is None:
+            self._threads = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="model")
+        started = time.perf_counter()
+        handles, overran = {}, False
+        for name, (fn, args) in tasks.items():
+            mark = lambda *_, name=name: finished.setdefault(name, time.perf_counter())
+            if processes:
+                handles[name] = self._processes.apply_async(fn, args, callback=mark, error_callback=mark).get
+            else:
+                future = self._threads.submit(fn, *args)
+                future.add_done_callback(mark)
+                handles[name] = future.result
+        for name, get in handles.items():
+            remaining = None if self.timeout is None else max(0.0, started + self.timeout - time.perf_counter())
+            try:
+                results[name] = get(remaining)
+                status[name] = ModelRunStatus(name, True, finished.get(name, time.perf_counter()) - started)
+            except (TimeoutError, multiprocessing.TimeoutError):
+                status[name] = ModelRunStatus(name, False, time.perf_counter() - started,
+                                              f"timed out after {self.timeout}s")
+                overran = True
+            except Exception as e:
+                status[name] = ModelRunStatus(name, False, finished.get(name, time.perf_counter()) - started,
+                                              f"{type(e).__name__}: {e}")
+        if overran:
+            # Overrunning tasks still hold workers: give later calls fresh ones.
+            self._retire(processes)
+        return results, status
+
+    def _run_models(self, action: str, tasks: Dict[str, ModelTask]) -> Dict[str, Any]:
+        """
+        Run one task per model, serially or concurrently, and record per-model status.
+
+        Args:
+            action (str): "fit" (processes when parallel), "predict" or "explain" (threads when parallel).
+            tasks (Dict[str, ModelTask]): Function and arguments per model name.
+
+        Returns:
+            Dict[str, Any]: Results of the models that succeeded.
+        """
+        if self.parallel and len(tasks) > 1:
+            results, status = self._run_parallel(tasks, processes=action == "fit")
+        else:
+            results, status = self._run_serial(tasks)
+        for name, outcome in status.items():
+            if not outcome.ok:
+                logger.error(f"Error during {action} of {name}: {outcome.error}")
+        self.last_status = status
+        return results
+
+    def save_all(self, metrics: Optional[Dict[str, Dict[str, float]]] = None) -> Dict[str, int]:
+        """
+        Register every fitted model as a new version and make it current.
+
+        Args:
+            metrics (Optional[Dict[str, Dict[str, float]]]): Evaluation metrics per model name.
+
+        Returns:
+            Dict[str, int]: New version per saved model.
+        """
+        if self.registry is None:
+            raise RuntimeError("ModelOrchestrator has no model registry")
+        saved = {}
+        for name, model in list(self._models.items()):
+            if not getattr(model, "is_fitted", True):
+                continue
+            record = self.registry.register(name, model, metrics=(metrics or {}).get(name),
+                                            feature_names=self.feature_names)
+            self._versions[name] = saved[name] = record.version
+        self._models_changed()
+        return saved
+
+    def rollback(self, name: str, version: Optional[int] = None) -> int:
+        """
+        Roll a model back to an earlier registered version; it is reloaded on next use.
+
+        Args:
+            name (str): One of ``MODEL_CLASSES``.
+            version (Optional[int]): Target version; defaults to the one before the current.
+
+        Returns:
+            int: The version that is now current.
+        """
+        if self.registry is None:
+            raise RuntimeError("ModelOrchestrator has no model registry")
+        version = self.registry.rollback(name, version)
+        with self._models_lock:
+            self._models.pop(name, None)
+            self._versions.pop(name, None)
+        self._models_changed()
+        return version
+
+    def fit_all(self, data: Any) -> Dict[str, ModelRunStatus]:
         """
         Fit all models on the provided data.
 
@@ -23,61 +423,278 @@ class ModelOrchestrator:
             data (Any): Training data for models.
 
         Returns:
-            None
+            Dict[str, ModelRunStatus]: Outcome per model; failures are logged, not raised.
+        """
+        status = self._fit(_fit_model, data)
+        if any(s.ok for s in status.values()):
+            self._track(self.drift_monitor.set_reference, data)
+        return status
+
+    def fit_stream(self, batches: Any) -> Dict[str, ModelRunStatus]:
+        """
+        Fit all models out of core, streaming the training data batch by batch.
+
+        Alternative entry point to :meth:`fit_all` for history that does not
+        fit in memory; see ``BaseModel.fit_batches``.
+
+        Args:
+            batches (Any): Re-iterable batch source, e.g. ``FeatureBatches``; every
+                iteration is one pass over the data. With ``parallel=True`` it is
+                pickled to each worker process, which streams it independently.
+
+        Returns:
+            Dict[str, ModelRunStatus]: Outcome per model; failures are logged, not raised.
         """
+        status = self._fit(_fit_model_batches, batches)
+        if any(s.ok for s in status.values()):
+            # One extra pass rebuilds the reference sketches; they stay constant-size.
+            self.drift_monitor.reset_reference()
+            for batch in batches:
+                if not self._track(self.drift_monitor.update_reference, batch):
+                    break
+        return status
+
+    def _track(self, update: Callable[[Any], None], data: Any) -> bool:
         try:
-            self.retention_model.fit(data)
-            self.time_to_hire_model.fit(data)
-            self.flight_risk_detector.fit(data)
-            logger.info("All models fitted successfully.")
+            update(data)
+            return True
         except Exception as e:
-            logger.error(f"Error fitting models: {e}")
-            # TODO: Add more sophisticated error handling
+            logger.error(f"Error updating drift sketches: {e}")
+            return False
+
+    def drift_report(self) -> Dict[str, DriftScore]:
+        """
+        Drift of live model input from the data the models were fitted on.
+
+        Returns:
+            Dict[str, DriftScore]: PSI/KS per feature; see ``DriftMonitor.scores``.
+        """
+        return self.drift_monitor.scores()
+
+    def _fit(self, fit: Callable[[BaseModel, Any], BaseModel], data: Any) -> Dict[str, ModelRunStatus]:
+        models = {name: self.model(name) for name in MODEL_CLASSES}
+        fitted = self._run_models("fit", {name: (fit, (model, data)) for name, model in models.items()})
+        with self._models_lock:
+            # Models fitted in worker processes come back as new objects.
+            self._models.update(fitted)
+            # Refitted models no longer match any registered version until saved again.
+            self._versions.update(dict.fromkeys(fitted))
+        if len(fitted) == len(models):
+            logger.info("All models fitted successfully.")
+        self._models_changed()
+        return dict(self.last_status)
 
-    def predict_all(self, data: Any) -> Dict[str, Any]:
+    def refit(self, name: str, data: Any, incremental: bool = False, **options: Any) -> ModelRunStatus:
+        """
+        Retrain one model and swap it in once training has finished.
+
+        Training runs on a copy of the current model, so concurrent
+        ``predict_all`` calls keep being served by the old one until the swap.
+
+        Args:
+            name (str): One of ``MODEL_CLASSES``.
+            data (Any): Training data, or the new batch when ``incremental``.
+            incremental (bool): Update with ``partial_fit`` instead of refitting from scratch.
+            **options: Further arguments of ``partial_fit`` (e.g. ``replaces``).
+
+        Returns:
+            ModelRunStatus: Outcome of the retraining; failures are logged, not raised.
+        """
+        # Runs in the calling thread; its status is returned rather than written to last_status,
+        # which belongs to the serving path.
+        fitted, status = self._run_serial({name: (_refit_model, (self.model(name), data, incremental, options))})
+        if not status[name].ok:
+            logger.error(f"Error during refit of {name}: {status[name].error}")
+        if name in fitted:
+            with self._models_lock:
+                self._models[name] = fitted[name]
+                self._versions[name] = None
+            self._models_changed()
+        return status[name]
+
+    def tune(self, name: str, data: Any, param_grid: ParamGrid, **options: Any) -> TuningResult:
+        """
+        Search hyperparameters for one model, then refit it on all of ``data`` with the best ones.
+
+        With a registry, the refitted model is registered and made current,
+        with the cross-validated score as its metric and the full search record
+        stored alongside it (``ModelRegistry.tuning``).
+
+        Args:
+            name (str): One of ``MODEL_CLASSES`` with a binary target ("retention", "flight_risk").
+            data (Any): Training data.
+            param_grid (ParamGrid): Candidate constructor arguments.
+            **options: Further arguments of ``successive_halving`` (metric, n_folds, eta, processes, ...).
+
+        Returns:
+            TuningResult: The search outcome.
+        """
+        cls = MODEL_CLASSES[name]
+        result = successive_halving(cls, data, param_grid, **options)
+        model = cls(**result.best_params)
+        model.fit(data)
+        with self._models_lock:
+            self._models[name] = model
+            self._versions[name] = None
+        if self.registry is not None:
+            record = self.registry.register(name, model, metrics={result.metric: result.best_score},
+                                            feature_names=self.feature_names, tuning=result.to_dict())
+            self._versions[name] = record.version
+        self._models_changed()
+        logger.info(f"Tuned {name}: {result.best_params} ({result.metric}={result.best_score:.4f})")
+        return result
+
+    def predict_all(self, data: Any, candidate_ids: Optional[Sequence[Any]] = None,
+                    cache: bool = True) -> Dict[str, Any]:
         """
         Predict using all models, with memoization to cache results.
 
         Args:
             data (Any): Input data for prediction.
+            candidate_ids (Optional[Sequence[Any]]): Candidate of each row; defaults to
+                ``data.candidate_ids`` when present. With IDs, rows whose candidate and
+                features were already scored by the current models are served from the
+                row memo and only the remaining rows are run through the models.
+            cache (bool): Look up and store the whole batch in the prediction cache.
+                Pass False for one-off batch compositions (e.g. coalesced requests),
+                which would never hit again and only evict useful entries; the row
+                memo is still used.
 
         Returns:
             Dict[str, Any]: Dictionary of model names to prediction results.
         """
-        cache_key = str(data)
-        if cache_key in self._cache:
+        self._sync_shared()
+        models, token = self._snapshot()
+        if candidate_ids is None:
+            candidate_ids = getattr(data, "candidate_ids", None)
+        if candidate_ids is not None:
+            return self._predict_rows(data, candidate_ids, models, token, cache)
+
+        data_hash = self._content_hash(data) if cache else None
+        cache_key = (data_hash, token) if data_hash is not None else None
+        cached = self._cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
             logger.debug("Returning cached predictions.")
-            return self._cache[cache_key]
+            return cached
 
+        # Only uncached batches are sketched, so a repeated batch counts once.
+        self._track(self.drift_monitor.update, data)
+        predictions = self._run_models("predict", {
+            name: (_predict_model, (models[name], data)) for name in MODEL_CLASSES
+        })
+        if cache_key is not None and len(predictions) == len(MODEL_CLASSES):
+            self._cache.put(cache_key, predictions)
+            logger.info("Predictions computed and cached.")
+        return predictions
+
+    @staticmethod
+    def _content_hash(data: Any) -> Optional[str]:
+        # None for inputs that can only be identified by address; they bypass the cache.
+        try:
+            return content_hash(data)
+        except TypeError as e:
+            logger.debug(f"Not caching: {e}")
+            return None
+
+    def _predict_rows(self, data: Any, candidate_ids: Sequence[Any], models: Dict[str, BaseModel],
+                      token: Tuple[Hashable, ...], cache: bool = True) -> Dict[str, Any]:
         predictions = {}
         try:
-            predictions['retention'] = self.retention_model.predict(data)
-            predictions['time_to_hire'] = self.time_to_hire_model.predict(data)
-            predictions['flight_risk'] = self.flight_risk_detector.predict(data)
-            self._cache[cache_key] = predictions
-            logger.info("Predictions computed and cached.")
+            X = as_feature_matrix(data)
+            keys, hashes = key_hashes(candidate_ids), row_hashes(X)
+            if len(keys) != len(X):
+                raise ValueError(f"Got {len(keys)} candidate IDs for {len(X)} feature rows")
+            # Row hashes make the whole-batch key cheap: 16 bytes per row instead of the full matrix.
+            cache_key = (content_hash((keys, hashes)), token) if cache else None
+            cached = self._cache.get(cache_key) if cache_key is not None else None
+            if cached is not None:
+                logger.debug("Returning cached predictions.")
+                return cached
+
+            self._track(self.drift_monitor.update, data)
+            if self._row_memo.token != token:
+                self._row_memo.reset(token)
+            hit, memoized = self._row_memo.lookup(keys, hashes)
+            miss = np.flatnonzero(~hit)
+            computed: Dict[str, np.ndarray] = {}
+            failed = set()
+            if len(miss):
+                rows = X[miss] if len(miss) < len(X) else X
+                outputs = self._run_models("predict", {
+                    name: (_predict_model, (models[name], rows)) for name in MODEL_CLASSES
+                })
+                failed = set(MODEL_CLASSES) - set(outputs)
+                for name, output in outputs.items():
+                    for key, values in output.prediction.items():
+                        computed[f"{name}/{key}"] = values
+                if not failed:
+                    # Dropped if the models changed while these rows were being scored.
+                    self._row_memo.store(keys[miss], hashes[miss], computed, token=token)
+
+            merged: Dict[str, Dict[str, np.ndarray]] = {}
+            for column in computed or memoized:
+                if len(miss) == len(X):
+                    values = computed[column]
+                else:
+                    sample = computed[column] if computed else memoized[column]
+                    values = np.empty(len(X), dtype=sample.dtype)
+                    values[hit] = memoized[column]
+                    values[miss] = computed.get(column, sample[:0])
+                name, output = column.split("/", 1)
+                merged.setdefault(name, {})[output] = values
+            for name in MODEL_CLASSES:
+                if name not in failed:
+                    predictions[name] = PredictionOutput(model_name=type(models[name]).__name__,
+                                                         prediction=merged.get(name, {}))
+            if failed:
+                return predictions
+            if cache_key is not None:
+                self._cache.put(cache_key, predictions)
+            logger.info(f"Predictions computed for {len(miss)} of {len(X)} rows; the rest came from the row memo.")
         except Exception as e:
             logger.error(f"Error during prediction: {e}")
-            # TODO: Add fallback or partial results handling
+            predictions = {}
         return predictions
 
-    def explain_all(self, data: Any) -> Dict[str, Any]:
+    def explain_all(self, data: Any, background_size: int = 100, top_k: int = 3) -> Dict[str, Any]:
         """
         Provide explanations for predictions from all models.
 
+        Explanations are computed on request and cached per model under the
+        content hash of ``data`` and the current model token, so they are
+        reused until the model is refit, saved or rolled back. With
+        ``parallel=True`` each model spreads its rows over ``max_workers`` threads.
+
         Args:
             data (Any): Input data for explanation.
+            background_size (int): Background rows each feature is perturbed with.
+            top_k (int): Attributions kept per candidate.
 
         Returns:
-            Dict[str, Any]: Dictionary of model names to explanation results.
+            Dict[str, Any]: Model name to ``Explanation``; models that failed are omitted.
         """
         explanations = {}
+        self._sync_shared()
         try:
-            explanations['retention'] = self.retention_model.explain(data)
-            explanations['time_to_hire'] = self.time_to_hire_model.explain(data)
-            explanations['flight_risk'] = self.flight_risk_detector.explain(data)
-            logger.info("Explanations generated.")
+            models, token = self._snapshot()
+            data_hash = self._content_hash(data)
+            keys = {name: (("explain", name, data_hash, background_size, top_k), token) if data_hash else None
+                    for name in MODEL_CLASSES}
+            pending = {}
+            for name, key in keys.items():
+                cached = self._cache.get(key) if key is not None else None
+                if cached is not None:
+                    explanations[name] = cached
+                else:
+                    pending[name] = (_explain_model, (models[name], data, background_size, top_k,
+                                                      self.max_workers if self.parallel else 1))
+            if pending:
+                computed = self._run_models("explain", pending)
+                for name, explanation in computed.items():
+                    if keys[name] is not None:
+                        self._cache.put(keys[name], explanation)
+                explanations.update(computed)
+                logger.info(f"Explanations generated for {len(computed)} of {len(pending)} models.")
         except Exception as e:
             logger.error(f"Error generating explanations: {e}")
-            # TODO: Add fallback or partial explanations
         return explanations
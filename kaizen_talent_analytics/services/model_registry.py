@@ -0,0 +1,251 @@
+import hashlib
+import importlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from kaizen_talent_analytics.predictive_models import BaseModel
+
+logger = logging.getLogger(__name__)
+
+CURRENT_FILE = "CURRENT"
+META_FILE = "meta.json"
+TUNING_FILE = "tuning.json"
+
+
+def schema_hash(feature_names: Optional[Sequence[str]]) -> Optional[str]:
+    """
+    Short, order-sensitive hash of a feature schema, or None when the schema is unknown.
+    """
+    if feature_names is None:
+        return None
+    return hashlib.sha1(json.dumps(list(feature_names)).encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class ModelVersion:
+    """
+    Dataclass describing one registered, immutable model artifact.
+    """
+    name: str
+    version: int
+    model_class: str  # "module:ClassName"
+    params: Dict[str, Any]
+    schema_hash: Optional[str] = None
+    metrics: Dict[str, float] = field(default_factory=dict)
+    created_at: str = ""
+    arrays: List[str] = field(default_factory=list)  # state attributes stored as .npy files
+    values: Dict[str, Any] = field(default_factory=dict)  # remaining state, stored inline
+
+
+class ModelRegistry:
+    """
+    File-system registry of versioned model artifacts.
+
+    Each version lives in ``<root>/<name>/v<version>/``: array state as one
+    ``.npy`` file per attribute and everything else in ``meta.json``. Versions
+    are written to a temporary directory and renamed into place, so they are
+    immutable once visible. A ``CURRENT`` file names the active version;
+    promoting or rolling back rewrites only that pointer. Loading memory-maps
+    the arrays, so startup reads no model data and processes serving the same
+    version share its pages through the OS page cache.
+    """
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def _model_dir(self, name: str) -> str:
+        return os.path.join(self.root, name)
+
+    def _version_dir(self, name: str, version: int) -> str:
+        return os.path.join(self._model_dir(name), f"v{version}")
+
+    def versions(self, name: str) -> List[ModelVersion]:
+        """
+        All registered versions of a model, oldest first.
+
+        Args:
+            name (str): Registered model name.
+
+        Returns:
+            List[ModelVersion]: Version metadata.
+        """
+        directory = self._model_dir(name)
+        if not os.path.isdir(directory):
+            return []
+        numbers = sorted(int(entry[1:]) for entry in os.listdir(directory)
+                         if entry.startswith("v") and entry[1:].isdigit())
+        return [self.describe(name, number) for number in numbers]
+
+    def describe(self, name: str, version: int) -> ModelVersion:
+        """
+        Metadata of one registered version.
+        """
+        with open(os.path.join(self._version_dir(name, version), META_FILE), "r", encoding="utf-8") as handle:
+            return ModelVersion(**json.load(handle))
+
+    def current_version(self, name: str) -> Optional[int]:
+        """
+        The active version of a model, or None if nothing has been registered.
+        """
+        try:
+            with open(os.path.join(self._model_dir(name), CURRENT_FILE), "r", encoding="utf-8") as handle:
+                return int(handle.read().strip())
+        except FileNotFoundError:
+            return None
+
+    def _set_current(self, name: str, version: int) -> None:
+        path = os.path.join(self._model_dir(name), CURRENT_FILE)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            handle.write(str(version))
+        os.replace(tmp_path, path)
+
+    def register(self, name: str, model: BaseModel, metrics: Optional[Dict[str, float]] = None,
+                 feature_names: Optional[Sequence[str]] = None, activate: bool = True,
+                 tuning: Optional[Dict[str, Any]] = None) -> ModelVersion:
+        """
+        Save a fitted model as the next version.
+
+        Args:
+            name (str): Registered model name.
+            model (BaseModel): Fitted model exposing ``get_state``.
+            metrics (Optional[Dict[str, float]]): Evaluation metrics to record.
+            feature_names (Optional[Sequence[str]]): Feature schema the model was trained on.
+            activate (bool): Make the new version the current one.
+            tuning (Optional[Dict[str, Any]]): Hyperparameter search record (e.g.
+                ``TuningResult.to_dict()``), stored as ``tuning.json`` in the version.
+
+        Returns:
+            ModelVersion: Metadata of the new version.
+        """
+        state = model.get_state()
+        arrays = {k: v for k, v in state.items() if isinstance(v, np.ndarray)}
+        cls = type(model)
+        with self._lock:
+            os.makedirs(self._model_dir(name), exist_ok=True)
+            existing = self.versions(name)
+            record = ModelVersion(
+                name=name,
+                version=existing[-1].version + 1 if existing else 1,
+                model_class=f"{cls.__module__}:{cls.__qualname__}",
+                params=model.get_params(),
+                schema_hash=schema_hash(feature_names),
+                metrics={k: float(v) for k, v in (metrics or {}).items()},
+                created_at=datetime.now(timezone.utc).isoformat(),
+                arrays=sorted(arrays),
+                values={k: v for k, v in state.items() if k not in arrays},
+            )
+            tmp_dir = tempfile.mkdtemp(prefix=".v", dir=self._model_dir(name))
+            try:
+                for attribute, values in arrays.items():
+                    np.save(os.path.join(tmp_dir, f"{attribute}.npy"), np.ascontiguousarray(values))
+                with open(os.path.join(tmp_dir, META_FILE), "w", encoding="utf-8") as handle:
+                    json.dump(asdict(record), handle, indent=2)
+                if tuning is not None:
+                    with open(os.path.join(tmp_dir, TUNING_FILE), "w", encoding="utf-8") as handle:
+                        json.dump(tuning, handle, indent=2, default=float)
+                os.rename(tmp_dir, self._version_dir(name, record.version))
+            except Exception:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                raise
+            if activate:
+                self._set_current(name, record.version)
+        logger.info(f"Registered {name} v{record.version} ({record.model_class})")
+        return record
+
+    def load(self, name: str, version: Optional[int] = None, mmap: bool = True,
+             feature_names: Optional[Sequence[str]] = None) -> BaseModel:
+        """
+        Rebuild a registered model, memory-mapping its array state.
+
+        Args:
+            name (str): Registered model name.
+            version (Optional[int]): Version to load; defaults to the current one.
+            mmap (bool): Memory-map arrays read-only instead of reading them into memory.
+            feature_names (Optional[Sequence[str]]): Expected feature schema; a mismatch
+                with the registered schema raises ``ValueError``.
+
+        Returns:
+            BaseModel: Model ready to predict.
+        """
+        version = self.current_version(name) if version is None else version
+        if version is None:
+            raise KeyError(f"No registered versions of model '{name}'")
+        record = self.describe(name, version)
+        expected = schema_hash(feature_names)
+        if expected is not None and record.schema_hash is not None and expected != record.schema_hash:
+            raise ValueError(f"{name} v{version} was trained on a different feature schema")
+
+        module_name, class_name = record.model_class.split(":")
+        cls = getattr(importlib.import_module(module_name), class_name)
+        model = cls(**record.params)
+        directory = self._version_dir(name, version)
+        state = dict(record.values)
+        for attribute in record.arrays:
+            state[attribute] = np.load(os.path.join(directory, f"{attribute}.npy"),
+                                       mmap_mode="r" if mmap else None)
+        model.set_state(state)
+        logger.info(f"Loaded {name} v{version}")
+        return model
+
+    def tuning(self, name: str, version: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Hyperparameter search record saved with a version, or None if it was not tuned.
+
+        Args:
+            name (str): Registered model name.
+            version (Optional[int]): Version to read; defaults to the current one.
+
+        Returns:
+            Optional[Dict[str, Any]]: The record passed to :meth:`register`.
+        """
+        version = self.current_version(name) if version is None else version
+        if version is None:
+            return None
+        try:
+            with open(os.path.join(self._version_dir(name, version), TUNING_FILE), "r", encoding="utf-8") as handle:
+                return json.load(handle)
+        except FileNotFoundError:
+            return None
+
+    def promote(self, name: str, version: int) -> None:
+        """
+        Make an existing version the current one.
+        """
+        if not os.path.isdir(self._version_dir(name, version)):
+            raise KeyError(f"Model '{name}' has no version {version}")
+        with self._lock:
+            self._set_current(name, version)
+        logger.info(f"Promoted {name} v{version}")
+
+    def rollback(self, name: str, version: Optional[int] = None) -> int:
+        """
+        Point the current version back to an earlier one.
+
+        Args:
+            name (str): Registered model name.
+            version (Optional[int]): Target version; defaults to the newest version
+                older than the current one.
+
+        Returns:
+            int: The version that is now current.
+        """
+        if version is None:
+            current = self.current_version(name)
+            older = [v.version for v in self.versions(name) if current is None or v.version < current]
+            if not older:
+                raise ValueError(f"Model '{name}' has no earlier version to roll back to")
+            version = older[-1]
+        self.promote(name, version)
+        return version
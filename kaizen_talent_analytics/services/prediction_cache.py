@@ -0,0 +1,369 @@
+import hashlib
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 300.0
+
+
+def _update_hash(digest: Any, data: Any) -> None:
+    if hasattr(data, "features") and not isinstance(data, (pd.DataFrame, np.ndarray)):
+        data = data.features
+    if isinstance(data, np.ndarray):
+        digest.update(f"ndarray:{data.dtype.str}:{data.shape}".encode("utf-8"))
+        if data.dtype.hasobject:
+            digest.update(pd.util.hash_array(data.ravel()).tobytes())
+        else:
+            digest.update(np.ascontiguousarray(data).data)
+    elif isinstance(data, pd.DataFrame):
+        digest.update(f"frame:{list(data.columns)!r}:{list(map(str, data.dtypes))!r}".encode("utf-8"))
+        digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    elif isinstance(data, pd.Series):
+        digest.update(f"series:{data.name!r}:{data.dtype}".encode("utf-8"))
+        digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    elif isinstance(data, (tuple, list)):
+        digest.update(f"{type(data).__name__}:{len(data)}".encode("utf-8"))
+        for item in data:
+            _update_hash(digest, item)
+    elif isinstance(data, dict):
+        digest.update(f"dict:{len(data)}".encode("utf-8"))
+        for key in sorted(data, key=repr):
+            digest.update(repr(key).encode("utf-8"))
+            _update_hash(digest, data[key])
+    elif isinstance(data, bytes):
+        digest.update(b"bytes:" + data)
+    elif data is None or isinstance(data, (str, int, float, complex)):
+        # Scalar reprs are value based; arbitrary objects' default reprs embed id() and are not.
+        digest.update(f"{type(data).__qualname__}:{data!r}".encode("utf-8"))
+    else:
+        raise TypeError(f"Cannot content-hash {type(data).__qualname__}; "
+                        f"pass an array, DataFrame or object exposing ``features``")
+
+
+def content_hash(data: Any) -> str:
+    """
+    Stable digest of model input content.
+
+    Arrays are hashed over their raw buffer, frames over pandas' vectorized
+    per-row hashes, and objects exposing ``features`` over that matrix, so the
+    cost is a single pass over the data and equal content always hashes equal.
+
+    Args:
+        data (Any): Model input.
+
+    Returns:
+        str: Hex digest.
+
+    Raises:
+        TypeError: If ``data`` contains an object that can only be identified by address.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    _update_hash(digest, data)
+    return digest.hexdigest()
+
+
+def _mix64(x: np.ndarray) -> np.ndarray:
+    # splitmix64 finalizer; uint64 arithmetic wraps around.
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def row_hashes(matrix: np.ndarray) -> np.ndarray:
+    """
+    64-bit hash of every row of a feature matrix, computed column by column.
+
+    Args:
+        matrix (np.ndarray): 2-D feature matrix; values are hashed as float64 bit patterns.
+
+    Returns:
+        np.ndarray: One uint64 hash per row.
+    """
+    words = np.ascontiguousarray(matrix, dtype=np.float64).view(np.uint64)
+    hashes = np.full(len(words), np.uint64(words.shape[1]), dtype=np.uint64)
+    for column in range(words.shape[1]):
+        hashes = _mix64(hashes ^ words[:, column])
+    return hashes
+
+
+def key_hashes(keys: Any) -> np.ndarray:
+    """
+    64-bit hash of every entity key (e.g. candidate IDs), vectorized by pandas.
+    """
+    # Keys are mostly unique, so factorizing first (pandas' default) only adds work.
+    return pd.util.hash_array(np.asarray(keys, dtype=object), categorize=False)
+
+
+def nbytes(value: Any) -> int:
+    """
+    Approximate memory held by a cached value, counting array buffers exactly.
+    """
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True))
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(nbytes(v) for v in value)
+    if hasattr(value, "prediction"):
+        return sys.getsizeof(value) + nbytes(value.prediction)
+    if is_dataclass(value):
+        return sys.getsizeof(value) + sum(nbytes(getattr(value, f.name)) for f in fields(value))
+    return sys.getsizeof(value)
+
+
+@dataclass
+class CacheStats:
+    """
+    Dataclass of prediction cache counters.
+    """
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0  # removed to respect the size bounds
+    expirations: int = 0  # removed because their TTL elapsed
+    invalidations: int = 0  # removed by an explicit invalidation
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class PredictionCache:
+    """
+    Bounded, thread-safe LRU cache with per-entry TTL and byte-size accounting.
+
+    Entries are kept in recency order; inserting past ``max_bytes`` or
+    ``max_entries`` evicts from the least recently used end, and an entry
+    older than ``ttl_seconds`` is dropped when it is next looked up.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, max_entries: Optional[int] = 1024,
+                 ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(**{**self._stats.__dict__, "entries": len(self._entries), "bytes": self._bytes})
+
+    def _drop(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Look up a value, refreshing its recency.
+
+        Args:
+            key (Hashable): Cache key.
+            default (Any): Returned on a miss.
+
+        Returns:
+            Any: The cached value, or ``default``.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl_seconds is not None and self._clock() - entry[2] > self.ttl_seconds:
+                self._drop(key)
+                self._stats.expirations += 1
+                entry = None
+            if entry is None:
+                self._stats.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any) -> bool:
+        """
+        Insert a value, evicting least recently used entries to stay within bounds.
+
+        Args:
+            key (Hashable): Cache key.
+            value (Any): Value to cache.
+
+        Returns:
+            bool: False if the value alone exceeds ``max_bytes`` and was not cached.
+        """
+        size = nbytes(value)
+        if size > self.max_bytes:
+            logger.debug(f"Not caching a {size}-byte value larger than the {self.max_bytes}-byte cache")
+            return False
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (value, size, self._clock())
+            self._bytes += size
+            while self._bytes > self.max_bytes or (self.max_entries is not None and len(self._entries) > self.max_entries):
+                self._drop(next(iter(self._entries)))
+                self._stats.evictions += 1
+        return True
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> int:
+        """
+        Remove every entry, or only those whose key matches ``predicate``.
+
+        Args:
+            predicate (Optional[Callable[[Hashable], bool]]): Selects keys to remove.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        with self._lock:
+            keys = [k for k in self._entries if predicate is None or predicate(k)]
+            for key in keys:
+                self._drop(key)
+            self._stats.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        """
+        Remove every entry without counting it as an invalidation.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def counters(self) -> Dict[str, Any]:
+        """
+        Counters as a plain dict, e.g. for logging or a metrics endpoint.
+        """
+        stats = self.stats
+        return {**stats.__dict__, "hit_rate": stats.hit_rate}
+
+
+class RowMemo:
+    """
+    Per-entity memo of model outputs, valid for one model token.
+
+    Rows are keyed by an entity key hash and remember the hash of the feature
+    row they were computed from, so a lookup is a hit only if the entity's
+    features are unchanged. Lookups and merges are vectorized through a
+    ``pd.Index`` over the keys; a changed entity overwrites its own slot, so
+    memory is bounded by the number of distinct entities (and ``max_rows``).
+    """
+
+    def __init__(self, max_rows: int = 5_000_000) -> None:
+        self.max_rows = max_rows
+        self.token: Optional[Hashable] = None
+        self._values: Dict[str, np.ndarray] = {}
+        self._clear()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def nbytes(self) -> int:
+        return self._index.nbytes + self._row_hashes.nbytes + sum(v.nbytes for v in self._values.values())
+
+    def reset(self, token: Optional[Hashable] = None) -> None:
+        """
+        Forget every row, e.g. because the models behind the memo changed.
+        """
+        with self._lock:
+            self.token = token
+            self._clear()
+
+    def _clear(self) -> None:
+        self._index = pd.Index(np.empty(0, dtype=np.uint64))
+        self._row_hashes = np.empty(0, dtype=np.uint64)
+        self._values = {}
+
+    def lookup(self, keys: np.ndarray, hashes: np.ndarray) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Split a batch into memo hits and misses.
+
+        Args:
+            keys (np.ndarray): uint64 entity key hashes, one per row.
+            hashes (np.ndarray): uint64 feature row hashes, one per row.
+
+        Returns:
+            Tuple[np.ndarray, Dict[str, np.ndarray]]: Boolean hit mask, and the
+                memoized outputs of the hit rows (in batch order).
+        """
+        with self._lock:
+            positions = self._index.get_indexer(keys)
+            found = positions >= 0
+            hit = found.copy()
+            hit[found] = self._row_hashes[positions[found]] == hashes[found]
+            return hit, {name: values[positions[hit]] for name, values in self._values.items()}
+
+    def store(self, keys: np.ndarray, hashes: np.ndarray, outputs: Dict[str, np.ndarray],
+              token: Optional[Hashable] = None) -> None:
+        """
+        Remember outputs for a batch of rows, replacing earlier entries for the same keys.
+
+        Args:
+            keys (np.ndarray): uint64 entity key hashes.
+            hashes (np.ndarray): uint64 feature row hashes.
+            outputs (Dict[str, np.ndarray]): Output name to one value per row.
+            token (Optional[Hashable]): Model state the outputs were computed with; the
+                write is dropped if the memo has been reset to another token since.
+
+        Returns:
+            None
+        """
+        batch = pd.Index(keys)
+        outputs = {name: np.asarray(values) for name, values in outputs.items()}
+        if not batch.is_unique:
+            # Keep the last occurrence of keys repeated within the batch.
+            rows = np.flatnonzero(~batch.duplicated(keep="last"))
+            batch, hashes = batch[rows], hashes[rows]
+            outputs = {name: values[rows] for name, values in outputs.items()}
+        keys = batch.to_numpy()
+        with self._lock:
+            if token is not None and token != self.token:
+                logger.debug("Dropping row memo write made with outdated models")
+                return
+            if self._values and set(outputs) != set(self._values):
+                self._clear()
+            if len(self._index) + len(keys) > self.max_rows:
+                logger.info(f"Row memo exceeded {self.max_rows} rows; starting over")
+                self._clear()
+            if not len(self._index):
+                # Reuse the batch index and its hash table, built by is_unique above.
+                self._index, self._row_hashes = batch, hashes.copy()
+                self._values = {name: values.copy() for name, values in outputs.items()}
+                return
+            positions = self._index.get_indexer(keys)
+            existing = positions >= 0
+            self._row_hashes[positions[existing]] = hashes[existing]
+            for name, values in self._values.items():
+                values[positions[existing]] = outputs[name][existing]
+            new = ~existing
+            self._index = self._index.append(pd.Index(keys[new]))
+            self._row_hashes = np.concatenate([self._row_hashes, hashes[new]])
+            for name, values in outputs.items():
+                current = self._values.get(name, values[:0])
+                self._values[name] = np.concatenate([current, values[new]])
@@ -0,0 +1,321 @@
+import inspect
+import logging
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from kaizen_talent_analytics.services.model_orchestrator import MODEL_CLASSES, ModelOrchestrator, ModelRunStatus
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RetrainPolicy:
+    """
+    Dataclass of the new-data thresholds that trigger retraining of one model.
+    """
+    partial_fit_events: Optional[int] = 5_000  # incremental update (models with partial_fit)
+    refit_events: Optional[int] = 100_000  # full refit from scratch
+    min_interval_seconds: float = 60.0  # cooldown between two retrainings of the model
+
+
+@dataclass
+class ModelWatermark:
+    """
+    Dataclass recording how much ATS data a model had seen when it was last trained.
+    """
+    rows: int = 0  # value of the scheduler's event counter at the last training
+    trained_at: float = field(default_factory=time.monotonic)
+    mode: Optional[str] = None  # "partial" or "full"; None until the scheduler trains the model
+
+
+@dataclass
+class RetrainJob:
+    """
+    Dataclass of one planned (and, once run, completed) retraining.
+    """
+    model: str
+    mode: str  # "partial" or "full"
+    reason: str
+    new_events: int
+    rows: int  # event counter the job covers; becomes the model's watermark on success
+    drift: float
+    status: Optional[ModelRunStatus] = None
+
+
+class RetrainingScheduler:
+    """
+    Retrains models when enough new ATS data has arrived or the features have drifted.
+
+    Subscribed to an ``ATSIngestor``, the scheduler counts delivered events and
+    remembers which candidates they touched. Each model has a row-count
+    watermark: the counter value when it was last trained. On every check a
+    model whose new-event count crosses its policy's ``partial_fit_events``
+    is updated incrementally on the touched candidates (models without
+    ``partial_fit`` are refitted instead); crossing ``refit_events``, or a
+    drift score above ``drift_threshold``, triggers a full refit on
+    ``training_data()``. Nothing is retrained while data is unchanged.
+    A drift decision is latched for every model with new data: each keeps
+    being planned for a full refit until it has had one, and the drift
+    reference moves to the new training data only once all of them have.
+
+    Checks run on a background thread every ``interval`` seconds. At most
+    ``max_concurrent`` retrainings run at once, so serving keeps the rest of
+    the CPU; models are swapped in only when their retraining has finished.
+    """
+
+    def __init__(self, orchestrator: ModelOrchestrator, training_data: Callable[[], Any],
+                 policies: Optional[Dict[str, RetrainPolicy]] = None, drift_threshold: Optional[float] = 0.2,
+                 interval: float = 30.0, max_concurrent: int = 1, history: int = 256) -> None:
+        """
+        Args:
+            orchestrator (ModelOrchestrator): Serves and owns the models being retrained.
+            training_data (Callable[[], Any]): Returns the current training set, e.g.
+                ``FeatureStore.snapshot``. Incremental updates need a ``FeatureSet``
+                (candidate IDs select the touched rows); otherwise models are refitted.
+            policies (Optional[Dict[str, RetrainPolicy]]): Thresholds per model name;
+                models without one use ``RetrainPolicy()``.
+            drift_threshold (Optional[float]): Largest per-feature PSI of live traffic
+                against the training data (``ModelOrchestrator.drift_report``) above
+                which every model is refitted. None disables drift triggers.
+            interval (float): Seconds between background checks.
+            max_concurrent (int): Retrainings allowed to run at the same time.
+            history (int): Number of completed jobs kept in :attr:`history`.
+        """
+        self.orchestrator = orchestrator
+        self.training_data = training_data
+        self.policies = policies or {}
+        self.drift_threshold = drift_threshold
+        self.interval = interval
+        self.history: Deque[RetrainJob] = deque(maxlen=history)
+        self._rows = 0
+        self._touched: Dict[str, int] = {}  # candidate ID -> event counter at its latest event
+        # Models are taken to be trained on the current data when the scheduler starts.
+        self._marks = {name: ModelWatermark() for name in MODEL_CLASSES}
+        initial = training_data()
+        self._trained_on: Dict[str, Any] = dict.fromkeys(MODEL_CLASSES, initial)  # data of each model's last training
+        self._running: set = set()
+        self._drifted: set = set()  # models latched for a drift refit
+        self._drift = 0.0  # drift score that latched them
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._jobs: List[threading.Thread] = []
+
+    def subscribe_to(self, ingestor: Any) -> None:
+        """
+        Count new data by registering the scheduler as an ``ATSIngestor`` delta subscriber.
+        """
+        ingestor.subscribe(lambda source, events: self.record(events))
+
+    def record(self, events: Sequence[Any]) -> None:
+        """
+        Advance the event counter by a batch of newly ingested events.
+
+        Args:
+            events (Sequence[Any]): ``ATSEvent`` objects (anything with a ``candidate_id``).
+        """
+        with self._lock:
+            for event in events:
+                self._rows += 1
+                self._touched[event.candidate_id] = self._rows
+
+    def watermark(self, name: str) -> ModelWatermark:
+        """
+        Watermark of one model.
+        """
+        return self._marks[name]
+
+    def new_events(self, name: str) -> int:
+        """
+        Events ingested since the model was last trained.
+        """
+        return self._rows - self._marks[name].rows
+
+    def drift_score(self) -> float:
+        """
+        Largest per-feature PSI of live traffic against the training data; 0.0 when unknown.
+        """
+        scores = [s.psi for s in self.orchestrator.drift_report().values() if not math.isnan(s.psi)]
+        return max(scores, default=0.0)
+
+    def plan(self) -> List[RetrainJob]:
+        """
+        Decide which models to retrain now, without running anything.
+
+        Returns:
+            List[RetrainJob]: One job per model whose thresholds are crossed and
+                that is neither cooling down nor already being retrained.
+        """
+        with self._lock:
+            rows = self._rows
+            running = set(self._running)
+            drifted = set(self._drifted)
+        if not drifted and self.drift_threshold is not None:
+            drift = self.drift_score()
+            if drift > self.drift_threshold:
+                # Latch until every model with new data has been refitted: the first refit moves
+                # no reference, so later checks still plan the others even with max_concurrent=1.
+                drifted = {name for name in MODEL_CLASSES if rows > self._marks[name].rows or name in running}
+                with self._lock:
+                    self._drifted, self._drift = set(drifted), drift
+        drift = self._drift if drifted else 0.0
+        jobs = []
+        for name in MODEL_CLASSES:
+            mark = self._marks[name]
+            new = rows - mark.rows
+            policy = self.policies.get(name) or RetrainPolicy()
+            if (new <= 0 and name not in drifted) or name in running:
+                continue
+            if mark.mode is not None and time.monotonic() - mark.trained_at < policy.min_interval_seconds:
+                continue
+            model = self.orchestrator.model(name)
+            if name in drifted:
+                mode, reason = "full", f"feature drift PSI {drift:.3f} > {self.drift_threshold}"
+            elif policy.refit_events is not None and new >= policy.refit_events:
+                mode, reason = "full", f"{new} new events >= {policy.refit_events}"
+            elif policy.partial_fit_events is not None and new >= policy.partial_fit_events:
+                incremental = getattr(model, "supports_partial_fit", False) and getattr(model, "is_fitted", False)
+                mode, reason = "partial" if incremental else "full", f"{new} new events >= {policy.partial_fit_events}"
+            else:
+                continue
+            jobs.append(RetrainJob(name, mode, reason, new, rows, drift))
+        return jobs
+
+    def _incremental_batch(self, name: str, data: Any, since: int) -> Optional[Dict[str, Any]]:
+        # Rows of the candidates touched since the model's watermark, plus their superseded rows.
+        if getattr(data, "candidate_ids", None) is None or not hasattr(data, "take"):
+            return None
+        with self._lock:
+            changed = [candidate for candidate, seen in self._touched.items() if seen > since]
+        batch = data.take(np.flatnonzero(pd.Index(data.candidate_ids).isin(changed)))
+        arguments: Dict[str, Any] = {"data": batch}
+        previous = self._trained_on.get(name)
+        if previous is not None and "replaces" in inspect.signature(self.orchestrator.model(name).partial_fit).parameters:
+            # Candidates seen before are re-scored: retract what the model learned from their old rows.
+            old = pd.Index(previous.candidate_ids).get_indexer(batch.candidate_ids)
+            arguments["replaces"] = previous.take(old[old >= 0])
+        return arguments
+
+    def _prune(self) -> None:
+        # Candidates already covered by every model's watermark are no longer needed.
+        low = min(mark.rows for mark in self._marks.values())
+        with self._lock:
+            self._touched = {candidate: seen for candidate, seen in self._touched.items() if seen > low}
+
+    def run(self, job: RetrainJob) -> RetrainJob:
+        """
+        Run one retraining job in the calling thread and advance the model's watermark.
+
+        Args:
+            job (RetrainJob): A job from :meth:`plan`.
+
+        Returns:
+            RetrainJob: The job with its ``status`` filled in.
+        """
+        name, since = job.model, self._marks[job.model].rows
+        started = time.perf_counter()
+        try:
+            data = self.training_data()
+            arguments = self._incremental_batch(name, data, since) if job.mode == "partial" else None
+            if arguments is not None:
+                job.status = self.orchestrator.refit(name, incremental=True, **arguments)
+            else:
+                if job.mode == "partial":
+                    job.mode, job.reason = "full", f"{job.reason}; no candidate IDs for an incremental update"
+                job.status = self.orchestrator.refit(name, data)
+        except Exception as e:
+            job.status = ModelRunStatus(name, False, time.perf_counter() - started, f"{type(e).__name__}: {e}")
+            logger.error(f"Error retraining {name}: {job.status.error}")
+        if job.status.ok:
+            self._marks[name] = ModelWatermark(rows=job.rows, mode=job.mode)
+            self._trained_on[name] = data
+            with self._lock:
+                last_drift_refit = job.mode == "full" and name in self._drifted and len(self._drifted) == 1
+                if job.mode == "full":
+                    self._drifted.discard(name)
+            if last_drift_refit:
+                # All models now reflect the drifted data: compare future traffic against it.
+                self.orchestrator.drift_monitor.set_reference(data)
+                self.orchestrator.drift_monitor.reset_live()
+            self._prune()
+            logger.info(f"Retrained {name} ({job.mode}, {job.reason}) in {job.status.seconds:.2f}s")
+        self.history.append(job)
+        return job
+
+    def _run_job(self, job: RetrainJob) -> None:
+        try:
+            self.run(job)
+        finally:
+            with self._lock:
+                self._running.discard(job.model)
+            self._slots.release()
+
+    def check(self, wait: bool = False) -> List[RetrainJob]:
+        """
+        Plan retraining and start the jobs there is capacity for, each on its own thread.
+
+        Jobs that would exceed ``max_concurrent`` are left for a later check.
+
+        Args:
+            wait (bool): Block until the started jobs have finished.
+
+        Returns:
+            List[RetrainJob]: The jobs started; their ``status`` is set once they finish.
+        """
+        started = []
+        for job in self.plan():
+            if not self._slots.acquire(blocking=False):
+                break
+            with self._lock:
+                self._running.add(job.model)
+            thread = threading.Thread(target=self._run_job, args=(job,), name=f"retrain-{job.model}", daemon=True)
+            thread.start()
+            self._jobs.append(thread)
+            started.append(job)
+        self._jobs = [thread for thread in self._jobs if thread.is_alive()]
+        if wait:
+            for thread in list(self._jobs):
+                thread.join()
+        return started
+
+    def start(self) -> "RetrainingScheduler":
+        """
+        Start the background checking thread (idempotent).
+        """
+        if self._worker is None or not self._worker.is_alive():
+            self._stop.clear()
+            self._worker = threading.Thread(target=self._loop, name="retraining-scheduler", daemon=True)
+            self._worker.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop checking and wait for retraining jobs in flight.
+        """
+        self._stop.set()
+        if self._worker is not None:
+            self._worker.join(timeout)
+            self._worker = None
+        for thread in list(self._jobs):
+            thread.join(timeout)
+
+    def __enter__(self) -> "RetrainingScheduler":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                logger.error(f"Error checking for retraining: {e}")
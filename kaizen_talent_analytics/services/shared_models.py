@@ -0,0 +1,139 @@
+import logging
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence
+
+from kaizen_talent_analytics.predictive_models import BaseModel
+from kaizen_talent_analytics.services.feature_store import FeatureSet, load_feature_set, save_feature_set
+from kaizen_talent_analytics.services.model_registry import ModelRegistry
+
+logger = logging.getLogger(__name__)
+
+GENERATION_FILE = "GENERATION"
+FEATURES_DIR = "features"
+MODELS_DIR = "models"
+
+_COUNTER = struct.Struct("<q")
+
+
+def _generation_dir(root: str, generation: int) -> str:
+    return os.path.join(root, f"gen-{generation:08d}")
+
+
+@dataclass
+class SharedGeneration:
+    """
+    Dataclass of one published generation, attached read-only.
+    """
+    generation: int
+    models: Dict[str, BaseModel]
+    features: Optional[FeatureSet] = None
+
+
+class SharedModelStore:
+    """
+    Publishes models and the candidate feature matrix once for every serving process.
+
+    A publisher writes each generation to ``<root>/gen-<n>/``: models in
+    ``ModelRegistry`` layout (array state as ``.npy``) and the feature snapshot
+    as ``.npy`` files. Only then does it bump an 8-byte ``GENERATION`` counter.
+    Serving processes memory-map a generation read-only, so every worker on the
+    host shares the same physical pages. The counter is memory-mapped too, which
+    makes checking for a newer generation a single memory read. Put ``root`` on
+    a tmpfs such as ``/dev/shm`` to keep the pages out of the disk cache.
+    There should be one publisher at a time.
+    """
+
+    def __init__(self, root: str, keep: int = 2) -> None:
+        """
+        Args:
+            root (str): Directory shared by the publisher and all serving processes.
+            keep (int): Generations kept on disk; older ones are removed on publish.
+                Workers still mapping a removed generation keep valid pages until
+                they attach to a newer one.
+        """
+        self.root = root
+        self.keep = max(keep, 1)
+        os.makedirs(root, exist_ok=True)
+        path = os.path.join(root, GENERATION_FILE)
+        if not os.path.exists(path):
+            with tempfile.NamedTemporaryFile(dir=root, delete=False) as handle:
+                handle.write(_COUNTER.pack(0))
+            try:
+                os.link(handle.name, path)  # fails if another process created it first
+            except FileExistsError:
+                pass
+            os.remove(handle.name)
+        with open(path, "r+b") as handle:
+            self._counter = mmap.mmap(handle.fileno(), _COUNTER.size)
+
+    @property
+    def generation(self) -> int:
+        """
+        Latest published generation; 0 before the first publish.
+        """
+        return _COUNTER.unpack_from(self._counter)[0]
+
+    def publish(self, models: Dict[str, BaseModel], features: Optional[FeatureSet] = None,
+                feature_names: Optional[Sequence[str]] = None) -> int:
+        """
+        Write a new generation and make it visible to every attached process.
+
+        Args:
+            models (Dict[str, BaseModel]): Fitted models by name.
+            features (Optional[FeatureSet]): Candidate feature snapshot to serve.
+            feature_names (Optional[Sequence[str]]): Feature schema recorded with the models.
+
+        Returns:
+            int: The new generation number.
+        """
+        generation = self.generation + 1
+        tmp_dir = tempfile.mkdtemp(prefix=".gen-", dir=self.root)
+        try:
+            registry = ModelRegistry(os.path.join(tmp_dir, MODELS_DIR))
+            for name, model in models.items():
+                registry.register(name, model, feature_names=feature_names)
+            if features is not None:
+                save_feature_set(os.path.join(tmp_dir, FEATURES_DIR), features)
+            os.rename(tmp_dir, _generation_dir(self.root, generation))
+        except Exception:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+        _COUNTER.pack_into(self._counter, 0, generation)
+        self._counter.flush()
+        for stale in range(generation - self.keep, 0, -1):
+            directory = _generation_dir(self.root, stale)
+            if not os.path.isdir(directory):
+                break
+            shutil.rmtree(directory, ignore_errors=True)
+        logger.info(f"Published generation {generation} with {sorted(models)}")
+        return generation
+
+    def attach(self, generation: Optional[int] = None,
+               feature_names: Optional[Sequence[str]] = None) -> SharedGeneration:
+        """
+        Memory-map a published generation read-only.
+
+        Args:
+            generation (Optional[int]): Generation to attach; defaults to the latest.
+            feature_names (Optional[Sequence[str]]): Expected feature schema of the models.
+
+        Returns:
+            SharedGeneration: Models and features backed by the shared pages.
+        """
+        generation = self.generation if generation is None else generation
+        if generation < 1:
+            raise KeyError(f"Nothing has been published to {self.root}")
+        directory = _generation_dir(self.root, generation)
+        if not os.path.isdir(directory):
+            raise KeyError(f"Generation {generation} is no longer available in {self.root}")
+        registry = ModelRegistry(os.path.join(directory, MODELS_DIR))
+        models = {name: registry.load(name, feature_names=feature_names)
+                  for name in sorted(os.listdir(registry.root))}
+        features_dir = os.path.join(directory, FEATURES_DIR)
+        features = load_feature_set(features_dir) if os.path.isdir(features_dir) else None
+        return SharedGeneration(generation, models, features)
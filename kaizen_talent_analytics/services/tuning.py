@@ -0,0 +1,257 @@
+import importlib
+import itertools
+import logging
+import math
+import multiprocessing
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+import numpy as np
+import pandas as pd
+
+from kaizen_talent_analytics.predictive_models import BaseModel, split_features_target
+
+logger = logging.getLogger(__name__)
+
+ParamGrid = Union[Dict[str, Sequence[Any]], Sequence[Dict[str, Any]]]
+
+
+def roc_auc(y: np.ndarray, scores: np.ndarray) -> float:
+    """
+    Area under the ROC curve via the rank-sum statistic; NaN when only one class is present.
+    """
+    positives = y > 0.5
+    n_pos, n_neg = int(positives.sum()), int((~positives).sum())
+    if n_pos == 0 or n_neg == 0:
+        return float("nan")
+    ranks = pd.Series(scores).rank().to_numpy()
+    return float((ranks[positives].sum() - n_pos * (n_pos + 1) / 2) / (n_pos * n_neg))
+
+
+def neg_log_loss(y: np.ndarray, scores: np.ndarray) -> float:
+    """
+    Negated mean binary cross-entropy, so that higher is better like every metric here.
+    """
+    p = np.clip(scores, 1e-12, 1 - 1e-12)
+    return float(np.mean(y * np.log(p) + (1 - y) * np.log(1 - p)))
+
+
+METRICS: Dict[str, Callable[[np.ndarray, np.ndarray], float]] = {
+    "roc_auc": roc_auc,
+    "neg_log_loss": neg_log_loss,
+}
+
+
+def expand_grid(param_grid: ParamGrid) -> List[Dict[str, Any]]:
+    """
+    Candidate configurations from a ``{name: values}`` grid or an explicit list of dicts.
+    """
+    if isinstance(param_grid, dict):
+        names = sorted(param_grid)
+        return [dict(zip(names, values)) for values in itertools.product(*(param_grid[n] for n in names))]
+    return [dict(params) for params in param_grid]
+
+
+@dataclass
+class TrialResult:
+    """
+    Dataclass of one configuration's cross-validation scores at one halving rung.
+    """
+    params: Dict[str, Any]
+    rung: int
+    rows: int
+    scores: List[float]
+    seconds: float
+    error: Optional[str] = None
+
+    @property
+    def mean_score(self) -> float:
+        valid = [s for s in self.scores if not math.isnan(s)]
+        return float(np.mean(valid)) if valid else float("-inf")
+
+
+@dataclass
+class TuningResult:
+    """
+    Dataclass summarizing a successive-halving search.
+    """
+    model_class: str  # "module:ClassName"
+    metric: str
+    best_params: Dict[str, Any]
+    best_score: float
+    n_folds: int
+    eta: int
+    trials: List[TrialResult] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON-serializable form, as persisted next to the registered model.
+        """
+        result = asdict(self)
+        for trial, record in zip(self.trials, result["trials"]):
+            record["mean_score"] = trial.mean_score
+        return result
+
+
+# Worker-side views of the shared arrays, set up once per process by _attach.
+_SHARED: Dict[str, Any] = {}
+
+
+def _attach(names: Dict[str, Tuple[str, Tuple[int, ...], str]], model_class: str, metric: str,
+            n_folds: int) -> None:
+    handles, arrays = [], {}
+    for key, (name, shape, dtype) in names.items():
+        handle = shared_memory.SharedMemory(name=name)
+        handles.append(handle)
+        arrays[key] = np.ndarray(shape, dtype=dtype, buffer=handle.buf)
+    module_name, class_name = model_class.split(":")
+    _SHARED.update(arrays, handles=handles, cls=getattr(importlib.import_module(module_name), class_name),
+                   metric=METRICS[metric], n_folds=n_folds)
+
+
+def _detach() -> None:
+    handles = _SHARED.pop("handles", [])
+    _SHARED.clear()  # drop the array views before closing the buffers behind them
+    for handle in handles:
+        handle.close()
+
+
+def _evaluate(task: Tuple[int, Dict[str, Any], int, int]) -> Tuple[int, int, float, float, Optional[str]]:
+    index, params, rows, fold = task
+    started = time.perf_counter()
+    try:
+        sample = _SHARED["order"][:rows]
+        test = np.zeros(rows, dtype=bool)
+        test[fold::_SHARED["n_folds"]] = True
+        X, y = _SHARED["X"], _SHARED["y"]
+        model = _SHARED["cls"](**params)
+        model.fit((X[sample[~test]], y[sample[~test]]))
+        output = model.predict(X[sample[test]])
+        scores = next(iter(output.prediction.values()))
+        score = _SHARED["metric"](y[sample[test]], np.asarray(scores, dtype=np.float64))
+        return index, fold, score, time.perf_counter() - started, None
+    except Exception as e:
+        return index, fold, float("nan"), time.perf_counter() - started, f"{type(e).__name__}: {e}"
+
+
+def _share(arrays: Dict[str, np.ndarray]) -> Tuple[List[shared_memory.SharedMemory],
+                                                   Dict[str, Tuple[str, Tuple[int, ...], str]]]:
+    handles, names = [], {}
+    try:
+        for key, values in arrays.items():
+            handle = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+            handles.append(handle)
+            np.ndarray(values.shape, dtype=values.dtype, buffer=handle.buf)[...] = values
+            names[key] = (handle.name, values.shape, values.dtype.str)
+    except Exception:
+        _release(handles)
+        raise
+    return handles, names
+
+
+def _release(handles: List[shared_memory.SharedMemory]) -> None:
+    for handle in handles:
+        handle.close()
+        handle.unlink()
+
+
+def _rung_count(n_configs: int, eta: int) -> int:
+    """
+    Halving rungs needed to narrow ``n_configs`` down to one: 1 + floor(log_eta(n_configs)).
+
+    Counted with integer powers; float logarithms round exact powers such as 27 at eta=3 down.
+    """
+    rungs = 1
+    while eta > 1 and eta ** rungs <= n_configs:
+        rungs += 1
+    return rungs
+
+
+def successive_halving(model_class: Type[BaseModel], data: Any, param_grid: ParamGrid,
+                       metric: str = "roc_auc", n_folds: int = 3, eta: int = 3, min_rows: int = 1_000,
+                       processes: Optional[int] = None, seed: int = 0) -> TuningResult:
+    """
+    Pick hyperparameters by cross-validated successive halving on a process pool.
+
+    Every configuration is first scored with ``n_folds``-fold cross-validation
+    on a small random subsample. The best ``1 / eta`` of them advance to the
+    next rung, where the subsample is ``eta`` times larger; the last rung uses
+    every row. Weak configurations are dropped after costing only a fraction of
+    a full fit. The feature matrix, targets and subsample order are placed in
+    shared memory once; workers map them and each task ships only a few
+    integers and the parameter dict.
+
+    Args:
+        model_class (Type[BaseModel]): Binary classifier with a ``target`` label,
+            e.g. ``RetentionModel`` or ``FlightRiskDetector``.
+        data (Any): Training data in any form accepted by ``split_features_target``.
+        param_grid (ParamGrid): ``{name: values}`` grid or list of constructor-argument dicts.
+        metric (str): One of ``METRICS``; higher is better.
+        n_folds (int): Cross-validation folds per evaluation.
+        eta (int): Halving rate: the fraction kept per rung is ``1 / eta``.
+        min_rows (int): Smallest subsample used at the first rung.
+        processes (Optional[int]): Worker processes; defaults to the CPU count, 1 runs inline.
+        seed (int): Seed of the subsample order.
+
+    Returns:
+        TuningResult: Best configuration, its score, and every trial.
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric '{metric}'; expected one of {sorted(METRICS)}")
+    configs = expand_grid(param_grid)
+    if not configs:
+        raise ValueError("The parameter grid is empty")
+    target = getattr(model_class, "target", None)
+    X, y = split_features_target(data, target)
+    n = len(X)
+    rungs = _rung_count(len(configs), eta)
+    order = np.random.default_rng(seed).permutation(n)
+    model_path = f"{model_class.__module__}:{model_class.__qualname__}"
+    processes = processes or os.cpu_count() or 1
+
+    handles, names = _share({"X": np.ascontiguousarray(X), "y": y, "order": order})
+    pool = None
+    try:
+        initargs = (names, model_path, metric, n_folds)
+        if processes > 1:
+            pool = multiprocessing.get_context().Pool(processes, initializer=_attach, initargs=initargs)
+        else:
+            _attach(*initargs)
+        evaluate = pool.imap_unordered if pool is not None else map
+
+        trials: List[TrialResult] = []
+        survivors = list(range(len(configs)))
+        for rung in range(rungs):
+            rows = n if rung == rungs - 1 else min(n, max(min_rows, n // eta ** (rungs - 1 - rung)))
+            scores = {index: [float("nan")] * n_folds for index in survivors}
+            seconds = dict.fromkeys(survivors, 0.0)
+            errors: Dict[int, str] = {}
+            tasks = [(index, configs[index], rows, fold) for index in survivors for fold in range(n_folds)]
+            for index, fold, score, elapsed, error in evaluate(_evaluate, tasks):
+                scores[index][fold] = score
+                seconds[index] += elapsed
+                if error:
+                    errors[index] = error
+            results = {index: TrialResult(configs[index], rung, rows, scores[index], seconds[index],
+                                          errors.get(index)) for index in survivors}
+            trials.extend(results.values())
+            for index, error in errors.items():
+                logger.error(f"Error evaluating {configs[index]}: {error}")
+            survivors.sort(key=lambda index: results[index].mean_score, reverse=True)
+            logger.info(f"Rung {rung}: {len(survivors)} configurations on {rows} rows, "
+                        f"best {metric}={results[survivors[0]].mean_score:.4f}")
+            if rung < rungs - 1:
+                survivors = survivors[:max(1, len(survivors) // eta)]
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        _detach()
+        _release(handles)
+
+    best = results[survivors[0]]
+    return TuningResult(model_class=model_path, metric=metric, best_params=best.params,
+                        best_score=best.mean_score, n_folds=n_folds, eta=eta, trials=trials)
@@ -10,21 +10,37 @@ import logging
 from kaizen_talent_analytics.services.model_orchestrator import ModelOrchestrator
 from kaizen_talent_analytics.goal_tracker import GoalTracker, Goal
 from kaizen_talent_analytics.session_audit import SessionLogger
-from kaizen_talent_analytics.connectors.ats_adapter import load_ats_events, filter_events
+from kaizen_talent_analytics.connectors.ats_ingestor import ATSIngestor
+from kaizen_talent_analytics.services.funnel_cube import FunnelCube
+from kaizen_talent_analytics.services.feature_store import FEATURE_NAMES, FeatureStore
+from kaizen_talent_analytics.services.model_registry import ModelRegistry
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Load dummy ATS data
+ATS_EVENTS_PATH = os.environ.get("ATS_EVENTS_PATH", "data/dummy_ats_events.csv")
+# When set, models are served from (and first-time fits saved to) this registry
+MODEL_REGISTRY_PATH = os.environ.get("MODEL_REGISTRY_PATH")
+
+# Funnel counts and candidate features are kept current from incremental ATS ingestion deltas
+funnel_cube = FunnelCube()
+feature_store = FeatureStore()
+ats_ingestor = ATSIngestor()
+funnel_cube.subscribe_to(ats_ingestor)
+feature_store.subscribe_to(ats_ingestor)
 try:
-    ats_data = pd.read_csv("data/dummy_ats_events.csv")
+    ats_ingestor.poll(ATS_EVENTS_PATH)
 except Exception as e:
     logger.error(f"Failed to load ATS data: {e}")
-    ats_data = pd.DataFrame(columns=["candidate_id", "source", "stage", "outcome", "timestamp"])
 
 # Initialize backend services
-model_orchestrator = ModelOrchestrator()
+model_registry = ModelRegistry(MODEL_REGISTRY_PATH) if MODEL_REGISTRY_PATH else None
+model_orchestrator = ModelOrchestrator(registry=model_registry, feature_names=FEATURE_NAMES)
+if model_registry is None or model_registry.current_version("retention") is None:
+    model_orchestrator.fit_all(feature_store.snapshot())
+    if model_registry is not None:
+        model_orchestrator.save_all()
 goal_tracker = GoalTracker()
 session_logger = SessionLogger()
 
@@ -48,15 +64,24 @@ session_logger.log_session(
 )
 
 # Prepare funnel summary data
-def prepare_funnel_data(df):
+def prepare_funnel_data(cube, start_time=None, end_time=None, sources=None):
     stages_order = ['Sourced', 'Screened', 'Interview', 'Hired']
-    counts = df['stage'].value_counts()
-    data = []
-    for stage in stages_order:
-        data.append({'Stage': stage, 'Count': counts.get(stage, 0)})
-    return pd.DataFrame(data)
+    return cube.funnel_frame(stages_order, start_time=start_time, end_time=end_time, sources=sources)
+
+funnel_data = prepare_funnel_data(funnel_cube)
 
-funnel_data = prepare_funnel_data(ats_data)
+# Retention scores for the most recently active candidates, from the shared feature store.
+# Scores come from predict_all, whose row memo only re-scores candidates changed since the last refresh
+def latest_retention_scores(store, orchestrator, limit=10):
+    features = store.snapshot()
+    if not len(features):
+        return []
+    predictions = orchestrator.predict_all(features)
+    if "retention" not in predictions:
+        return []
+    rows = features.last_event_us.argsort()[-limit:]
+    scores = predictions["retention"].prediction["retention_score"][rows]
+    return [(str(c), float(s)) for c, s in zip(features.candidate_ids[rows], scores)]
 
 # Initialize Dash app with Bootstrap theme
 from flask import Flask, send_from_directory
@@ -184,13 +209,15 @@ app.layout = dbc.Container([
     State('retention-data-store', 'data')
 )
 def update_dashboard(retention_data, retention_data_state):
-    # Simulate retention predictions
-    dummy_candidates = ['Alice', 'Bob', 'Charlie', 'Diana']
-    dummy_scores = [0.85, 0.60, 0.75, 0.90]
+    # Score the most recently active candidates with the fitted retention model
+    try:
+        new_entry = latest_retention_scores(feature_store, model_orchestrator)
+    except Exception as e:
+        logger.error(f"Failed to score retention: {e}")
+        new_entry = []
 
     # Limit retention data history to last 10 entries to prevent infinite growth
     retention_data = retention_data[-10:] if retention_data else []
-    new_entry = list(zip(dummy_candidates, dummy_scores))
     retention_data.append(new_entry)
 
     # Reset retention data if it grows beyond 50 entries to prevent memory bloat
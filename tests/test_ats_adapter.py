@@ -0,0 +1,123 @@
+import gzip
+import json
+import pytest
+from kaizen_talent_analytics.connectors.ats_adapter import filter_events, iter_ats_event_batches, load_ats_events
+from kaizen_talent_analytics.data.categorical import Vocabulary
+from kaizen_talent_analytics.data.event_index import EventIndex
+from kaizen_talent_analytics.data.schema import ATSEvent
+
+HEADER = "candidate_id,source,stage,outcome,timestamp\n"
+ROWS = [
+    "C00001,LinkedIn,Sourced,Passed,2024-01-15T10:00:00Z\n",
+    "C00001,LinkedIn,Interview,Passed,2024-01-20T10:00:00Z\n",
+    "C00002,Referral,Screened,Failed,not-a-date\n",
+    "C00003,Job Board,Hired,Passed,2024-02-01T09:30:00\n",
+]
+
+@pytest.fixture
+def csv_export(tmp_path):
+    path = tmp_path / "events.csv"
+    path.write_text(HEADER + "".join(ROWS))
+    return str(path)
+
+def test_batches_respect_chunk_size(csv_export):
+    batches = list(iter_ats_event_batches(csv_export, chunk_size=2))
+    assert [len(b) for b in batches] == [2, 1]
+    assert all(isinstance(e, ATSEvent) for b in batches for e in b)
+
+def test_gzip_ndjson_export(tmp_path):
+    path = tmp_path / "events.ndjson.gz"
+    with gzip.open(path, "wt") as handle:
+        for i in range(5):
+            handle.write(json.dumps({
+                "candidate_id": f"C{i}", "source": "LinkedIn", "stage": "Sourced",
+                "outcome": "Pending", "timestamp": "2024-03-01T00:00:00Z"
+            }) + "\n")
+    batches = list(iter_ats_event_batches(str(path), chunk_size=3))
+    assert [len(b) for b in batches] == [3, 2]
+
+def test_load_ats_events_returns_dicts(csv_export):
+    events = load_ats_events(csv_export)
+    assert len(events) == 3
+    assert events[0]["candidate_id"] == "C00001"
+    assert isinstance(events[0]["timestamp"], str)
+
+def test_load_ats_events_missing_source(tmp_path):
+    assert load_ats_events(str(tmp_path / "missing.csv")) == []
+
+def test_filter_events_keeps_input_order(csv_export):
+    events = load_ats_events(csv_export)[::-1]
+    filtered = filter_events(events, start_time="2024-01-15T10:00:00Z", end_time="2024-01-20T10:00:00")
+    assert [e["stage"] for e in filtered] == ["Interview", "Sourced"]
+    assert filter_events(events, stage="Hired")[0]["candidate_id"] == "C00003"
+
+def test_event_index_window_and_stage(csv_export):
+    index = EventIndex.from_events(load_ats_events(csv_export))
+    assert list(index.timestamps) == sorted(index.timestamps)
+    rows = index.select(stages=["Sourced", "Hired"], start_time="2024-01-16T00:00:00Z")
+    assert [r["candidate_id"] for r in index.to_records(rows)] == ["C00003"]
+    assert filter_events(index, stage="Interview")[0]["timestamp"].startswith("2024-01-20T10:00:00")
+    assert index.select(stage="Offer").size == 0
+
+def test_event_index_dictionary_encoding(csv_export):
+    index = EventIndex.from_events(load_ats_events(csv_export))
+    assert index.codes["stage"].dtype.itemsize == 1
+    assert index.count_by("candidate_id") == {"C00001": 2, "C00003": 1}
+    assert list(index.column("source")) == ["LinkedIn", "LinkedIn", "Job Board"]
+
+def test_vocabulary_codes_are_stable():
+    vocab = Vocabulary(["Sourced", "Hired"])
+    assert list(vocab.encode(["Hired", "Interview", "Sourced"])) == [1, 2, 0]
+    assert vocab.code("Rejected") == -1
+    assert list(vocab.decode([2, 0])) == ["Interview", "Sourced"]
+    vocab.encode([f"C{i}" for i in range(1_000)])  # grows the cached lookup past its capacity
+    decoded = vocab.decode([1_002, 1])
+    assert list(decoded) == ["C999", "Hired"]
+    decoded[0] = "changed"
+    assert vocab.decode([1_002])[0] == "C999"
+
+def test_ingestor_delivers_only_new_rows(tmp_path):
+    from kaizen_talent_analytics.connectors.ats_ingestor import ATSIngestor, CheckpointStore
+    path = tmp_path / "live.csv"
+    path.write_text(HEADER + ROWS[0] + ROWS[1])
+    deltas = []
+    ingestor = ATSIngestor(checkpoint=CheckpointStore(str(tmp_path / "checkpoint.json")))
+    ingestor.subscribe(lambda source, events: deltas.append([e.stage for e in events]))
+    assert ingestor.poll(str(path)) == 2
+
+    with open(path, "a") as handle:
+        handle.write(ROWS[3] + "C00004,Referral,Sourced,Pending,2024-02-02")  # partial last line
+    assert ingestor.poll(str(path)) == 1
+    assert deltas == [["Sourced", "Interview"], ["Hired"]]
+
+    resumed = ATSIngestor(checkpoint=CheckpointStore(str(tmp_path / "checkpoint.json")))
+    watermark = resumed.watermark(str(path))
+    assert watermark.rows == 3
+    assert watermark.last_timestamp.startswith("2024-02-01T09:30:00")
+    with open(path, "a") as handle:
+        handle.write("T10:00:00\n")
+    assert resumed.poll(str(path)) == 1
+
+def test_read_new_records_keeps_quoted_newlines_and_skips_blank_lines(tmp_path):
+    from kaizen_talent_analytics.connectors.ats_ingestor import Watermark, read_new_records
+    path = tmp_path / "live.csv"
+    path.write_text(HEADER + ROWS[0] + "\n" + 'C00002,"Job\nBoard",Sourced,Passed,2024-01-16T10:00:00Z\n'
+                    + 'C00003,"Career\nFair')  # quoted field still being written
+    records, watermark = read_new_records(str(path), Watermark(source=str(path)))
+    assert [r["source"] for r in records] == ["LinkedIn", "Job\nBoard"]
+    assert watermark.rows == 2 and watermark.offset == len(path.read_bytes()) - len('C00003,"Career\nFair')
+
+    with open(path, "a") as handle:
+        handle.write('",Sourced,Passed,2024-01-17T10:00:00Z\n')
+    records, watermark = read_new_records(str(path), watermark)
+    assert [r["source"] for r in records] == ["Career\nFair"]
+    assert watermark.rows == 3 and watermark.offset == len(path.read_bytes())
+
+def test_parquet_frames_match_csv(csv_export, tmp_path):
+    import pandas as pd
+    from kaizen_talent_analytics.connectors.ats_adapter import iter_ats_frames
+    path = str(tmp_path / "events.parquet")
+    pd.read_csv(csv_export, dtype=str).to_parquet(path)
+    frames = list(iter_ats_frames(path, chunk_size=3))
+    assert [len(f) for f in frames] == [3, 1]
+    assert pd.concat(frames, ignore_index=True).equals(pd.read_csv(csv_export, dtype=str, keep_default_na=False))
@@ -41,3 +41,22 @@ def test_session_record():
         active_modules=["ModuleA", "ModuleB"]
     )
     assert session.duration == 3600
+
+def test_batch_validator_quarantines_bad_rows(tmp_path):
+    import json
+    from kaizen_talent_analytics.data.validation import BatchValidator
+    dead_letter = tmp_path / "dead_letter.ndjson"
+    validator = BatchValidator(dead_letter_path=str(dead_letter))
+    batch = validator.validate([
+        {"candidate_id": "C1", "source": "LinkedIn", "stage": "Interview", "outcome": "Passed", "timestamp": "2024-06-26T12:00:00Z"},
+        {"candidate_id": "", "source": "LinkedIn", "stage": "Interview", "outcome": "Passed", "timestamp": "2024-06-26T12:00:00Z"},
+        {"candidate_id": "C3", "source": "Referral", "stage": "Lunch", "outcome": "Passed", "timestamp": "2024-06-26T12:00:00Z"},
+        {"candidate_id": "C4", "source": "Referral", "stage": "Hired", "outcome": "Passed", "timestamp": "invalid-date"},
+    ], source="unit")
+    assert batch.frame["candidate_id"].tolist() == ["C1"]
+    assert batch.frame["timestamp"].tolist() == [1719403200000000]
+    assert batch.report.reasons == {"missing candidate_id": 1, "unknown stage": 1, "invalid timestamp": 1}
+    quarantined = [json.loads(line) for line in dead_letter.read_text().splitlines()]
+    assert [q["record"]["candidate_id"] for q in quarantined] == ["", "C3", "C4"]
+    assert validator.totals.rows_per_second > 0
+    assert len(batch.to_index()) == 1
@@ -0,0 +1,66 @@
+import numpy as np
+from kaizen_talent_analytics.predictive_models import RetentionModel
+from kaizen_talent_analytics.services import model_orchestrator
+from kaizen_talent_analytics.services.drift_monitor import DriftMonitor, QuantileSketch
+from kaizen_talent_analytics.services.feature_store import FeatureSet
+from kaizen_talent_analytics.services.model_orchestrator import ModelOrchestrator
+
+def test_quantile_sketch_is_accurate_mergeable_and_bounded():
+    values = np.random.default_rng(0).lognormal(size=50_000) * np.where(np.arange(50_000) % 5, 1, -1)
+    whole, left, right = QuantileSketch(), QuantileSketch(), QuantileSketch()
+    whole.update(values)
+    left.update(values[:20_000])
+    right.update(values[20_000:])
+    left.merge(right)
+    assert np.array_equal(left.keys, whole.keys) and np.array_equal(left.counts, whole.counts)
+    for q in (0.05, 0.5, 0.95):
+        exact = np.quantile(values, q)
+        assert abs(whole.quantile(q) - exact) <= 0.02 * abs(exact) + 1e-3
+    small = QuantileSketch(max_buckets=64)
+    small.update(values)
+    assert len(small.keys) == 64 and small.count == len(values)
+
+def test_drift_scores_flag_shifted_features_only():
+    rng = np.random.default_rng(1)
+    monitor = DriftMonitor(["tenure", "score"], max_rows=5_000)
+    cohorts = np.array(["2024-01", "2024-02"], dtype=object)
+    reference = FeatureSet(candidate_ids=np.arange(40_000), features=rng.normal(size=(40_000, 2)), labels={},
+                           cohorts=cohorts[rng.integers(0, 2, 40_000)], last_event_us=np.zeros(40_000), as_of=0)
+    monitor.set_reference(reference)
+    live = rng.normal(size=(20_000, 2))
+    live[:, 1] += 1.0
+    monitor.update(FeatureSet(candidate_ids=np.arange(20_000), features=live, labels={},
+                              cohorts=np.full(20_000, "2024-02", dtype=object), last_event_us=np.zeros(20_000), as_of=0))
+    scores = monitor.scores()
+    assert scores["tenure"].psi < 0.05 and scores["tenure"].ks < 0.05
+    assert scores["score"].ks > 0.3 and scores["score"].drifted
+    assert scores["cohorts"].kind == "categorical" and scores["cohorts"].ks is None
+    assert np.isclose(scores["score"].live_count, 20_000)
+    assert sorted(monitor.drifted()) == ["cohorts", "score"]
+
+def test_cohort_column_of_training_frames_feeds_the_cohorts_sketch():
+    rng = np.random.default_rng(3)
+    reference = FeatureSet(candidate_ids=np.arange(1_000), features=rng.normal(size=(1_000, 2)),
+                           labels={"hired": rng.random(1_000) < 0.5},
+                           cohorts=np.array(["2024-01", "2024-02"], dtype=object)[rng.integers(0, 2, 1_000)],
+                           last_event_us=np.zeros(1_000), as_of=0, feature_names=("tenure", "score"))
+    monitor = DriftMonitor()
+    monitor.set_reference(reference.frame())
+    assert set(monitor.reference) == {"tenure", "score", "cohorts"}
+    monitor.update(FeatureSet(candidate_ids=np.arange(500), features=rng.normal(size=(500, 2)), labels={},
+                              cohorts=np.full(500, "2024-03", dtype=object), last_event_us=np.zeros(500), as_of=0))
+    assert monitor.scores()["cohorts"].drifted
+
+def test_orchestrator_sketches_training_and_uncached_predictions(monkeypatch):
+    monkeypatch.setattr(model_orchestrator, "MODEL_CLASSES", {"retention": RetentionModel})
+    rng = np.random.default_rng(2)
+    X = rng.normal(size=(500, 3))
+    y = (X[:, 0] > 0).astype(float)
+    orchestrator = ModelOrchestrator()
+    orchestrator.fit_all((X, y))
+    orchestrator.predict_all(X + 3)
+    orchestrator.predict_all(X + 3)  # cache hit, not counted twice
+    report = orchestrator.drift_report()
+    assert set(report) == {"feature_0", "feature_1", "feature_2"}
+    assert report["feature_0"].reference_count == 500 and report["feature_0"].live_count == 500
+    assert all(score.drifted for score in report.values())
@@ -0,0 +1,36 @@
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from kaizen_talent_analytics.data.event_store import ATSEventStore
+from kaizen_talent_analytics.data.schema import ATSEvent
+
+EVENTS = [
+    ATSEvent(candidate_id="C1", source="LinkedIn", stage="Sourced", outcome="Passed", timestamp="2024-01-15T10:00:00Z"),
+    ATSEvent(candidate_id="C1", source="LinkedIn", stage="Interview", outcome="Passed", timestamp="2024-01-16T09:00:00Z"),
+    ATSEvent(candidate_id="C2", source="Referral", stage="Sourced", outcome="Pending", timestamp="2024-01-16T23:59:00Z"),
+    ATSEvent(candidate_id="C3", source="Referral", stage="Hired", outcome="Passed", timestamp="2024-01-18T08:00:00"),
+]
+
+@pytest.mark.parametrize("storage_format", ["parquet", "arrow"])
+def test_write_partitions_by_date(tmp_path, storage_format):
+    store = ATSEventStore(str(tmp_path), storage_format=storage_format)
+    assert store.write(EVENTS) == 4
+    assert store.partitions() == ["2024-01-15", "2024-01-16", "2024-01-18"]
+    assert len(store.read()) == 4
+
+def test_predicate_pushdown(tmp_path):
+    store = ATSEventStore(str(tmp_path))
+    store.write(EVENTS)
+    df = store.read(columns=["candidate_id"], stages=["Sourced"], sources=["Referral"])
+    assert list(df.columns) == ["candidate_id"]
+    assert df["candidate_id"].tolist() == ["C2"]
+
+def test_time_range(tmp_path):
+    store = ATSEventStore(str(tmp_path))
+    store.write(EVENTS)
+    df = store.read(start_time="2024-01-16T00:00:00Z", end_time="2024-01-16T12:00:00Z")
+    assert df["stage"].tolist() == ["Interview"]
+
+def test_empty_store(tmp_path):
+    assert ATSEventStore(str(tmp_path)).read().empty
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+from kaizen_talent_analytics.data.categorical import new_vocabularies
+from kaizen_talent_analytics.data.event_index import CATEGORICAL_COLUMNS, EventIndex
+from kaizen_talent_analytics.data.generation.generate_dummy_data import generate_ats_dataset
+from kaizen_talent_analytics.predictive_models import RetentionModel, TimeToHireModel
+from kaizen_talent_analytics.services.feature_batches import FeatureBatches, build_feature_partitions
+from kaizen_talent_analytics.services.feature_store import FeatureStore
+from kaizen_talent_analytics.services.model_orchestrator import ModelOrchestrator
+
+def _history(tmp_path, n_candidates=600):
+    path = str(tmp_path / "ats.csv")
+    generate_ats_dataset(path, n_candidates, seed=3)
+    store = FeatureStore(vocabularies=new_vocabularies(CATEGORICAL_COLUMNS))
+    store.update(EventIndex.from_frame(pd.read_csv(path, dtype=str), vocabularies=store.vocabularies))
+    return path, store.snapshot()
+
+def test_partitions_match_in_memory_features(tmp_path):
+    path, full = _history(tmp_path)
+    directory = build_feature_partitions([path], str(tmp_path / "parts"), partitions=3, chunk_size=500)
+    batches = FeatureBatches(directory, batch_size=64)
+    assert len(batches.partitions) == 3 and len(batches) == len(full)
+
+    first, second = [np.concatenate([b.candidate_ids for b in batches]) for _ in range(2)]
+    assert sorted(first) == sorted(full.candidate_ids) and not np.array_equal(first, second)
+    ordered = sorted(FeatureBatches(directory, shuffle=False), key=lambda b: b.candidate_ids[0])
+    frame = pd.concat(b.frame() for b in ordered).sort_index()
+    expected = full.frame().sort_index()
+    np.testing.assert_allclose(frame[list(full.feature_names)], expected[list(full.feature_names)])
+    assert frame["time_to_hire_days"].equals(expected["time_to_hire_days"])
+
+def test_fit_batches_matches_in_memory_fit(tmp_path):
+    path, full = _history(tmp_path)
+    batches = FeatureBatches(build_feature_partitions([path], str(tmp_path / "parts"), partitions=2), batch_size=100)
+    for cls in (RetentionModel, TimeToHireModel):
+        in_memory, streamed = cls(), cls()
+        in_memory.fit(full)
+        streamed.fit_batches(batches)
+        for key, values in in_memory.predict(full).prediction.items():
+            np.testing.assert_allclose(streamed.predict(full).prediction[key], values, rtol=1e-4)
+
+    orchestrator = ModelOrchestrator()
+    status = orchestrator.fit_stream(batches)
+    assert all(outcome.ok for outcome in status.values())
+    assert set(orchestrator.predict_all(full.features)) == set(status)
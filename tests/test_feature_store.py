@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+from kaizen_talent_analytics.connectors.ats_ingestor import Watermark
+from kaizen_talent_analytics.data.categorical import new_vocabularies
+from kaizen_talent_analytics.data.event_index import CATEGORICAL_COLUMNS
+from kaizen_talent_analytics.data.schema import FUNNEL_STAGES
+from kaizen_talent_analytics.services.feature_store import FEATURE_NAMES, FeatureStore
+
+def _event(candidate_id, source, stage, outcome, timestamp):
+    return {"candidate_id": candidate_id, "source": source, "stage": stage,
+            "outcome": outcome, "timestamp": timestamp}
+
+BATCH_1 = [
+    _event("C1", "LinkedIn", "Sourced", "Passed", "2024-01-01T00:00:00Z"),
+    _event("C2", "Referral", "Sourced", "Passed", "2024-01-02T00:00:00Z"),
+    _event("C1", "LinkedIn", "Interview", "Passed", "2024-01-05T00:00:00Z"),
+]
+BATCH_2 = [
+    _event("C2", "Referral", "Withdrawn", "Failed", "2024-01-04T00:00:00Z"),
+    _event("C1", "LinkedIn", "Hired", "Passed", "2024-01-11T00:00:00Z"),
+    _event("C3", "Job Board", "Sourced", "Pending", "2024-01-06T00:00:00Z"),
+]
+
+def _store(**kwargs):
+    return FeatureStore(vocabularies=new_vocabularies(CATEGORICAL_COLUMNS), **kwargs)
+
+def test_incremental_updates_match_full_build():
+    incremental = _store()
+    incremental.update(BATCH_1)
+    touched = incremental.update(BATCH_2)
+    assert len(touched) == 3
+    full = _store()
+    full.update(BATCH_1 + BATCH_2)
+    assert incremental.snapshot().frame().equals(full.snapshot().frame())
+
+def test_snapshot_features_and_labels():
+    store = _store()
+    store.update(BATCH_1 + BATCH_2)
+    frame = store.snapshot().frame()
+    c1, c2, c3 = frame.loc["C1"], frame.loc["C2"], frame.loc["C3"]
+    assert (c1["events"], c1["stage_depth"], c1["days_active"]) == (2, 3, 4)  # up to, not including, the hire
+    assert c1["hired"] and c1["retained"] and c1["time_to_hire_days"] == 10
+    assert c2["dropped_out"] and not c2["retained"] and c2["time_to_hire_days"] == 2
+    assert c3["retained"] and not c3["hired"] and c3["time_to_hire_days"] == 5  # censored at the last event
+    assert c2["cohort"] == "Referral" and c2["source_referral"] == 1
+
+def test_features_do_not_encode_the_outcome():
+    journey = [("Sourced", "2024-01-01"), ("Interview", "2024-01-04"), ("Offer", "2024-01-09")]
+    outcomes = {"H": ("Hired", "2024-01-12"), "W": ("Withdrawn", "2024-01-12"), "O": None}
+    events = []
+    for candidate, outcome in outcomes.items():
+        for stage, day in journey + ([outcome] if outcome else []):
+            events.append(_event(candidate, "LinkedIn", stage, "Passed", f"{day}T00:00:00Z"))
+    store = _store()
+    store.update(events)
+    frame = store.snapshot(as_of=np.datetime64("2024-01-12", "us").astype(np.int64)).frame()
+    assert frame.loc["H", "hired"] and frame.loc["W", "dropped_out"] and frame.loc["O", "retained"]
+    assert frame.loc["H", "stage_depth"] == FUNNEL_STAGES.index("Offer")
+    features = frame[list(FEATURE_NAMES)]
+    assert (features.loc["H"] == features.loc["W"]).all() and (features.loc["H"] == features.loc["O"]).all()
+    assert features.loc["H", "days_active"] != frame.loc["H", "time_to_hire_days"]
+
+def test_snapshots_are_read_only_and_stable():
+    store = _store()
+    store.update(BATCH_1)
+    snapshot = store.snapshot()
+    with pytest.raises(ValueError):
+        snapshot.features[0, 0] = 99
+    before = snapshot.features.copy()
+    store.update(BATCH_2)
+    np.testing.assert_array_equal(snapshot.features, before)
+
+def test_cache_round_trip_keyed_by_watermark(tmp_path):
+    watermarks = [Watermark(source="ats.csv", offset=120, rows=3)]
+    store = _store(cache_dir=str(tmp_path))
+    store.update(BATCH_1 + BATCH_2)
+    store.save(watermarks)
+
+    restored = _store(cache_dir=str(tmp_path))
+    assert not restored.load([Watermark(source="ats.csv", offset=240, rows=6)])
+    assert restored.load(watermarks)
+    assert restored.snapshot().frame().sort_index().equals(store.snapshot().frame().sort_index())
+    assert restored.snapshot().features.shape == (3, len(FEATURE_NAMES))
@@ -0,0 +1,45 @@
+from kaizen_talent_analytics.services.funnel_cube import FunnelCube
+
+def _event(candidate_id, source, stage, outcome, timestamp):
+    return {"candidate_id": candidate_id, "source": source, "stage": stage,
+            "outcome": outcome, "timestamp": timestamp}
+
+BATCH_1 = [
+    _event("C1", "LinkedIn", "Sourced", "Passed", "2024-01-01T10:00:00Z"),
+    _event("C2", "Referral", "Sourced", "Passed", "2024-01-02T10:00:00Z"),
+    _event("C1", "LinkedIn", "Interview", "Failed", "2024-01-03T10:00:00Z"),
+]
+BATCH_2 = [
+    _event("C3", "Job Board", "Sourced", "Pending", "2023-12-30T08:00:00Z"),
+    _event("C2", "Referral", "Hired", "Passed", "2024-01-05T10:00:00Z"),
+]
+
+def test_incremental_updates_match_full_build():
+    incremental = FunnelCube()
+    incremental.update(BATCH_1)
+    incremental.update(BATCH_2)
+    full = FunnelCube()
+    full.update(BATCH_1 + BATCH_2)
+    assert incremental.slice() == full.slice() == {"Sourced": 3, "Interview": 1, "Hired": 1}
+
+def test_slices_by_date_source_and_outcome():
+    cube = FunnelCube()
+    cube.update(BATCH_1 + BATCH_2)
+    assert cube.slice(start_time="2024-01-01", end_time="2024-01-02") == {"Sourced": 2}
+    assert cube.slice(sources=["Referral"], by="outcome") == {"Passed": 2}
+    assert cube.slice(sources=["Unknown"]) == {}
+    assert cube.daily("Sourced").sum() == 3
+
+def test_funnel_frame_order():
+    cube = FunnelCube()
+    cube.update(BATCH_1)
+    frame = cube.funnel_frame(["Sourced", "Interview", "Hired"])
+    assert frame["Count"].tolist() == [2, 1, 0]
+
+def test_update_reencodes_index_from_other_vocabularies():
+    from kaizen_talent_analytics.data.categorical import new_vocabularies
+    from kaizen_talent_analytics.data.event_index import CATEGORICAL_COLUMNS, EventIndex
+    private = new_vocabularies(CATEGORICAL_COLUMNS, {"stage": ["Hired", "Interview"]})
+    cube = FunnelCube(vocabularies=new_vocabularies(CATEGORICAL_COLUMNS))
+    cube.update(EventIndex.from_events(BATCH_1 + BATCH_2, vocabularies=private))
+    assert cube.slice() == {"Sourced": 3, "Interview": 1, "Hired": 1}
@@ -0,0 +1,23 @@
+import pandas as pd
+from kaizen_talent_analytics.connectors.ats_adapter import load_ats_events
+from kaizen_talent_analytics.data.generation.generate_dummy_data import (
+    STAGE_FLOW, generate_ats_dataset, generate_journeys,
+)
+
+def test_generation_is_deterministic():
+    pd.testing.assert_frame_equal(generate_journeys(500, seed=7), generate_journeys(500, seed=7))
+
+def test_journeys_follow_funnel_order():
+    frame = generate_journeys(2000, seed=1)
+    assert (frame.groupby("candidate_id", sort=False)["stage"].first() == "Sourced").all()
+    assert frame.groupby("candidate_id", sort=False)["timestamp"].apply(lambda t: t.is_monotonic_increasing).all()
+    funnel = frame["stage"].value_counts()
+    counts = [funnel[stage] for stage in STAGE_FLOW]
+    assert counts == sorted(counts, reverse=True)
+
+def test_chunked_export_matches_across_chunks(tmp_path):
+    path = tmp_path / "events.csv.gz"
+    rows = generate_ats_dataset(str(path), 300, seed=3, chunk_candidates=120)
+    events = load_ats_events(str(path))
+    assert len(events) == rows
+    assert len({e["candidate_id"] for e in events}) == 300
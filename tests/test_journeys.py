@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from kaizen_talent_analytics.data.categorical import new_vocabularies
+from kaizen_talent_analytics.data.event_index import CATEGORICAL_COLUMNS, EventIndex
+from kaizen_talent_analytics.services.journeys import build_journeys
+
+def _index(rows):
+    events = [dict(zip(("candidate_id", "stage", "timestamp"), row), source="LinkedIn", outcome="Passed")
+              for row in rows]
+    return EventIndex.from_events(events, vocabularies=new_vocabularies(CATEGORICAL_COLUMNS))
+
+EVENTS = [
+    ("C2", "Sourced", "2024-01-01T00:00:00Z"),
+    ("C1", "Sourced", "2024-01-01T00:00:00Z"),
+    ("C1", "Interview", "2024-01-03T00:00:00Z"),
+    ("C2", "Interview", "2024-01-02T00:00:00Z"),
+    ("C1", "Hired", "2024-01-04T00:00:00Z"),
+    ("C2", "Rejected", "2024-01-05T00:00:00Z"),
+]
+
+def test_journeys_are_ordered_per_candidate():
+    journeys = build_journeys(_index(EVENTS), stages=["Sourced", "Interview", "Hired", "Rejected"])
+    assert len(journeys) == 2
+    assert journeys.lengths.tolist() == [3, 3]
+    j = list(journeys.candidate_ids).index("C1")
+    sequence = journeys.stage[journeys.offsets[j]:journeys.offsets[j + 1]]
+    assert [journeys.stages[s] for s in sequence] == ["Sourced", "Interview", "Hired"]
+
+def test_transition_matrices():
+    journeys = build_journeys(_index(EVENTS), stages=["Sourced", "Interview", "Hired", "Rejected"])
+    assert journeys.transition_counts[0, 1] == 2
+    np.testing.assert_allclose(journeys.conversion_rates[1], [0, 0, 0.5, 0.5])
+    day = 86_400
+    assert journeys.dwell_mean_seconds[0, 1] == pytest.approx(1.5 * day)
+    assert journeys.dwell_median_seconds[1, 3] == pytest.approx(3 * day)
+    assert np.isnan(journeys.dwell_mean_seconds[2, 0])
+    assert journeys.reached_counts().tolist() == [2, 2, 1, 1]
+    hired = journeys.first_reached("Hired")
+    assert (hired >= 0).tolist() == [journeys.candidate_ids[0] == "C1", journeys.candidate_ids[1] == "C1"]
+
+def test_empty_index():
+    journeys = build_journeys(_index([]))
+    assert len(journeys) == 0
+    assert journeys.transition_counts.sum() == 0
+
+def test_time_to_hire_arrays_censor_open_and_exited_candidates():
+    events = EVENTS + [("C3", "Sourced", "2024-01-02T00:00:00Z")]
+    journeys = build_journeys(_index(events))
+    durations, observed = journeys.time_to_event("Hired", as_of=None)
+    by_candidate = dict(zip(journeys.candidate_ids, zip(durations, observed)))
+    assert by_candidate["C1"] == (3.0, True)
+    assert by_candidate["C2"] == (4.0, False)
+    assert by_candidate["C3"] == (3.0, False)
@@ -0,0 +1,41 @@
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pytest
+from kaizen_talent_analytics.services.micro_batcher import MicroBatcher
+from kaizen_talent_analytics.services.model_orchestrator import ModelOrchestrator
+
+def _orchestrator():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(300, 3))
+    y = (X[:, 0] > 0).astype(float)
+    orchestrator = ModelOrchestrator()
+    orchestrator.retention_model.fit((X, y))
+    orchestrator.time_to_hire_model.fit((X, np.abs(X[:, 1]) * 5, y.astype(bool)))
+    orchestrator.flight_risk_detector.fit((X, y))
+    return orchestrator, X
+
+def test_concurrent_requests_are_coalesced():
+    orchestrator, X = _orchestrator()
+    expected = orchestrator.retention_model.predict(X[:64]).prediction["retention_score"]
+    with MicroBatcher(orchestrator, max_batch_size=32, max_wait_ms=50) as batcher:
+        with ThreadPoolExecutor(max_workers=64) as callers:
+            futures = [callers.submit(batcher.predict, X[i], f"C{i}") for i in range(64)]
+            results = [f.result(timeout=10) for f in futures]
+        metrics = batcher.metrics()
+    scores = [r["retention"].prediction["retention_score"] for r in results]
+    np.testing.assert_allclose(scores, expected)
+    assert metrics.requests == 64 and metrics.batches < 64
+    assert metrics.max_batch_size <= 32 and metrics.queue_depth == 0
+    assert metrics.mean_batch_size > 1 and metrics.wait_ms_max >= 0
+    assert orchestrator.cache_stats["entries"] == 0  # batches are served from the row memo only
+
+def test_failures_fan_out_and_full_queue_rejects():
+    with MicroBatcher(ModelOrchestrator(), max_wait_ms=1) as batcher:
+        with pytest.raises(RuntimeError):
+            batcher.predict(np.zeros(3), timeout=10)  # unfitted models
+        assert batcher.metrics().failed_batches == 1
+    batcher = MicroBatcher(ModelOrchestrator(), max_queue=1)
+    batcher.submit(np.zeros(3))
+    with pytest.raises(RuntimeError):
+        batcher.submit(np.zeros(3))
+    assert batcher.metrics().rejected == 1
@@ -1,5 +1,8 @@
+import threading
+import numpy as np
 import pytest
-from kaizen_talent_analytics.services.model_orchestrator import ModelOrchestrator
+from kaizen_talent_analytics.predictive_models import RetentionModel
+from kaizen_talent_analytics.services.model_orchestrator import MODEL_CLASSES, ModelOrchestrator
 
 def test_fit_all():
     orchestrator = ModelOrchestrator()
@@ -22,3 +25,74 @@ def test_explain_all():
         assert isinstance(explanations, dict)
     except Exception:
         pytest.fail("explain_all raised Exception unexpectedly!")
+
+def test_fit_workers_fall_back_to_spawn_without_forkserver(monkeypatch):
+    import multiprocessing
+    from kaizen_talent_analytics.services.model_orchestrator import _fit_context
+    assert _fit_context().get_start_method() != "fork"
+    monkeypatch.setattr(multiprocessing, "get_all_start_methods", lambda: ["spawn"])
+    assert _fit_context().get_start_method() == "spawn"
+
+class HangingFitModel(RetentionModel):
+    def fit(self, data):
+        threading.Event().wait()  # never set: only the orchestrator's timeout ends this fit
+
+def test_parallel_fit_reports_partial_results(monkeypatch):
+    monkeypatch.setitem(MODEL_CLASSES, "flight_risk", HangingFitModel)
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 3))
+    y = (X[:, 0] > 0).astype(float)
+    orchestrator = ModelOrchestrator(parallel=True, timeout=3.0)
+    try:
+        status = orchestrator.fit_all((X, y))
+        assert status["retention"].ok and orchestrator.retention_model.is_fitted
+        assert not status["time_to_hire"].ok and "ValueError" in status["time_to_hire"].error
+        assert not status["flight_risk"].ok and "timed out" in status["flight_risk"].error
+
+        predictions = orchestrator.predict_all(X)
+        assert set(predictions) == {"retention"}
+        assert not orchestrator.last_status["flight_risk"].ok
+    finally:
+        orchestrator.close()
+
+def test_timed_out_predictions_do_not_starve_later_calls(monkeypatch):
+    release = threading.Event()
+
+    class HangingPredictModel(RetentionModel):
+        def predict(self, data):
+            if not release.is_set():
+                release.wait()
+            return super().predict(data)
+
+    monkeypatch.setitem(MODEL_CLASSES, "flight_risk", HangingPredictModel)
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 3))
+    y = (X[:, 0] > 0).astype(float)
+    orchestrator = ModelOrchestrator(parallel=True, timeout=0.5)
+    orchestrator.retention_model.fit((X, y))
+    orchestrator.flight_risk_detector.fit((X, y))
+    try:
+        # Each call abandons one hanging thread; a shared pool would have none left for the last call.
+        for _ in range(orchestrator.max_workers + 1):
+            predictions = orchestrator.predict_all(X)
+            assert "retention" in predictions and "flight_risk" not in predictions
+        release.set()
+        assert "flight_risk" in orchestrator.predict_all(X[:10])
+    finally:
+        release.set()
+        orchestrator.close()
+
+def test_explain_all_is_cached_per_model_version():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(300, 3))
+    y = (X[:, 0] > 0).astype(float)
+    durations = rng.exponential(30, size=len(X))
+    orchestrator = ModelOrchestrator()
+    orchestrator.fit_all((X, y))
+    orchestrator.time_to_hire_model.fit((X, durations, y.astype(bool)))
+    first = orchestrator.explain_all(X[:20], background_size=10, top_k=2)
+    assert set(first) == set(MODEL_CLASSES)
+    assert orchestrator.explain_all(X[:20], background_size=10, top_k=2)["retention"] is first["retention"]
+    orchestrator.fit_all((X, 1 - y))
+    refreshed = orchestrator.explain_all(X[:20], background_size=10, top_k=2)
+    assert refreshed["retention"] is not first["retention"]
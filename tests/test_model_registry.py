@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from kaizen_talent_analytics.predictive_models import FlightRiskDetector, RetentionModel, TimeToHireModel
+from kaizen_talent_analytics.services.model_orchestrator import ModelOrchestrator
+from kaizen_talent_analytics.services.model_registry import ModelRegistry
+
+FEATURES = ("tenure", "engagement", "referrals")
+
+def _data(n=500, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n, len(FEATURES)))
+    y = (X[:, 0] + rng.normal(scale=0.5, size=n) > 0).astype(float)
+    return X, y
+
+def test_register_and_load_round_trip(tmp_path):
+    X, y = _data()
+    registry = ModelRegistry(str(tmp_path))
+    for name, model, data in [
+        ("retention", RetentionModel(l2=0.5), (X, y)),
+        ("time_to_hire", TimeToHireModel(horizon_days=60), (X, np.abs(X[:, 1]) * 10, y.astype(bool), np.where(y > 0, "a", "b"))),
+        ("flight_risk", FlightRiskDetector(), (X, y)),
+    ]:
+        model.fit(data)
+        record = registry.register(name, model, metrics={"auc": 0.9}, feature_names=FEATURES)
+        loaded = registry.load(name)
+        assert record.version == 1 and registry.describe(name, 1).metrics == {"auc": 0.9}
+        assert loaded.get_params() == model.get_params()
+        for key, expected in model.predict(X).prediction.items():
+            np.testing.assert_allclose(loaded.predict(X).prediction[key], expected)
+    assert isinstance(registry.load("retention").coef_, np.memmap)
+
+def test_schema_mismatch_is_rejected(tmp_path):
+    registry = ModelRegistry(str(tmp_path))
+    model = RetentionModel()
+    model.fit(_data())
+    registry.register("retention", model, feature_names=FEATURES)
+    with pytest.raises(ValueError):
+        registry.load("retention", feature_names=FEATURES[::-1])
+
+def test_orchestrator_loads_lazily_and_rolls_back(tmp_path):
+    X, y = _data()
+    registry = ModelRegistry(str(tmp_path))
+    trainer = ModelOrchestrator(registry=registry, feature_names=FEATURES)
+    trainer.retention_model.fit((X, y))
+    assert trainer.save_all() == {"retention": 1}
+    first = trainer.retention_model.predict(X).prediction["retention_score"]
+    trainer.retention_model.fit((X, 1 - y))
+    assert trainer.save_all() == {"retention": 2}
+
+    server = ModelOrchestrator(registry=registry, feature_names=FEATURES)
+    assert server.model_versions == {}  # nothing loaded until first use
+    assert server.retention_model.is_fitted
+    assert server.model_versions == {"retention": 2}
+    assert server.rollback("retention") == 1
+    np.testing.assert_allclose(server.retention_model.predict(X).prediction["retention_score"], first)
+    assert server.model_versions == {"retention": 1}
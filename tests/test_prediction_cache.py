@@ -0,0 +1,119 @@
+import threading
+import numpy as np
+import pandas as pd
+import pytest
+from kaizen_talent_analytics.services.model_orchestrator import ModelOrchestrator
+from kaizen_talent_analytics.services.prediction_cache import PredictionCache, content_hash
+
+def test_content_hash_sees_values_hidden_by_truncated_repr():
+    frame = pd.DataFrame({"x": np.arange(10_000, dtype=float)})
+    changed = frame.copy()
+    changed.loc[5_000, "x"] = -1.0
+    assert str(frame) == str(changed)
+    assert content_hash(frame) != content_hash(changed)
+    assert content_hash(frame) == content_hash(frame.copy())
+    assert content_hash(np.zeros((2, 3))) != content_hash(np.zeros((3, 2)))
+
+def test_content_hash_rejects_objects_identified_by_address():
+    assert content_hash(("batch", 1, None)) == content_hash(("batch", 1, None))
+    with pytest.raises(TypeError):
+        content_hash(object())
+
+def test_lru_eviction_by_bytes_and_entries():
+    cache = PredictionCache(max_bytes=3 * 800, max_entries=None)
+    for key in "abc":
+        cache.put(key, np.zeros(100))
+    cache.get("a")  # "b" is now least recently used
+    cache.put("d", np.zeros(100))
+    assert "b" not in cache and "a" in cache
+    assert cache.stats.evictions == 1 and cache.stats.bytes == 3 * 800
+    assert not cache.put("huge", np.zeros(1000))
+
+def test_ttl_expiry_and_counters():
+    now = [0.0]
+    cache = PredictionCache(ttl_seconds=10, clock=lambda: now[0])
+    cache.put("k", 1)
+    assert cache.get("k") == 1
+    now[0] = 11.0
+    assert cache.get("k") is None
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.expirations, stats.entries) == (1, 1, 1, 0)
+
+def test_orchestrator_invalidates_on_refit():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 3))
+    y = (X[:, 0] > 0).astype(float)
+    orchestrator = ModelOrchestrator()
+    orchestrator.retention_model.fit((X, y))
+    orchestrator.time_to_hire_model.fit((X, np.abs(X[:, 1]) * 5, y.astype(bool)))
+    orchestrator.flight_risk_detector.fit((X, y))
+    first = orchestrator.predict_all(X)
+    assert orchestrator.predict_all(X) is first
+    assert orchestrator.cache_stats["hits"] == 1
+
+    orchestrator.fit_all((X, 1 - y))  # survival model rejects (X, y) and keeps its fit
+    assert orchestrator.cache_stats["entries"] == 0
+    refreshed = orchestrator.predict_all(X)
+    assert not np.allclose(refreshed["retention"].prediction["retention_score"],
+                           first["retention"].prediction["retention_score"])
+
+    orchestrator.retention_model.fit((X, y))  # a direct fit is invisible until the cache is invalidated
+    assert orchestrator.predict_all(X) is refreshed
+    orchestrator.invalidate_cache()
+    assert orchestrator.predict_all(X) is not refreshed
+
+def test_row_memo_only_scores_changed_candidates():
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(1000, 3))
+    y = (X[:, 0] > 0).astype(float)
+    ids = np.array([f"C{i}" for i in range(len(X))], dtype=object)
+    orchestrator = ModelOrchestrator()
+    orchestrator.retention_model.fit((X, y))
+    orchestrator.time_to_hire_model.fit((X, np.abs(X[:, 1]) * 5, y.astype(bool)))
+    orchestrator.flight_risk_detector.fit((X, y))
+    orchestrator.predict_all(X, candidate_ids=ids)
+
+    scored = []
+    predict = orchestrator.retention_model.predict
+    orchestrator.retention_model.predict = lambda rows: scored.append(len(rows)) or predict(rows)
+    changed = X.copy()
+    changed[::100] += 1.0
+    order = rng.permutation(len(X))
+    result = orchestrator.predict_all(changed[order], candidate_ids=ids[order])
+    assert scored == [10]
+    expected = predict(changed[order]).prediction["retention_score"]
+    np.testing.assert_allclose(result["retention"].prediction["retention_score"], expected)
+    assert set(result["time_to_hire"].prediction) == {"median_days_to_hire", "hire_probability_30d"}
+
+def test_refit_during_prediction_does_not_memoize_old_scores(monkeypatch):
+    from kaizen_talent_analytics.predictive_models import RetentionModel
+    from kaizen_talent_analytics.services.model_orchestrator import MODEL_CLASSES
+    entered, release = threading.Event(), threading.Event()
+
+    class GatedRetentionModel(RetentionModel):
+        def predict(self, data):
+            entered.set()
+            release.wait()
+            return super().predict(data)
+
+    monkeypatch.setitem(MODEL_CLASSES, "retention", GatedRetentionModel)
+    rng = np.random.default_rng(2)
+    X = rng.normal(size=(500, 3))
+    y = (X[:, 0] > 0).astype(float)
+    ids = np.array([f"C{i}" for i in range(len(X))], dtype=object)
+    orchestrator = ModelOrchestrator()
+    orchestrator.retention_model.fit((X, y))
+    orchestrator.time_to_hire_model.fit((X, np.abs(X[:, 1]) * 5, y.astype(bool)))
+    orchestrator.flight_risk_detector.fit((X, y))
+    orchestrator.invalidate_cache()
+
+    in_flight = threading.Thread(target=orchestrator.predict_all, args=(X,), kwargs={"candidate_ids": ids})
+    in_flight.start()
+    assert entered.wait(10)
+    assert orchestrator.refit("retention", (X, 1 - y)).ok  # lands while the old model is still scoring
+    release.set()
+    in_flight.join(10)
+
+    served = orchestrator.predict_all(X, candidate_ids=ids)["retention"].prediction["retention_score"]
+    expected = orchestrator.retention_model.predict(X).prediction["retention_score"]
+    np.testing.assert_allclose(served, expected)
@@ -0,0 +1,131 @@
+import numpy as np
+import pandas as pd
+import pytest
+from kaizen_talent_analytics.data.schema import PredictionOutput
+from kaizen_talent_analytics.predictive_models import FlightRiskDetector, RetentionModel, TimeToHireModel
+
+def _retention_data(n=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n, 3)) * [1.0, 5.0, 0.1] + [0.0, 10.0, 0.0]
+    logits = 2.0 * X[:, 0] - 0.5 * (X[:, 1] - 10.0)
+    y = (rng.random(n) < 1 / (1 + np.exp(-logits))).astype(float)
+    return X, y
+
+def test_retention_model_scores_batch():
+    X, y = _retention_data()
+    model = RetentionModel()
+    model.fit((X, y))
+    output = model.predict(X)
+    assert isinstance(output, PredictionOutput)
+    scores = output.prediction["retention_score"]
+    assert scores.shape == (len(X),)
+    assert ((scores > 0.5) == y).mean() > 0.8
+    assert model.coef_[0] > 0 > model.coef_[1]
+
+def test_retention_model_accepts_frames():
+    X, y = _retention_data(200)
+    frame = pd.DataFrame(X, columns=["a", "b", "c"]).assign(retained=y)
+    model = RetentionModel()
+    model.fit(frame)
+    np.testing.assert_allclose(model.predict(frame.drop(columns="retained")).prediction["retention_score"],
+                               model.predict_proba(X))
+
+def test_retention_model_requires_fit():
+    with pytest.raises(RuntimeError):
+        RetentionModel().predict(np.zeros((1, 3)))
+
+def test_newton_models_reject_zero_iterations():
+    for model_class in (RetentionModel, TimeToHireModel):
+        with pytest.raises(ValueError):
+            model_class(max_iter=0)
+
+def _survival_data(n=4000, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n, 2))
+    rate = np.exp(np.log(1 / 20) + 0.7 * X[:, 0])
+    hire_time = rng.exponential(1 / rate)
+    censor_time = rng.uniform(0, 60, size=n)
+    observed = hire_time <= censor_time
+    cohorts = np.where(X[:, 0] > 0, "fast", "slow")
+    return X, np.minimum(hire_time, censor_time), observed, cohorts
+
+def test_time_to_hire_model_handles_censoring():
+    X, durations, observed, cohorts = _survival_data()
+    model = TimeToHireModel()
+    model.fit((X, durations, observed, cohorts))
+    assert model.coef_[1] / model.scale_[0] == pytest.approx(0.7, abs=0.1)
+    assert model.median_days("fast") < model.median_days("slow")
+    assert model.median_days("fast") <= model.median_days() <= model.median_days("slow")
+    prediction = model.predict(X).prediction
+    assert prediction["median_days_to_hire"].shape == (len(X),)
+    assert np.all((prediction["hire_probability_30d"] > 0) & (prediction["hire_probability_30d"] < 1))
+
+def test_time_to_hire_partial_fit_tracks_full_fit():
+    X, durations, observed, cohorts = _survival_data()
+    full = TimeToHireModel()
+    full.fit((X, durations, observed, cohorts))
+    incremental = TimeToHireModel()
+    incremental.fit((X[:2000], durations[:2000], observed[:2000], cohorts[:2000]))
+    incremental.partial_fit((X[2000:], durations[2000:], observed[2000:], cohorts[2000:]))
+    np.testing.assert_allclose(incremental.events_, full.events_)
+    np.testing.assert_allclose(incremental.coef_, full.coef_, atol=0.05)
+
+def test_time_to_hire_partial_fit_retracts_replaced_records():
+    X, durations, observed, cohorts = _survival_data(200)
+    model = TimeToHireModel()
+    model.fit((X, durations, observed, cohorts))
+    before = model.survival_curve()
+    updated = (X[:1], durations[:1] + 5, np.array([True]), cohorts[:1])
+    model.partial_fit(updated, replaces=(X[:1], durations[:1], observed[:1], cohorts[:1]))
+    assert model.removed_.sum() == 200
+    assert not before.equals(model.survival_curve())
+
+def test_flight_risk_detector_learns_online():
+    X, y = _retention_data(6000, seed=3)
+    detector = FlightRiskDetector()
+    assert detector.supports_partial_fit
+    for start in range(0, len(X), 500):
+        detector.partial_fit((X[start:start + 500], y[start:start + 500]))
+    assert detector.n_seen_ == len(X)
+    np.testing.assert_allclose(detector.mean_, X.mean(axis=0))
+    risk = detector.predict(X).prediction["flight_risk"]
+    assert ((risk > 0.5) == y).mean() > 0.8
+
+def test_batch_only_models_reject_partial_fit():
+    with pytest.raises(NotImplementedError):
+        RetentionModel().partial_fit((np.zeros((1, 1)), np.zeros(1)))
+
+def test_explanations_match_naive_perturbation():
+    X, y = _retention_data(300)
+    model = RetentionModel()
+    model.fit((X, y))
+    X = X[:40].copy()
+    X[:, 1] = np.round(X[:, 1])  # repeated background values are deduplicated and weighted
+    frame = pd.DataFrame(X, columns=["tenure", "salary_gap", "noise"])
+    explanation = model.explain(frame, background_size=25, top_k=2, n_jobs=2, max_evaluations=300)
+
+    rng = np.random.default_rng(0)
+    background = X[np.sort(rng.choice(40, size=25, replace=False))]
+    expected = np.empty((40, 3))
+    for j in range(3):
+        for i in range(40):
+            perturbed = np.repeat(X[i:i + 1], len(background), axis=0)
+            perturbed[:, j] = background[:, j]
+            expected[i, j] = model.predict_proba(X[i:i + 1])[0] - model.predict_proba(perturbed).mean()
+    np.testing.assert_allclose(explanation.attributions, expected)
+    assert explanation.top_features.shape == (40, 2)
+    assert np.all(np.abs(explanation.top_attributions[:, 0]) >= np.abs(explanation.top_attributions[:, 1]))
+    assert (explanation.top_features[:, 0] == 2).mean() < 0.1  # the noise feature rarely matters most
+    top = explanation.top_k_frame(candidate_ids=np.arange(100, 140))
+    assert len(top) == 80 and set(top["feature"]) <= {"tenure", "salary_gap", "noise"}
+
+def test_all_models_explain_their_primary_output():
+    X, y = _retention_data(300)
+    durations = np.random.default_rng(1).exponential(30, size=len(X))
+    survival = TimeToHireModel()
+    survival.fit((X, durations, y.astype(bool)))
+    risk = FlightRiskDetector()
+    risk.fit((X, y))
+    assert survival.explain(X[:10], background_size=5).output == "hire_probability_30d"
+    explanation = risk.explain(X[:10], background_size=5, top_k=5)
+    assert explanation.output == "flight_risk" and explanation.top_features.shape == (10, 3)
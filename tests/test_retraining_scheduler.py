@@ -0,0 +1,100 @@
+import time
+from datetime import datetime, timedelta, timezone
+import numpy as np
+from kaizen_talent_analytics.data.categorical import new_vocabularies
+from kaizen_talent_analytics.data.event_index import CATEGORICAL_COLUMNS
+from kaizen_talent_analytics.data.schema import ATS_STAGES, ATSEvent
+from kaizen_talent_analytics.services.feature_store import FeatureStore
+from kaizen_talent_analytics.services.model_orchestrator import ModelOrchestrator
+from kaizen_talent_analytics.services.retraining_scheduler import RetrainingScheduler, RetrainPolicy
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+def _events(candidates, n, seed):
+    rng = np.random.default_rng(seed)
+    return [ATSEvent(candidate_id=f"C{rng.choice(candidates)}", source=str(rng.choice(["LinkedIn", "Referral"])),
+                     stage=str(rng.choice(ATS_STAGES)), outcome="Passed",
+                     timestamp=START + timedelta(hours=int(h))) for h in np.sort(rng.integers(0, 2_000, n))]
+
+def _setup(**options):
+    store = FeatureStore(vocabularies=new_vocabularies(CATEGORICAL_COLUMNS))
+    store.update(_events(range(300), 1_500, seed=0))
+    orchestrator = ModelOrchestrator()
+    orchestrator.fit_all(store.snapshot())
+    policies = {name: RetrainPolicy(partial_fit_events=50, refit_events=10_000, min_interval_seconds=0)
+                for name in ("retention", "time_to_hire", "flight_risk")}
+    scheduler = RetrainingScheduler(orchestrator, store.snapshot, policies=policies, **options)
+    return store, orchestrator, scheduler
+
+def _ingest(store, scheduler, events):
+    store.update(events)
+    scheduler.record(events)
+
+def test_new_events_trigger_partial_or_full_retraining_within_concurrency_limit():
+    store, orchestrator, scheduler = _setup(drift_threshold=None, max_concurrent=1)
+    assert scheduler.plan() == []
+    _ingest(store, scheduler, _events(range(20), 30, seed=1))
+    assert scheduler.plan() == []  # below the partial-fit threshold
+    _ingest(store, scheduler, _events(range(300, 340), 60, seed=2))
+    planned = {job.model: job.mode for job in scheduler.plan()}
+    assert planned == {"retention": "full", "time_to_hire": "partial", "flight_risk": "partial"}
+
+    before = orchestrator.flight_risk_detector
+    n_seen = before.n_seen_
+    refit, active, peak = orchestrator.refit, [], []
+
+    def tracked_refit(*args, **kwargs):
+        active.append(1)
+        peak.append(len(active))
+        time.sleep(0.05)
+        try:
+            return refit(*args, **kwargs)
+        finally:
+            active.pop()
+
+    orchestrator.refit = tracked_refit
+    done = []
+    for _ in range(500):
+        if len(done) == 3:
+            break
+        done += scheduler.check()
+        time.sleep(0.01)
+    scheduler.check(wait=True)
+    assert len(done) == 3
+    assert max(peak) == 1
+    assert all(job.status.ok and job.new_events == 90 for job in done)
+    assert orchestrator.flight_risk_detector is not before and before.n_seen_ == n_seen
+    assert orchestrator.flight_risk_detector.n_seen_ > n_seen
+    assert all(scheduler.new_events(name) == 0 for name in planned)
+    assert scheduler.plan() == [] and scheduler._touched == {}
+
+def test_drift_triggers_full_refits_and_resets_the_reference():
+    store, orchestrator, scheduler = _setup(drift_threshold=0.2, max_concurrent=1)
+    snapshot = store.snapshot()
+    orchestrator.predict_all(snapshot.features * 5)
+    assert scheduler.drift_score() > 0.2
+    assert scheduler.plan() == []  # no new data, nothing to learn from
+    _ingest(store, scheduler, _events(range(10), 5, seed=3))
+    jobs = []
+    for _ in range(10):
+        started = scheduler.check(wait=True)
+        if not started:
+            break
+        jobs += started
+        if len(jobs) < 3:
+            assert scheduler.drift_score() > 0.2  # the reference only moves after the last drift refit
+    planned = {job.model: job.mode for job in jobs}
+    assert planned == {"retention": "full", "time_to_hire": "full", "flight_risk": "full"}
+    assert all(job.status.ok for job in jobs) and sorted(j.model for j in scheduler.history) == sorted(planned)
+    assert all("drift" in job.reason for job in jobs) and len(jobs) == 3
+    assert orchestrator.drift_report() == {} and scheduler.plan() == []
+
+def test_background_worker_retrains_and_stops():
+    store, orchestrator, scheduler = _setup(drift_threshold=None, interval=0.01)
+    with scheduler:
+        _ingest(store, scheduler, _events(range(50), 80, seed=4))
+        for _ in range(500):
+            if len(scheduler.history) == 3:
+                break
+            scheduler._stop.wait(0.01)
+    assert len(scheduler.history) == 3 and scheduler._worker is None
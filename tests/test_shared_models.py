@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from kaizen_talent_analytics.services.feature_store import FeatureSet
+from kaizen_talent_analytics.services.model_orchestrator import ModelOrchestrator
+from kaizen_talent_analytics.services.shared_models import SharedModelStore
+
+def _features(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n, 3))
+    hired = rng.random(n) < 0.4
+    labels = {"retained": X[:, 0] > 0, "dropped_out": X[:, 1] > 1, "hired": hired,
+              "time_to_hire_days": rng.exponential(30, n)}
+    return FeatureSet(candidate_ids=np.array([f"C{i}" for i in range(n)], dtype=object), features=X, labels=labels,
+                      cohorts=np.where(hired, "LinkedIn", "Referral").astype(object),
+                      last_event_us=np.arange(n, dtype=np.int64), as_of=n, feature_names=("a", "b", "c"))
+
+def test_workers_attach_read_only_and_hot_swap_on_new_generation(tmp_path):
+    data = _features()
+    publisher = ModelOrchestrator(shared=SharedModelStore(str(tmp_path)))
+    publisher.fit_all(data)
+    assert publisher.publish(data) == 1
+
+    worker = ModelOrchestrator(shared=SharedModelStore(str(tmp_path)))  # another process's view
+    first = worker.predict_all(worker.shared_features)
+    features = worker.shared_features
+    assert isinstance(features.features, np.memmap) and not features.features.flags.writeable
+    assert list(features.candidate_ids) == list(data.candidate_ids) and list(features.cohorts) == list(data.cohorts)
+    assert isinstance(features.cohorts, np.memmap) and features.cohorts.dtype.kind == "U"  # no per-worker objects
+    assert features.feature_names == data.feature_names and features.as_of == data.as_of
+    expected = publisher.predict_all(data)
+    for name, output in expected.items():
+        for key, values in output.prediction.items():
+            assert np.allclose(first[name].prediction[key], values)
+    assert not worker.retention_model.coef_.flags.writeable
+
+    publisher.fit_all(_features(seed=1))
+    assert publisher.publish() == 2
+    second = worker.predict_all(features)
+    assert worker.shared_features is None  # generation 2 was published without features
+    assert not np.allclose(second["retention"].prediction["retention_score"],
+                           first["retention"].prediction["retention_score"])
+
+    publisher.publish()
+    assert sorted(p.name for p in tmp_path.iterdir() if p.name.startswith("gen-")) == ["gen-00000002", "gen-00000003"]
+
+def test_publish_requires_shared_store():
+    with pytest.raises(ValueError):
+        ModelOrchestrator().publish()
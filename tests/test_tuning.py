@@ -0,0 +1,42 @@
+import numpy as np
+from kaizen_talent_analytics.predictive_models import FlightRiskDetector, RetentionModel
+from kaizen_talent_analytics.services.model_orchestrator import ModelOrchestrator
+from kaizen_talent_analytics.services.model_registry import ModelRegistry
+from kaizen_talent_analytics.services.tuning import _rung_count, expand_grid, roc_auc, successive_halving
+
+def _data(n=3000, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n, 4))
+    y = (rng.random(n) < 1 / (1 + np.exp(-(1.5 * X[:, 0] - X[:, 1])))).astype(float)
+    return X, y
+
+def test_roc_auc_matches_pairwise_definition():
+    y = np.array([0, 0, 1, 1, 0, 1], dtype=float)
+    scores = np.array([0.1, 0.4, 0.35, 0.8, 0.4, 0.4])
+    pairs = [(p > n) + 0.5 * (p == n) for p in scores[y == 1] for n in scores[y == 0]]
+    assert np.isclose(roc_auc(y, scores), np.mean(pairs))
+
+def test_rung_count_is_exact_for_powers_of_eta():
+    assert [_rung_count(n, 3) for n in (1, 2, 3, 8, 9, 26, 27, 28)] == [1, 1, 2, 2, 3, 3, 4, 4]
+    assert (_rung_count(64, 4), _rung_count(1000, 10), _rung_count(5, 1)) == (4, 4, 1)
+
+def test_successive_halving_drops_weak_configs_in_a_process_pool():
+    grid = {"l2": [1e-3, 1.0, 1e5, 1e7], "max_iter": [25]}
+    result = successive_halving(RetentionModel, _data(), grid, n_folds=3, eta=2, min_rows=500, processes=2)
+    assert result.best_params["l2"] in (1e-3, 1.0)
+    assert [t.rows for t in result.trials] == [750] * 4 + [1500] * 2 + [3000]
+    assert all(len(t.scores) == 3 and not np.isnan(t.scores).any() for t in result.trials)
+    assert len(expand_grid(grid)) == 4
+
+def test_tune_persists_best_config_next_to_model(tmp_path):
+    registry = ModelRegistry(str(tmp_path))
+    orchestrator = ModelOrchestrator(registry=registry)
+    grid = [{"learning_rate": 0.5, "epochs": 3}, {"learning_rate": 1e-6, "epochs": 1}]
+    X, y = _data(1500)
+    result = orchestrator.tune("flight_risk", (X, y), grid, processes=1, min_rows=300)
+    assert result.best_params == grid[0]
+    assert isinstance(orchestrator.flight_risk_detector, FlightRiskDetector)
+    assert orchestrator.flight_risk_detector.learning_rate == 0.5
+    assert registry.tuning("flight_risk")["best_params"] == grid[0]
+    version = registry.describe("flight_risk", registry.current_version("flight_risk"))
+    assert version.metrics["roc_auc"] == result.best_score